@@ -4,7 +4,7 @@ Murder Mystery Detective Game - Main Entry Point
 """
 import sys
 import argparse
-from dotenv import load_dotenv
+from src.agents.env import load_environment
 from src.game import MurderMysteryGame
 
 
@@ -23,7 +23,7 @@ def main():
     chaos_mode = args.chaos.lower() == "true"
 
     # Load environment variables
-    load_dotenv()
+    load_environment()
 
     # Create and run the game
     game = MurderMysteryGame(test_mode=test_mode, visualize_mode=visualize_mode, chaos_mode=chaos_mode)
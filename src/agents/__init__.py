@@ -1,7 +1,7 @@
 """Agent modules for murder mystery game"""
 from .mystery_master import MurderMysteryMaster
-from .suspect_agent import SuspectAgent
+from .suspect_agent import SuspectAgent, generate_openings
 from .agent_orchestrator import AgentOrchestrator
 from .agent_communication import AgentCommunicationManager
 
-__all__ = ['MurderMysteryMaster', 'SuspectAgent', 'AgentOrchestrator', 'AgentCommunicationManager']
\ No newline at end of file
+__all__ = ['MurderMysteryMaster', 'SuspectAgent', 'generate_openings', 'AgentOrchestrator', 'AgentCommunicationManager']
\ No newline at end of file
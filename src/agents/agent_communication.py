@@ -3,14 +3,9 @@ Agent-to-agent communication system for chaos mode.
 Handles inter-agent conversations and information sharing based on relationships.
 """
 
-import os
 import threading
-from dotenv import load_dotenv
-from openai import OpenAI
-from .hyperspell_context import update_agent_gossip, get_gossip_summary
-
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from .openai_client import get_openai_client
+from .hyperspell_context import store_agent_gossip_bulk, get_gossip_summary
 
 
 class AgentCommunicationManager:
@@ -83,6 +78,7 @@ class AgentCommunicationManager:
         """
         Conduct all agent communications in background.
         """
+        updated_agents = []
         for other_agent_name in self.agents.keys():
             if other_agent_name == last_interrogated_suspect:
                 continue
@@ -91,18 +87,23 @@ class AgentCommunicationManager:
             should_share, truthfulness = self._should_share_and_how(last_interrogated_suspect, other_agent_name, rel_type)
 
             if should_share and rel_type:
-                self._conduct_agent_conversation(
+                if self._conduct_agent_conversation(
                     last_interrogated_suspect,
                     other_agent_name,
                     detective_question,
                     suspect_response,
                     rel_type,
                     truthfulness
-                )
+                ):
+                    updated_agents.append(other_agent_name)
+
+        # Upload everyone's updated gossip in a single batch
+        self._sync_gossip(updated_agents)
 
     def _conduct_agent_conversation(self, agent1_name, agent2_name, detective_question, agent1_response, rel_type, truthfulness):
         """
         Conduct a conversation between two agents where one shares interrogation details.
+        Returns True if agent2 learned new gossip.
         """
         agent1 = self.agents[agent1_name]
         agent2 = self.agents[agent2_name]
@@ -120,7 +121,7 @@ Truthfulness level: {truthfulness:.2f}
 Tell them about the interrogation naturally (1-2 sentences). Adjust honesty to match your truthfulness level."""
 
         try:
-            response = client.chat.completions.create(
+            response = get_openai_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": share_prompt}],
                 temperature=0.8,
@@ -137,7 +138,7 @@ Your personality: Trust {agent2.personality_levels.get('Trust', 3)}/5, Anxious {
 
 React to what they said naturally (1-2 sentences)."""
 
-            response = client.chat.completions.create(
+            response = get_openai_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": react_prompt}],
                 temperature=0.8,
@@ -163,18 +164,20 @@ React to what they said naturally (1-2 sentences)."""
             if self.visualizer:
                 self.visualizer.send_agent_communication(agent1_name, agent2_name, duration=120)
 
-            self._update_agent_from_conversation(agent2_name, agent1_share, agent1_name, rel_type)
+            return self._update_agent_from_conversation(agent2_name, agent1_share, agent1_name, rel_type)
 
         except Exception as e:
             print(f"Error in communication between {agent1_name} and {agent2_name}: {e}")
+            return False
 
     def _update_agent_from_conversation(self, agent_name, shared_info, from_agent, rel_type):
         """
         Update agent's personality and knowledge based on conversation with another agent.
+        Returns True if the agent's gossip was updated.
         """
         agent = self.agents.get(agent_name)
         if not agent:
-            return
+            return False
 
         # Store the gossip/shared information
         if not hasattr(agent, 'gossip_heard'):
@@ -189,38 +192,54 @@ React to what they said naturally (1-2 sentences)."""
         print(f"📝 [DEBUG] {agent_name} now knows gossip from {from_agent}: \"{shared_info}\"")
 
         if rel_type == "Close Friend":
-            agent.personality_levels['Trust'] = min(5, agent.personality_levels['Trust'] + 0.5)
+            agent.apply_personality_changes({'Trust': 0.5})
 
         elif rel_type == "Romantic Partner":
-            agent.personality_levels['Trust'] = min(5, agent.personality_levels['Trust'] + 0.7)
+            agent.apply_personality_changes({'Trust': 0.7})
 
         elif rel_type == "Enemy":
-            agent.personality_levels['Anxious'] = min(5, agent.personality_levels['Anxious'] + 0.5)
-            agent.personality_levels['Trust'] = max(0, agent.personality_levels['Trust'] - 0.5)
+            agent.apply_personality_changes({'Anxious': 0.5, 'Trust': -0.5})
 
         elif rel_type == "Rival":
-            agent.personality_levels['Moody'] = min(5, agent.personality_levels['Moody'] + 0.3)
-            agent.personality_levels['Trust'] = max(0, agent.personality_levels['Trust'] - 0.3)
-
-        # Store gossip in Hyperspell for persistent context management
-        if agent.gossip_heard:
-            memory_id = update_agent_gossip(agent_name, agent.gossip_heard)
-
-            # Retrieve the gossip summary from Hyperspell and send to orchestrator
-            if memory_id and self.orchestrator:
-                try:
-                    memory_id, summary = get_gossip_summary(agent_name)
-                    if summary:
-                        # Send gossip summary to orchestrator for narrative tracking
-                        self.orchestrator.record_agent_gossip(agent_name, summary)
-                        print(f"📡 Sent gossip summary for {agent_name} to orchestrator")
-                except Exception as e:
-                    print(f"⚠️ Error sending gossip summary to orchestrator: {e}")
+            agent.apply_personality_changes({'Moody': 0.3, 'Trust': -0.3})
 
         # Visualize the personality update
         if self.visualizer:
             self.visualizer.send_personality_update(agent_name, agent.personality_levels)
 
+        return True
+
+    def _sync_gossip(self, agent_names):
+        """
+        Store the updated gossip of several agents in Hyperspell in one batch,
+        then send their gossip summaries to the orchestrator.
+        """
+        gossip_by_agent = {
+            name: self.agents[name].gossip_heard
+            for name in agent_names
+            if getattr(self.agents.get(name), "gossip_heard", None)
+        }
+        if not gossip_by_agent:
+            return
+
+        # Store gossip in Hyperspell for persistent context management
+        memory_ids = store_agent_gossip_bulk(gossip_by_agent)
+
+        # Retrieve the gossip summaries from Hyperspell and send to orchestrator
+        if not self.orchestrator:
+            return
+        for agent_name, memory_id in memory_ids.items():
+            if not memory_id:
+                continue
+            try:
+                memory_id, summary = get_gossip_summary(agent_name)
+                if summary:
+                    # Send gossip summary to orchestrator for narrative tracking
+                    self.orchestrator.record_agent_gossip(agent_name, summary)
+                    print(f"📡 Sent gossip summary for {agent_name} to orchestrator")
+            except Exception as e:
+                print(f"⚠️ Error sending gossip summary to orchestrator: {e}")
+
     def get_communication_log(self):
         """Get the full log of inter-agent communications"""
         return self.communication_log
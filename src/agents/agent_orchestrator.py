@@ -1,10 +1,34 @@
-import os
+import re
 import json
-from dotenv import load_dotenv
-from openai import OpenAI
+from dataclasses import dataclass
+from .openai_client import get_openai_client
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Maximum characters of suspect context sent when generating hintable facts, to keep
+# prompt tokens bounded. Longer context is cut at the end (the last clues are dropped)
+# and a warning is printed.
+MAX_HINT_CONTEXT_CHARS = 8000
+
+# Tokenizer used to index statements for contradiction checks
+_WORD_RE = re.compile(r"[\w']+")
+
+
+@dataclass(slots=True)
+class InteractionRecord:
+    """A single question/response exchange with a suspect"""
+    question: str
+    response: str
+    personality_state: dict
+
+
+@dataclass(slots=True)
+class Statement:
+    """A statement made by a suspect, indexed for contradiction checks"""
+    statement: str
+    question_context: str
+    timestamp: int
+    has_denial: bool
+    question_tokens: frozenset
+    statement_tokens: frozenset
 
 
 class AgentOrchestrator:
@@ -17,6 +41,41 @@ class AgentOrchestrator:
     4. Relationships and motives are consistent
     """
 
+    __slots__ = (
+        "case_state",
+        "suspects",
+        "relationships",
+        "clues",
+        "murderer",
+        "victim",
+        "motive",
+        "narrative_context",
+        "suspect_statements",
+        "revealed_clues",
+        "interrogation_history",
+        "agent_gossip_summaries",
+        "_briefing_cache",
+        "_ps_intern",
+    )
+
+    # Behavior patterns every murderer exhibits
+    _MURDERER_BEHAVIORS = (
+        "Will be defensive about their whereabouts",
+        "May try to shift blame to others they don't like",
+        "Will have inconsistencies if pressed hard",
+        "May show nervousness when confronted with specific evidence",
+        "Will protect their secret fiercely",
+        "May contradict themselves under pressure",
+    )
+
+    # Relationship groupings used across the analysis helpers
+    _NEGATIVE_RELS = frozenset({"Rival", "Enemy"})
+    _POSITIVE_RELS = frozenset({"Close Friend", "Romantic Partner"})
+
+    # Keywords (matched as substrings) used to rate clue relevance
+    _MOTIVE_WORDS = ("motive", "reason", "why", "because")
+    _WHEREABOUTS_WORDS = ("saw", "together", "alone", "time")
+
     def __init__(self, case_state, suspects, relationships, clues):
         self.case_state = case_state
         self.suspects = suspects
@@ -36,7 +95,17 @@ class AgentOrchestrator:
         self.revealed_clues = set()  # set of clue texts that have been mentioned
 
         # Track interrogation history per suspect (for calculating disclosure trust)
-        self.interrogation_history = {}  # suspect_name -> list of (question, response, tone)
+        self.interrogation_history = {}  # suspect_name -> list of InteractionRecord
+
+        # Gossip summaries retrieved from Hyperspell (agent_name -> list of summaries)
+        self.agent_gossip_summaries = {}
+
+        # Interned personality snapshots (sorted items tuple -> shared dict)
+        self._ps_intern = {}
+
+        # Cache of computed briefings (suspect_name -> briefing dict)
+        # Briefings only depend on the static case state, so they are built once per suspect
+        self._briefing_cache = {}
 
     def _build_narrative_context(self):
         """Build rich narrative context about who knows what and why"""
@@ -115,14 +184,7 @@ class AgentOrchestrator:
 
     def _get_murderer_behaviors(self):
         """Generate behavior patterns the murderer should exhibit"""
-        return [
-            "Will be defensive about their whereabouts",
-            "May try to shift blame to others they don't like",
-            "Will have inconsistencies if pressed hard",
-            "May show nervousness when confronted with specific evidence",
-            "Will protect their secret fiercely",
-            "May contradict themselves under pressure",
-        ]
+        return self._MURDERER_BEHAVIORS
 
     def _get_evidence_murderer_knows(self):
         """Determine what evidence the murderer definitely knows about"""
@@ -145,10 +207,9 @@ class AgentOrchestrator:
 
     def _assess_tension(self, pair, rel_type):
         """Assess the tension level in a relationship"""
-        negative_rels = ["Rival", "Enemy"]
-        if rel_type in negative_rels:
+        if rel_type in self._NEGATIVE_RELS:
             return "high"
-        elif rel_type in ["Close Friend", "Romantic Partner"]:
+        elif rel_type in self._POSITIVE_RELS:
             return "low"
         else:
             return "medium"
@@ -181,14 +242,15 @@ class AgentOrchestrator:
 
     def _assess_clue_relevance(self, clue_text):
         """Assess how relevant a clue is to solving the crime"""
+        clue_lower = clue_text.lower()
         # Clues about the murderer/victim relationship are highly relevant
-        if self.murderer.lower() in clue_text.lower() or self.victim.lower() in clue_text.lower():
+        if self.murderer.lower() in clue_lower or self.victim.lower() in clue_lower:
             return "high"
         # Clues about motive are highly relevant
-        if any(word in clue_text.lower() for word in ["motive", "reason", "why", "because"]):
+        if any(word in clue_lower for word in self._MOTIVE_WORDS):
             return "high"
         # Clues about whereabouts/alibis are relevant
-        if any(word in clue_text.lower() for word in ["saw", "together", "alone", "time"]):
+        if any(word in clue_lower for word in self._WHEREABOUTS_WORDS):
             return "medium"
         # Other clues are lower relevance
         return "low"
@@ -201,9 +263,9 @@ class AgentOrchestrator:
         # Check if they have conflict with victim
         for pair, rel_type in self.relationships.items():
             if suspect_name in pair and self.victim in pair:
-                if rel_type in ["Rival", "Enemy"]:
+                if rel_type in self._NEGATIVE_RELS:
                     false_motive = "High"
-                elif rel_type in ["Acquaintance"]:
+                elif rel_type == "Acquaintance":
                     false_motive = "Medium"
 
         return false_motive
@@ -215,7 +277,7 @@ class AgentOrchestrator:
         # Check for conflicts with victim
         for pair, rel_type in self.relationships.items():
             if suspect_name in pair and self.victim in pair:
-                if rel_type in ["Rival", "Enemy"]:
+                if rel_type in self._NEGATIVE_RELS:
                     accusations.append(f"Had conflict with {self.victim}")
 
         # Check if they might know damaging information
@@ -230,6 +292,14 @@ class AgentOrchestrator:
         Get a briefing for a specific suspect about what they should know
         and how they should behave in interviews
         """
+        briefing = self._briefing_cache.get(suspect_name)
+        if briefing is None:
+            briefing = self._compute_briefing(suspect_name)
+            self._briefing_cache[suspect_name] = briefing
+        return briefing
+
+    def _compute_briefing(self, suspect_name):
+        """Build the briefing for a suspect, including pre-serialized JSON sections"""
         briefing = {
             "suspect_name": suspect_name,
             "role": self._determine_role(suspect_name),
@@ -240,6 +310,18 @@ class AgentOrchestrator:
             "defensive_topics": self._identify_defensive_topics(suspect_name),
             "hintable_facts": self._generate_hintable_facts(suspect_name),
         }
+
+        # Serialize the prompt sections once so generate_orchestration_prompt can reuse them
+        briefing["_json"] = {
+            key: json.dumps(briefing[key], indent=2)
+            for key in (
+                "relationships_context",
+                "what_they_know",
+                "what_they_should_hide",
+                "defensive_topics",
+                "likely_questions",
+            )
+        }
         return briefing
 
     def _determine_role(self, suspect_name):
@@ -265,7 +347,7 @@ class AgentOrchestrator:
 
         # They might know about related clues through relationships
         for pair, rel_type in self.relationships.items():
-            if suspect_name in pair and rel_type in ["Close Friend", "Romantic Partner"]:
+            if suspect_name in pair and rel_type in self._POSITIVE_RELS:
                 other = pair.split("_")[0] if pair.split("_")[1] == suspect_name else pair.split("_")[1]
                 for clue in self.clues:
                     if clue.get("known_by") == other:
@@ -362,6 +444,14 @@ RELATIONSHIPS WITH OTHER SUSPECTS:
             if clue.get("known_by") == suspect_name:
                 context += f"  - {clue.get('clue', '')}\n"
 
+        # Hard cap on the context block to keep prompt tokens bounded
+        if len(context) > MAX_HINT_CONTEXT_CHARS:
+            print(
+                f"⚠️ Hint context for {suspect_name} is {len(context)} characters; "
+                f"truncating to {MAX_HINT_CONTEXT_CHARS}, later clues are left out"
+            )
+            context = context[:MAX_HINT_CONTEXT_CHARS]
+
         prompt = f"""You are a detective briefing assistant. Generate 2-3 specific, hintable facts that {suspect_name} might reveal during interrogation if the detective asks the right questions or treats them well.
 
 {context}
@@ -376,23 +466,24 @@ For a {role}:
 - If MURDERER: Include details they might slip up about (location, time, interactions with victim)
 - If INNOCENT: Include gossip about others, suspicious observations, relationship conflicts
 
-Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
-["saw Lisa leave study at 11:45pm", "heard arguing between James and victim", "found key to study room"]
+Return a JSON object with a "facts" key holding 2-3 facts (strings). Example format:
+{{"facts": ["saw Lisa leave study at 11:45pm", "heard arguing between James and victim", "found key to study room"]}}
 """
 
         try:
-            response = client.chat.completions.create(
+            # JSON mode guarantees a parseable object, so no prose has to be stripped or retried
+            response = get_openai_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
+                    {"role": "system", "content": 'Return ONLY a JSON object {"facts": [...]}'},
                     {"role": "user", "content": prompt}
                 ],
+                response_format={"type": "json_object"},
                 temperature=0.8,
                 max_tokens=300
             )
 
-            import json
-            facts_json = response.choices[0].message.content.strip()
-            hintable_facts = json.loads(facts_json)
+            hintable_facts = json.loads(response.choices[0].message.content).get("facts", [])
             return hintable_facts if isinstance(hintable_facts, list) else []
         except Exception as e:
             # Fallback: return empty list if generation fails
@@ -406,11 +497,17 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
         if suspect_name not in self.interrogation_history:
             self.interrogation_history[suspect_name] = []
 
-        interaction_record = {
-            "question": question,
-            "response": response,
-            "personality_state": personality_state.copy() if personality_state else {},
-        }
+        # Identical personality states share one snapshot instead of copying every turn
+        ps_key = tuple(sorted(personality_state.items())) if personality_state else ()
+        snapshot = self._ps_intern.get(ps_key)
+        if snapshot is None:
+            snapshot = self._ps_intern.setdefault(ps_key, dict(ps_key))
+
+        interaction_record = InteractionRecord(
+            question=question,
+            response=response,
+            personality_state=snapshot,
+        )
 
         self.interrogation_history[suspect_name].append(interaction_record)
 
@@ -418,12 +515,16 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
         if suspect_name not in self.suspect_statements:
             self.suspect_statements[suspect_name] = []
 
-        # Store the full response as a statement
-        self.suspect_statements[suspect_name].append({
-            "statement": response,
-            "question_context": question,
-            "timestamp": len(self.interrogation_history[suspect_name])
-        })
+        # Store the full response as a statement, with tokens precomputed for contradiction checks
+        response_lower = response.lower()
+        self.suspect_statements[suspect_name].append(Statement(
+            statement=response,
+            question_context=question,
+            timestamp=len(self.interrogation_history[suspect_name]),
+            has_denial="didn't" in response_lower,
+            question_tokens=frozenset(_WORD_RE.findall(question.lower())),
+            statement_tokens=frozenset(_WORD_RE.findall(response_lower)),
+        ))
 
     def record_revealed_clue(self, clue_text):
         """
@@ -441,9 +542,6 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
             agent_name: Name of the agent whose gossip was recorded
             gossip_summary: Summary of the gossip from Hyperspell
         """
-        if not hasattr(self, 'agent_gossip_summaries'):
-            self.agent_gossip_summaries = {}
-
         if agent_name not in self.agent_gossip_summaries:
             self.agent_gossip_summaries[agent_name] = []
 
@@ -461,8 +559,6 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
         Returns:
             List of gossip summaries or empty list if none found
         """
-        if not hasattr(self, 'agent_gossip_summaries'):
-            return []
         return self.agent_gossip_summaries.get(agent_name, [])
 
     def get_contradiction_analysis(self, suspect_name):
@@ -489,16 +585,14 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
             # This is a simplified check - in a real system you'd use LLM to detect semantic contradictions
             prev_statement = statements[i - 1]
 
-            # Check for keyword contradictions (very basic)
-            curr_keywords = set(statement["statement"].lower().split())
-            prev_keywords = set(prev_statement["statement"].lower().split())
-
             # If current statement explicitly contradicts previous context
-            if "didn't" in statement["statement"].lower() and statement["question_context"] in prev_statement["statement"]:
+            # (denial first as a cheap short-circuit, then a token subset check)
+            question_tokens = statement.question_tokens
+            if statement.has_denial and question_tokens and question_tokens <= prev_statement.statement_tokens:
                 contradictions["contradictions"].append({
-                    "previous": prev_statement["statement"],
-                    "current": statement["statement"],
-                    "context": statement["question_context"]
+                    "previous": prev_statement.statement,
+                    "current": statement.statement,
+                    "context": statement.question_context
                 })
 
         # Calculate consistency score
@@ -539,6 +633,7 @@ Return ONLY a JSON array of 2-3 facts (strings), no other text. Example format:
         to be consistent with the overall narrative
         """
         briefing = self.get_suspect_briefing(suspect_name)
+        briefing_json = briefing["_json"]
 
         prompt = f"""
 You are participating in a coordinated murder mystery investigation. Here is your contextual briefing:
@@ -554,19 +649,19 @@ THE CRIME:
 - Motive for the murder: {self.motive}
 
 YOUR RELATIONSHIPS:
-{json.dumps(briefing['relationships_context'], indent=2)}
+{briefing_json['relationships_context']}
 
 WHAT YOU KNOW:
-{json.dumps(briefing['what_they_know'], indent=2)}
+{briefing_json['what_they_know']}
 
 WHAT YOU SHOULD TRY TO HIDE:
-{json.dumps(briefing['what_they_should_hide'], indent=2)}
+{briefing_json['what_they_should_hide']}
 
 DEFENSIVE TOPICS (you'll be evasive about these):
-{json.dumps(briefing['defensive_topics'], indent=2)}
+{briefing_json['defensive_topics']}
 
 LIKELY QUESTIONS YOU'LL BE ASKED:
-{json.dumps(briefing['likely_questions'], indent=2)}
+{briefing_json['likely_questions']}
 
 NARRATIVE COHERENCE RULES:
 1. Be consistent with your relationships and history
@@ -0,0 +1,20 @@
+"""
+Environment loading for the agents.
+The .env file is read lazily, the first time an API client is needed,
+so importing the agent modules stays cheap.
+"""
+
+import os
+
+_loaded = False
+
+
+def load_environment():
+    """Load variables from .env once (set TUFF_SKIP_DOTENV=1 to skip)"""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    if os.getenv("TUFF_SKIP_DOTENV") != "1":
+        from dotenv import load_dotenv
+        load_dotenv()
@@ -4,13 +4,76 @@ Uses Hyperspell Python SDK to manage accumulated gossip and maintain context acr
 """
 
 import os
+import json
+import time
+import hashlib
 import uuid
-from dotenv import load_dotenv
-from hyperspell import Hyperspell
+import threading
+from pathlib import Path
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from .env import load_environment
 
-load_dotenv()
+try:
+    import orjson  # Optional faster JSON serializer
+except ImportError:
+    orjson = None
 
-HYPERSPELL_API_KEY = os.getenv("HYPERSPELL_API_KEY")
+# How long (seconds) a resolved search summary stays valid before searching again
+SEARCH_CACHE_TTL = 60.0
+
+# Maximum concurrent uploads when storing gossip for several agents at once
+BULK_STORE_WORKERS = 6
+
+# Directory where gossip state is saved for named collections, so a restarted session can resume
+# (override with TUFF_STATE_DIR)
+DEFAULT_STATE_DIR = ".tuff"
+
+# Process-wide Hyperspell client, shared by every gossip manager
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def _state_dir():
+    """Gossip state directory, read after .env is loaded rather than at import"""
+    load_environment()
+    return Path(os.getenv("TUFF_STATE_DIR", DEFAULT_STATE_DIR))
+
+
+def _get_client():
+    """Return the shared Hyperspell client, creating it on first use"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                # Imported lazily so the SDK import cost is only paid when a client is needed
+                from hyperspell import Hyperspell
+
+                load_environment()
+                _shared_client = Hyperspell(api_key=os.getenv("HYPERSPELL_API_KEY"))
+    return _shared_client
+
+
+@lru_cache(maxsize=128)
+def _format_frozen(agent_name, key):
+    """Format a frozen tuple of (from, relationship, info) gossip entries for storage"""
+    parts = [f"Gossip accumulated by {agent_name}:\n\n"]
+
+    # Group by source
+    gossip_by_source = defaultdict(list)
+    for from_agent, rel_type, info in key:
+        gossip_by_source[from_agent].append((rel_type, info))
+
+    # Format with context
+    for from_agent, gossips in gossip_by_source.items():
+        rel_type = gossips[0][0]
+        parts.append(f"From {from_agent} ({rel_type}):\n")
+        for i, (_, info) in enumerate(gossips, 1):
+            parts.append(f"  {i}. {info}\n")
+        parts.append("\n")
+
+    return "".join(parts)
 
 
 class HyperspellGossipManager:
@@ -23,12 +86,72 @@ class HyperspellGossipManager:
         Args:
             collection_id: Optional collection ID for grouping memories.
                           If not provided, generates a new UUID for this game session.
+                          Only a given ID is persisted to the state directory and resumed on the next run.
         """
-        self.client = Hyperspell(api_key=HYPERSPELL_API_KEY)
+        self.client = _get_client()
         self.collection_id = collection_id or str(uuid.uuid4())
         self.agent_memory_ids = {}  # Cache of memory IDs for agents (agent_name -> memory_id)
+        self._search_cache = {}  # agent_name -> (timestamp, memory_id, summary)
+        self._gossip_fingerprints = {}  # agent_name -> fingerprint of the last stored gossip
+        self._inflight = {}  # query -> Future of a search that is currently running
+        self._lock = threading.Lock()  # Guards per-agent state written from upload threads
+        # A generated ID can never be asked for again, so its state isn't written to disk
+        self._state_path = _state_dir() / f"{collection_id}.json" if collection_id else None
+        self._load_state()
         print(f"🎮 Initialized Hyperspell with collection: {self.collection_id[:8]}...")
 
+        # Open the connection and authenticate in the background so the first real store doesn't pay for it
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Issue a throwaway search to warm the client's connection; failures are ignored"""
+        try:
+            self.client.memories.search(query="__warmup__")
+        except Exception:
+            pass
+
+    def _load_state(self):
+        """Rehydrate memory IDs and fingerprints saved by an earlier run of this collection"""
+        if self._state_path is None or not self._state_path.exists():
+            return
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.agent_memory_ids.update(state.get("agent_memory_ids", {}))
+            self._gossip_fingerprints.update(state.get("gossip_fingerprints", {}))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load saved gossip state: {e}")
+
+    def _save_state(self):
+        """Atomically write memory IDs and fingerprints to disk. Caller must hold self._lock."""
+        if self._state_path is None:
+            return
+        state = {
+            "agent_memory_ids": self.agent_memory_ids,
+            "gossip_fingerprints": self._gossip_fingerprints,
+        }
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._state_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            print(f"⚠️ Could not save gossip state: {e}")
+
+    def close(self):
+        """Clear this manager's caches. The shared client stays open for other sessions."""
+        self.agent_memory_ids.clear()
+        self._search_cache.clear()
+        self._gossip_fingerprints.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
     def store_gossip(self, agent_name, gossip_list):
         """
         Store an agent's accumulated gossip in Hyperspell as a new memory.
@@ -44,6 +167,12 @@ class HyperspellGossipManager:
         if not gossip_list:
             return None
 
+        # Skip the upload if this exact gossip was already stored for the agent
+        fingerprint = self._fingerprint_gossip(gossip_list)
+        memory_id = self.agent_memory_ids.get(agent_name)
+        if memory_id and self._gossip_fingerprints.get(agent_name) == fingerprint:
+            return memory_id
+
         # Format gossip for Hyperspell
         gossip_text = self._format_gossip_for_storage(agent_name, gossip_list)
 
@@ -54,8 +183,13 @@ class HyperspellGossipManager:
                 collection=self.collection_id
             )
             memory_id = memory_status.resource_id
-            # Store the latest memory ID for this agent
-            self.agent_memory_ids[agent_name] = memory_id
+            with self._lock:
+                # Store the latest memory ID for this agent
+                self.agent_memory_ids[agent_name] = memory_id
+                self._gossip_fingerprints[agent_name] = fingerprint
+                # Any cached summary belongs to the previous memory
+                self._search_cache.pop(agent_name, None)
+                self._save_state()
             print(f"✅ Created gossip memory for {agent_name} in Hyperspell (Memory ID: {memory_id})")
             return memory_id
 
@@ -63,6 +197,28 @@ class HyperspellGossipManager:
             print(f"❌ Error storing gossip for {agent_name}: {e}")
             return None
 
+    def store_gossip_bulk(self, items):
+        """
+        Store gossip for several agents concurrently, so a round of updates
+        costs roughly one round-trip instead of one per agent.
+
+        Args:
+            items: Dict of agent_name -> gossip_list
+
+        Returns:
+            Dict of agent_name -> memory resource ID (None if storing failed)
+        """
+        items = {name: gossip_list for name, gossip_list in items.items() if gossip_list}
+        if not items:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(BULK_STORE_WORKERS, len(items))) as executor:
+            futures = {
+                name: executor.submit(self.store_gossip, name, gossip_list)
+                for name, gossip_list in items.items()
+            }
+        return {name: future.result() for name, future in futures.items()}
+
     def retrieve_gossip_context(self, agent_name):
         """
         Retrieve formatted gossip context for an agent from Hyperspell.
@@ -77,17 +233,16 @@ class HyperspellGossipManager:
         if not memory_id:
             return ""
 
-        try:
-            # Query the memory from Hyperspell using search (more reliable than get)
-            query_result = self.client.memories.search(query=agent_name)
+        cached_text = self._get_cached_summary(agent_name, memory_id)
+        if cached_text:
+            return f"\n📢 GOSSIP CONTEXT (from Hyperspell):\n{cached_text}"
 
-            if query_result and hasattr(query_result, 'documents'):
-                # Find the document that matches our resource_id
-                for doc in query_result.documents:
-                    if doc.resource_id == memory_id:
-                        text = doc.summary if hasattr(doc, 'summary') else None
-                        if text:
-                            return f"\n📢 GOSSIP CONTEXT (from Hyperspell):\n{text}"
+        try:
+            doc = self._find_doc(agent_name, memory_id)
+            text = getattr(doc, 'summary', None)
+            if text:
+                self._cache_summary(agent_name, memory_id, text)
+                return f"\n📢 GOSSIP CONTEXT (from Hyperspell):\n{text}"
 
             return ""
 
@@ -109,19 +264,20 @@ class HyperspellGossipManager:
         if not memory_id:
             return None, None
 
+        cached_summary = self._get_cached_summary(agent_name, memory_id)
+        if cached_summary:
+            return memory_id, cached_summary
+
         try:
-            # Search for the memory by querying agent's name
-            query_result = self.client.memories.search(query=agent_name)
-
-            if query_result and hasattr(query_result, 'documents'):
-                # Find the document that matches our resource_id
-                for doc in query_result.documents:
-                    if doc.resource_id == memory_id:
-                        summary = doc.summary if hasattr(doc, 'summary') else None
-                        print(f"📝 Retrieved gossip summary for {agent_name}:")
-                        print(f"   Memory ID: {memory_id}")
-                        print(f"   Summary: {summary}")
-                        return memory_id, summary
+            doc = self._find_doc(agent_name, memory_id)
+            if doc is not None:
+                summary = getattr(doc, 'summary', None)
+                if summary:
+                    self._cache_summary(agent_name, memory_id, summary)
+                print(f"📝 Retrieved gossip summary for {agent_name}:")
+                print(f"   Memory ID: {memory_id}")
+                print(f"   Summary: {summary}")
+                return memory_id, summary
 
             return memory_id, None
 
@@ -129,6 +285,65 @@ class HyperspellGossipManager:
             print(f"⚠️ Error retrieving gossip summary for {agent_name}: {e}")
             return memory_id, None
 
+    def _fingerprint_gossip(self, gossip_list):
+        """Hash the gossip list so unchanged gossip can be detected cheaply"""
+        if orjson:
+            serialized = orjson.dumps(gossip_list, option=orjson.OPT_SORT_KEYS)
+        else:
+            serialized = json.dumps(gossip_list, sort_keys=True).encode()
+        return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+    def _find_doc(self, query, resource_id):
+        """
+        Search Hyperspell and return the document matching resource_id, or None.
+        Uses search rather than get, which has proven less reliable.
+        """
+        query_result = self._search(query)
+        docs = getattr(query_result, 'documents', None)
+        if not docs:
+            return None
+        by_id = {doc.resource_id: doc for doc in docs}
+        return by_id.get(resource_id)
+
+    def _search(self, query):
+        """
+        Run memories.search, letting concurrent callers with the same query
+        share one in-flight request instead of each issuing their own.
+        """
+        with self._lock:
+            future = self._inflight.get(query)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[query] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self.client.memories.search(query=query)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(query, None)
+
+    def _get_cached_summary(self, agent_name, memory_id):
+        """Return the cached summary for the agent's current memory, or None if missing/expired"""
+        entry = self._search_cache.get(agent_name)
+        if entry:
+            timestamp, cached_memory_id, summary = entry
+            if cached_memory_id == memory_id and time.monotonic() - timestamp < SEARCH_CACHE_TTL:
+                return summary
+        return None
+
+    def _cache_summary(self, agent_name, memory_id, summary):
+        """Remember a resolved summary so repeated lookups skip the search round-trip"""
+        self._search_cache[agent_name] = (time.monotonic(), memory_id, summary)
+
     def update_gossip(self, agent_name, gossip_list):
         """
         Update an agent's gossip in Hyperspell.
@@ -138,26 +353,12 @@ class HyperspellGossipManager:
 
     def _format_gossip_for_storage(self, agent_name, gossip_list):
         """Format gossip data for storage in Hyperspell"""
-        formatted = f"Gossip accumulated by {agent_name}:\n\n"
-
-        # Group by source
-        gossip_by_source = {}
-        for gossip in gossip_list:
-            from_agent = gossip.get("from", "Unknown")
-            if from_agent not in gossip_by_source:
-                gossip_by_source[from_agent] = []
-            gossip_by_source[from_agent].append(gossip)
-
-        # Format with context
-        for from_agent, gossips in gossip_by_source.items():
-            rel_type = gossips[0].get("relationship", "Unknown")
-            formatted += f"From {from_agent} ({rel_type}):\n"
-            for i, gossip in enumerate(gossips, 1):
-                info = gossip.get("info", "")
-                formatted += f"  {i}. {info}\n"
-            formatted += "\n"
-
-        return formatted
+        # Normalise to a hashable key so unchanged gossip reuses the cached text
+        key = tuple(
+            (gossip.get("from", "Unknown"), gossip.get("relationship", "Unknown"), gossip.get("info", ""))
+            for gossip in gossip_list
+        )
+        return _format_frozen(agent_name, key)
 
 
 # Global instance - will be initialized when game starts
@@ -179,6 +380,14 @@ def store_agent_gossip(agent_name, gossip_list):
     return hyperspell_manager.store_gossip(agent_name, gossip_list)
 
 
+def store_agent_gossip_bulk(items):
+    """Convenience function to store gossip for several agents in one batch"""
+    if not hyperspell_manager:
+        print("⚠️ Hyperspell not initialized. Call initialize_gossip_manager() first.")
+        return {}
+    return hyperspell_manager.store_gossip_bulk(items)
+
+
 def get_agent_gossip_context(agent_name):
     """Convenience function to retrieve gossip context"""
     if not hyperspell_manager:
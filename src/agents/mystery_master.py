@@ -1,12 +1,12 @@
-import os
 import json
-from dotenv import load_dotenv
-from openai import OpenAI
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from .openai_client import get_openai_client
 
-# Load environment variables
-load_dotenv()
-
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+try:
+    import orjson  # Optional faster JSON parser
+except ImportError:
+    orjson = None
 
 # 6 Fixed characters with consistent traits
 FIXED_SUSPECTS = {
@@ -50,6 +50,18 @@ FIXED_SUSPECTS = {
 
 SUSPECT_NAMES = list(FIXED_SUSPECTS.keys())
 
+# Fixed suspect traits flattened once into (name, age, gender, occupation, traits) rows
+_SUSPECT_BASE_TUPLES = tuple(
+    (
+        name,
+        FIXED_SUSPECTS[name]["age"],
+        FIXED_SUSPECTS[name]["gender"],
+        FIXED_SUSPECTS[name]["occupation"],
+        tuple(FIXED_SUSPECTS[name]["personality_traits"]),
+    )
+    for name in SUSPECT_NAMES
+)
+
 RELATIONSHIP_TYPES = [
     "Close Friend",
     "Romantic Partner",
@@ -98,28 +110,24 @@ TIMES_OF_DEATH = [
 ]
 
 
-class MurderMysteryMaster:
-    def __init__(self):
-        self.suspects = {}
-        self.victim = None
-        self.murderer = None
-        self.relationships = {}
-        self.motives = {}
-        self.case_state = None
+# Suspect info block for the case generation prompt
+_SUSPECTS_INFO_BLOCK = "\n".join([
+    f"- {name}: {age} year old {gender} {occupation}, personality: {', '.join(traits)}"
+    for name, age, gender, occupation, traits in _SUSPECT_BASE_TUPLES
+])
 
-    def generate_case_state(self):
-        """Use OpenAI to generate a cohesive murder mystery case state"""
+# Prompt-ready lists, joined once at import
+_REL_CSV = ", ".join(RELATIONSHIP_TYPES)
+_MOT_CSV = ", ".join(MOTIVES)
+_LOC_CSV = ", ".join(MANSION_LOCATIONS)
+_COD_CSV = ", ".join(CAUSES_OF_DEATH)
+_TOD_CSV = ", ".join(TIMES_OF_DEATH)
 
-        # Create suspect info string for the prompt
-        suspects_info = "\n".join([
-            f"- {name}: {FIXED_SUSPECTS[name]['age']} year old {FIXED_SUSPECTS[name]['gender']} {FIXED_SUSPECTS[name]['occupation']}, personality: {', '.join(FIXED_SUSPECTS[name]['personality_traits'])}"
-            for name in SUSPECT_NAMES
-        ])
-
-        prompt = f"""You are a master storyteller for a murder mystery game set in a MANSION where all 6 suspects live together.
+# Shared scene-setting for every case generation prompt
+_CASE_CONTEXT = f"""You are a master storyteller for a murder mystery game set in a MANSION where all 6 suspects live together.
 
 These are the 6 fixed characters (same traits every game):
-{suspects_info}
+{_SUSPECTS_INFO_BLOCK}
 
 Suspect names: Nick, Sarah, James, Emma, David, Lisa
 
@@ -127,28 +135,28 @@ MANSION CONTEXT:
 - All 6 suspects live in a large mansion together
 - They were all present in the mansion last night when the murder occurred
 - The murder happened between 8 PM and 1 AM
-- No one left the mansion - all doors were locked
+- No one left the mansion - all doors were locked"""
+
+# Case generation is split into independent sub-prompts that run concurrently.
+# The core crime and the relationship web are static prompts built once at import;
+# the clues prompt depends on the generated core and is built per game.
+_CORE_PROMPT = f"""{_CASE_CONTEXT}
 
 Your job for THIS game:
 1. Randomly select one suspect as the VICTIM (killed last night in the mansion)
 2. Randomly select a DIFFERENT suspect as the MURDERER
-3. For each pair of suspects, assign a RELATIONSHIP TYPE from: {', '.join(RELATIONSHIP_TYPES)}
-4. Assign a MOTIVE to the murderer from: {', '.join(MOTIVES)}
-5. Create a plausible ALIBI for each suspect (what they claim they were doing in the mansion)
-6. Choose the LOCATION where the body was found from: {', '.join(MANSION_LOCATIONS)}
-7. Choose the CAUSE OF DEATH from: {', '.join(CAUSES_OF_DEATH)}
-8. Choose the ESTIMATED TIME OF DEATH from: {', '.join(TIMES_OF_DEATH)}
-9. Generate 3 CLUES that could help or mislead the detective (some true, some false/misleading)
+3. Assign a MOTIVE to the murderer from: {_MOT_CSV}
+4. Create a plausible ALIBI for each suspect (what they claim they were doing in the mansion)
+5. Choose the LOCATION where the body was found from: {_LOC_CSV}
+6. Choose the CAUSE OF DEATH from: {_COD_CSV}
+7. Choose the ESTIMATED TIME OF DEATH from: {_TOD_CSV}
 
 IMPORTANT:
 - ALL 6 SUSPECTS must have alibis
-- Relationships should be consistent (if Nick is Sarah's friend, Sarah is Nick's friend)
 - The murderer's alibi should be vague or show signs they're lying
 - Create alibis where some suspects can partially corroborate each other
-- Clues should be distributed among suspects (some might know something, others might lie about it)
-- Clues should be discoverable through interrogation
 
-Return your response as a valid JSON object with this exact structure:
+Use this exact JSON structure:
 {{
     "victim": "name_of_victim",
     "murderer": "name_of_murderer",
@@ -163,7 +171,19 @@ Return your response as a valid JSON object with this exact structure:
         "Emma": "their alibi",
         "David": "their alibi",
         "Lisa": "their alibi"
-    }},
+    }}
+}}"""
+
+_RELATIONSHIPS_PROMPT = f"""{_CASE_CONTEXT}
+
+Your job for THIS game:
+For each pair of suspects, assign a RELATIONSHIP TYPE from: {_REL_CSV}
+
+IMPORTANT:
+- Relationships should be consistent (if Nick is Sarah's friend, Sarah is Nick's friend)
+
+Use this exact JSON structure:
+{{
     "relationships": {{
         "Nick_Sarah": "relationship_type",
         "Nick_James": "relationship_type",
@@ -180,46 +200,139 @@ Return your response as a valid JSON object with this exact structure:
         "Emma_David": "relationship_type",
         "Emma_Lisa": "relationship_type",
         "David_Lisa": "relationship_type"
-    }},
+    }}
+}}
+
+Make sure all relationships are bidirectional and consistent."""
+
+_CLUE_STRUCTURE = """{
     "clues": [
-        {{
+        {
             "clue": "description of the clue",
             "known_by": "which suspect knows this clue",
             "is_true": true/false,
             "category": "physical evidence/witness statement/financial/relationship"
-        }},
-        {{
+        },
+        {
             "clue": "description of the clue",
             "known_by": "which suspect knows this clue",
             "is_true": true/false,
             "category": "physical evidence/witness statement/financial/relationship"
-        }},
-        {{
+        },
+        {
             "clue": "description of the clue",
             "known_by": "which suspect knows this clue",
             "is_true": true/false,
             "category": "physical evidence/witness statement/financial/relationship"
-        }}
+        }
     ]
-}}
+}"""
+
+_JSON_SYSTEM_PROMPT = "You are a JSON generator for a murder mystery game. Always return valid JSON only."
 
-Make sure all relationships are bidirectional and consistent. Return ONLY the JSON object, no other text."""
 
-        response = client.chat.completions.create(
+class MurderMysteryMaster:
+    __slots__ = (
+        "suspects",
+        "victim",
+        "murderer",
+        "relationships",
+        "motives",
+        "case_state",
+        "crime_location",
+        "cause_of_death",
+        "time_of_death",
+        "clues",
+    )
+
+    def __init__(self):
+        self.suspects = {}
+        self.victim = None
+        self.murderer = None
+        self.relationships = {}
+        self.motives = {}
+        self.case_state = None
+
+        # Crime scene details (filled in by build_world_state)
+        self.crime_location = None
+        self.cause_of_death = None
+        self.time_of_death = None
+        self.clues = []
+
+    def generate_case_state(self):
+        """Use OpenAI to generate a cohesive murder mystery case state"""
+        # The relationship web is independent of the crime, so it is generated alongside
+        # the core crime and its clues instead of as part of one large response
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            relationships_future = executor.submit(self._request_json, _RELATIONSHIPS_PROMPT)
+            core = self._request_json(_CORE_PROMPT)
+            clues = self._request_json(self._build_clues_prompt(core)) if core else None
+            relationships = relationships_future.result()
+
+        if not core:
+            return None
+
+        self.case_state = {
+            **core,
+            "relationships": (relationships or {}).get("relationships", {}),
+            "clues": (clues or {}).get("clues", []),
+        }
+        return self.case_state
+
+    def _build_clues_prompt(self, core):
+        """Build the clue generation prompt for an already generated crime"""
+        alibis_text = "\n".join(
+            f"- {name}: {alibi}" for name, alibi in core.get("alibis", {}).items()
+        )
+        return f"""{_CASE_CONTEXT}
+
+THE CRIME FOR THIS GAME:
+- Victim: {core.get("victim")}
+- Murderer: {core.get("murderer")}
+- Motive: {core.get("murderer_motive")}
+- Location: {core.get("crime_location")}
+- Cause of death: {core.get("cause_of_death")}
+- Time of death: {core.get("time_of_death")}
+
+ALIBIS:
+{alibis_text}
+
+Your job for THIS game:
+Generate 3 CLUES that could help or mislead the detective (some true, some false/misleading)
+
+IMPORTANT:
+- Clues should be distributed among suspects (some might know something, others might lie about it)
+- Clues should be discoverable through interrogation
+
+Use this exact JSON structure:
+{_CLUE_STRUCTURE}"""
+
+    def _request_json(self, prompt):
+        """Request a JSON object for a prompt, returning the parsed dict or None on failure"""
+        stream = get_openai_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": "You are a JSON generator for a murder mystery game. Always return valid JSON only."},
+                {"role": "system", "content": _JSON_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.8
+            response_format={"type": "json_object"},
+            temperature=0.8,
+            stream=True
         )
 
+        # Accumulate streamed tokens as they arrive instead of waiting on one large response body
+        content_parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                content_parts.append(chunk.choices[0].delta.content)
+        content = "".join(content_parts)
+
         try:
-            self.case_state = json.loads(response.choices[0].message.content)
-            return self.case_state
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+            return orjson.loads(content) if orjson else json.loads(content)
         except json.JSONDecodeError as e:
             print(f"Error parsing JSON response: {e}")
-            print(f"Response was: {response.choices[0].message.content}")
+            print(f"Response was: {content}")
             return None
 
     def build_world_state(self):
@@ -234,16 +347,16 @@ Make sure all relationships are bidirectional and consistent. Return ONLY the JS
         self.murderer = state["murderer"]
 
         # Build suspect details (using fixed traits + dynamic alibi)
-        for name in SUSPECT_NAMES:
-            suspect_base = FIXED_SUSPECTS[name]
+        alibis = state.get("alibis", {})
+        for name, age, gender, occupation, traits in _SUSPECT_BASE_TUPLES:
             # Handle missing alibis by providing a default
-            alibi = state.get("alibis", {}).get(name, f"I was minding my own business.")
+            alibi = alibis.get(name, f"I was minding my own business.")
             self.suspects[name] = {
                 "name": name,
-                "age": suspect_base["age"],
-                "gender": suspect_base["gender"],
-                "occupation": suspect_base["occupation"],
-                "personality_traits": suspect_base["personality_traits"],
+                "age": age,
+                "gender": gender,
+                "occupation": occupation,
+                "personality_traits": traits,
                 "alibi": alibi,
                 "is_victim": (name == self.victim),
                 "is_murderer": (name == self.murderer),
@@ -269,22 +382,24 @@ Make sure all relationships are bidirectional and consistent. Return ONLY the JS
             print("No world state generated yet!")
             return
 
-        print("\n" + "="*80)
-        print("MURDER MYSTERY GAME - WORLD STATE")
-        print("="*80 + "\n")
-
-        # Print basic case info
-        print(f"🔴 VICTIM: {self.victim}")
-        print(f"🔪 MURDERER: {self.murderer}")
-        print(f"📋 MOTIVE: {self.motives[self.murderer]}")
-        print(f"📍 CRIME LOCATION: {self.crime_location}")
-        print(f"☠️  CAUSE OF DEATH: {self.cause_of_death}")
-        print(f"⏰ TIME OF DEATH: {self.time_of_death}\n")
-
-        # Print suspect details
-        print("-"*80)
-        print("SUSPECTS:")
-        print("-"*80)
+        # Build the whole report and write it once instead of one locked print per line
+        out = []
+        out.append("\n" + "="*80)
+        out.append("MURDER MYSTERY GAME - WORLD STATE")
+        out.append("="*80 + "\n")
+
+        # Basic case info
+        out.append(f"🔴 VICTIM: {self.victim}")
+        out.append(f"🔪 MURDERER: {self.murderer}")
+        out.append(f"📋 MOTIVE: {self.motives[self.murderer]}")
+        out.append(f"📍 CRIME LOCATION: {self.crime_location}")
+        out.append(f"☠️  CAUSE OF DEATH: {self.cause_of_death}")
+        out.append(f"⏰ TIME OF DEATH: {self.time_of_death}\n")
+
+        # Suspect details
+        out.append("-"*80)
+        out.append("SUSPECTS:")
+        out.append("-"*80)
         for name in SUSPECT_NAMES:
             suspect = self.suspects[name]
             marker = ""
@@ -293,20 +408,24 @@ Make sure all relationships are bidirectional and consistent. Return ONLY the JS
             elif suspect["is_murderer"]:
                 marker = " 🔪 [MURDERER]"
 
-            print(f"\n{name}{marker}")
-            print(f"  Age: {suspect['age']} | Gender: {suspect['gender']}")
-            print(f"  Occupation: {suspect['occupation']}")
-            print(f"  Personality: {', '.join(suspect['personality_traits'])}")
-            print(f"  Alibi: {suspect['alibi']}")
-
-        # Print relationships
-        print("\n" + "-"*80)
-        print("RELATIONSHIPS:")
-        print("-"*80)
-        for pair, relationship in self.relationships.items():
-            print(f"  {pair}: {relationship}")
-
-        print("\n" + "="*80 + "\n")
+            out.append(f"\n{name}{marker}")
+            out.append(f"  Age: {suspect['age']} | Gender: {suspect['gender']}")
+            out.append(f"  Occupation: {suspect['occupation']}")
+            out.append(f"  Personality: {', '.join(suspect['personality_traits'])}")
+            out.append(f"  Alibi: {suspect['alibi']}")
+
+        # Relationships
+        out.append("\n" + "-"*80)
+        out.append("RELATIONSHIPS:")
+        out.append("-"*80)
+        if self.relationships:
+            out.append("\n".join(
+                f"  {pair}: {relationship}" for pair, relationship in self.relationships.items()
+            ))
+
+        out.append("\n" + "="*80 + "\n")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
 
 def main():
@@ -0,0 +1,147 @@
+"""
+Shared OpenAI client for all agents.
+Keeps a single client (and its HTTP connection pool) per process so that
+bursts of chat completions reuse warm keep-alive connections instead of
+paying TCP/TLS setup on every call.
+"""
+
+import os
+import random
+import threading
+import time
+from .env import load_environment
+
+# Connection pool limits for the shared HTTP client, sized so concurrent suspects don't queue on connections
+MAX_KEEPALIVE_CONNECTIONS = 64
+MAX_CONNECTIONS = 128
+KEEPALIVE_EXPIRY = 60
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 5
+
+# Retry policy for transient API failures (rate limits, dropped connections, timeouts)
+MAX_ATTEMPTS = 5
+INITIAL_BACKOFF = 0.5
+MAX_BACKOFF = 10.0
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _http2_available():
+    """HTTP/2 lets many requests share one connection, but needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_openai_client():
+    """Return the process-wide OpenAI client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Imported lazily so the SDK import cost is only paid when a client is needed
+                import httpx
+                from openai import OpenAI
+
+                load_environment()
+                http_client = httpx.Client(
+                    http2=_http2_available(),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY,
+                    ),
+                    timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+                )
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+    return _client
+
+
+def close_openai_client():
+    """Close the shared client's connection pool (e.g. on game shutdown)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+class _RateLimiter:
+    """Token bucket that spaces requests to stay under a requests-per-minute limit"""
+
+    def __init__(self, rpm):
+        self.rate = rpm / 60.0
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Built on the first request, once .env has been loaded; None when throttling is off
+_rate_limiter = None
+_rate_limiter_ready = False
+_rate_limiter_lock = threading.Lock()
+
+
+def _read_rpm():
+    """Optional OPENAI_RPM requests-per-minute ceiling; 0 (or an invalid value) disables throttling"""
+    load_environment()
+    value = os.getenv("OPENAI_RPM", "").strip()
+    if not value:
+        return 0
+    try:
+        return max(0, int(value))
+    except ValueError:
+        print(f"⚠️ Ignoring invalid OPENAI_RPM value {value!r}; requests will not be throttled")
+        return 0
+
+
+def _get_rate_limiter():
+    """Return the shared rate limiter, or None if OPENAI_RPM is unset"""
+    global _rate_limiter, _rate_limiter_ready
+    if not _rate_limiter_ready:
+        with _rate_limiter_lock:
+            if not _rate_limiter_ready:
+                rpm = _read_rpm()
+                _rate_limiter = _RateLimiter(rpm) if rpm > 0 else None
+                _rate_limiter_ready = True
+    return _rate_limiter
+
+
+def create_chat_completion(**kwargs):
+    """
+    Create a chat completion on the shared client, throttled to OPENAI_RPM and
+    retried with jittered exponential backoff on transient errors.
+    """
+    import openai
+
+    retryable = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+    rate_limiter = _get_rate_limiter()
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        if rate_limiter:
+            rate_limiter.acquire()
+        try:
+            return get_openai_client().chat.completions.create(**kwargs)
+        except retryable as e:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            delay = min(MAX_BACKOFF, INITIAL_BACKOFF * 2 ** (attempt - 1))
+            delay += random.uniform(0, delay)
+            print(f"⚠️ OpenAI request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            time.sleep(delay)
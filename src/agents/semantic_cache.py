@@ -0,0 +1,186 @@
+"""
+Semantic response cache for suspect interrogations.
+Lets a suspect reuse an earlier reply when the detective repeats (or closely
+rephrases) a question while the suspect's personality state is unchanged,
+skipping the chat completion round-trip entirely.
+"""
+
+import hashlib
+import math
+import operator
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .openai_client import get_openai_client
+
+# How long (seconds) a cached reply stays valid
+CACHE_TTL = 15 * 60
+
+# Maximum number of cached replies before the least recently used is evicted
+CACHE_MAX_ENTRIES = 256
+
+# Minimum cosine similarity for a rephrased question to count as the same question
+SIMILARITY_THRESHOLD = 0.93
+
+# Maximum per-trait personality difference for a cached reply to still fit
+PERSONALITY_TOLERANCE = 1
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Embeds stored questions off the reply path, so a cache miss never waits on the embeddings API
+_embed_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embed")
+
+
+def _normalize_question(question):
+    """Lowercase and collapse whitespace so trivial variations share a key"""
+    return " ".join(question.lower().split())
+
+
+def _unit_vector(vector):
+    """Scale a vector to unit length (as a tuple), or None for a zero vector"""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return None
+    return tuple(x / norm for x in vector)
+
+
+def _dot(a, b):
+    """Dot product; for unit vectors this is their cosine similarity"""
+    return sum(map(operator.mul, a, b))
+
+
+class SemanticResponseCache:
+    """LRU + TTL cache of suspect replies with an embedding-similarity fallback"""
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, use_embeddings=True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.use_embeddings = use_embeddings
+        self._entries = OrderedDict()  # key -> entry dict
+        self._lock = threading.Lock()
+
+    def _key(self, suspect_name, personality_levels, question):
+        """Exact-match key for a suspect, personality state and normalized question"""
+        raw = f"{suspect_name}|{sorted(personality_levels.items())}|{_normalize_question(question)}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _embed(self, question):
+        """
+        Embed a question as a unit vector, so similarity against cached entries is a plain
+        dot product. Returns None if the embeddings call fails.
+        """
+        try:
+            result = get_openai_client().embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=_normalize_question(question)
+            )
+            return _unit_vector(result.data[0].embedding)
+        except Exception as e:
+            print(f"⚠️ Error embedding question for response cache: {e}")
+            return None
+
+    def _evict_expired(self, now):
+        """Drop expired entries. Caller must hold self._lock."""
+        expired = [key for key, entry in self._entries.items() if now - entry["timestamp"] >= self.ttl]
+        for key in expired:
+            del self._entries[key]
+
+    def lookup(self, suspect_name, personality_levels, question, opening=False):
+        """
+        Find a cached reply for this question. Replies stored with opening_only are
+        only returned when opening is True (the question opens the conversation).
+
+        The question is only embedded when this suspect has cached replies to compare it with,
+        so the first questions to a suspect don't pay for an embeddings round trip.
+
+        Returns:
+            Tuple of (hit, embedding) where hit is (response, personality_changes) or None.
+            The embedding (if one was computed) should be passed back to store() on a miss.
+        """
+        key = self._key(suspect_name, personality_levels, question)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get(key)
+            if entry and (opening or not entry["opening_only"]):
+                self._entries.move_to_end(key)
+                return (entry["response"], entry["changes"]), entry["embedding"]
+            has_candidates = any(
+                e["suspect"] == suspect_name and (opening or not e["opening_only"])
+                for e in self._entries.values()
+            )
+
+        if not self.use_embeddings or not has_candidates:
+            return None, None
+
+        embedding = self._embed(question)
+        if embedding is None:
+            return None, None
+
+        best_key, best_score = None, SIMILARITY_THRESHOLD
+        with self._lock:
+            for candidate_key, entry in self._entries.items():
+                if entry["suspect"] != suspect_name or entry["embedding"] is None:
+                    continue
+                if entry["opening_only"] and not opening:
+                    continue
+                levels = entry["personality"]
+                if any(abs(levels.get(trait, 0) - level) > PERSONALITY_TOLERANCE
+                       for trait, level in personality_levels.items()):
+                    continue
+                score = _dot(embedding, entry["embedding"])
+                if score >= best_score:
+                    best_key, best_score = candidate_key, score
+
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                entry = self._entries[best_key]
+                return (entry["response"], entry["changes"]), embedding
+
+        return None, embedding
+
+    def store(self, suspect_name, personality_levels, question, response, changes, embedding=None,
+              opening_only=False):
+        """
+        Cache a reply for the personality state the question was asked in.
+        opening_only marks a reply generated with no conversation history, which only fits
+        a question that opens the conversation.
+        Without an embedding from lookup(), the question is embedded in the background.
+        """
+        key = self._key(suspect_name, personality_levels, question)
+        with self._lock:
+            entry = self._entries[key] = {
+                "suspect": suspect_name,
+                "personality": dict(personality_levels),
+                "embedding": _unit_vector(embedding) if embedding is not None else None,
+                "response": response,
+                "changes": dict(changes),
+                "opening_only": opening_only,
+                "timestamp": time.monotonic(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if embedding is None and self.use_embeddings:
+            _embed_executor.submit(self._fill_embedding, key, entry, question)
+
+    def _fill_embedding(self, key, entry, question):
+        """Attach an embedding to a stored entry, unless it has been replaced or evicted since"""
+        embedding = self._embed(question)
+        if embedding is None:
+            return
+        with self._lock:
+            if self._entries.get(key) is entry:
+                entry["embedding"] = embedding
+
+    def clear(self):
+        """Remove every cached reply"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache for every suspect in the process
+response_cache = SemanticResponseCache()
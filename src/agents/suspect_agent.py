@@ -1,13 +1,378 @@
 import os
 import json
 import random
-from dotenv import load_dotenv
-from openai import OpenAI
+import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from .env import load_environment
+from .openai_client import create_chat_completion
 from .hyperspell_context import get_agent_gossip_context
+from .semantic_cache import response_cache
+
+try:
+    import orjson  # Optional faster JSON parser
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only catch the latter
+_json_loads = orjson.loads if orjson else json.loads
+
+# Maximum OpenAI requests in flight across all suspects, to stay within rate limits
+MAX_CONCURRENT_REQUESTS = 32
+
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Standard traits for every suspect, and each trait's slot in a suspect's level list
+_TRAITS = ("Anxious", "Moody", "Trust")
+_TRAIT_IDX = {trait: index for index, trait in enumerate(_TRAITS)}
+
+# What each personality level means, shown next to the level in the prompt
+_LEVEL_DESCRIPTIONS = {
+    0: "Completely suppressed",
+    1: "Very low",
+    2: "Low",
+    3: "Neutral/Normal",
+    4: "High",
+    5: "Extremely high"
+}
+
+# Personality levels and their cumulative sampling weights: 5% level 0, 10% level 1,
+# 20% level 2, 30% level 3, 20% level 4 and 15% level 5
+_LEVELS = (0, 1, 2, 3, 4, 5)
+_CUM_WEIGHTS = (0.05, 0.15, 0.35, 0.65, 0.85, 1.0)
+
+# Shared worker pool so several suspects can be interrogated in parallel
+_respond_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="suspect")
+
+# The reply and the personality shift are returned together in one structured response
+_TURN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "suspect_turn",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "reply": {"type": "string"},
+                "changes": {
+                    "type": "object",
+                    "properties": {
+                        "Anxious": {"type": "integer"},
+                        "Moody": {"type": "integer"},
+                        "Trust": {"type": "integer"}
+                    },
+                    "required": ["Anxious", "Moody", "Trust"],
+                    "additionalProperties": False
+                }
+            },
+            "required": ["reply", "changes"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Conversation rules shared by every suspect, built once at import
+_STATIC_RULES = """TRAIT MECHANICS:
+- Anxious: When high, you tend to mix up facts and may lie to feel less anxious. When low, you're calm and collected.
+- Moody: When high, you act sassy and irritable. When low, you're pleasant and cooperative.
+- Trust: Increases if treated with respect. When high trust, you tell the truth. When low trust, you're defensive and secretive.
+
+Note: Your personality levels shift based on the conversation. Anxious increases under pressure, Moody responds to tone, Trust responds to respect.
+
+⚠️ CRITICAL RESPONSE RULES FOR THIS CONVERSATION:
+- Any evidence, facts, or clues that the detective has explicitly mentioned in this conversation, you CANNOT completely deny or ignore
+- If the detective brings up something you know about, you must acknowledge it somehow (admit, reluctantly agree, show emotion, deflect to another topic - but not pure denial)
+- If caught in an obvious contradiction, acknowledge the discrepancy or explain the inconsistency - don't pretend it was never said
+- Your Trust level (given at the end of these instructions) determines HOW you respond:
+  * Trust 0-1: Deny reluctantly, deflect, show suspicion of the detective
+  * Trust 2-3: Admit partially or with hesitation, show defensive emotion
+  * Trust 4-5: Admit openly and honestly, show genuine emotion
+- Your personality shapes your tone, not your willingness to address what's been brought up
+
+BEHAVIORAL TRIGGERS - How you respond depends on the detective's approach:
+- RESPECTFUL & FRIENDLY questioning: You may reveal hintable facts or show vulnerability (50% chance of disclosure)
+- ACCUSATORY & HOSTILE questioning: You become defensive, deny everything, may misdirect or accuse others
+- DIRECT & SPECIFIC questions: If you know the answer, Trust level determines if you reveal it (high Trust = honest, low Trust = evasive)
+- PRESSURE & CONTRADICTION: If caught in inconsistencies, anxiety increases and you might slip up or contradict yourself further
+
+RESPONSE GUIDELINES WITH EXAMPLES:
+
+For EVASIVE responses (when you don't want to answer):
+- "I'm not sure what you mean..." / "That's a personal matter" / "I'd rather not discuss that"
+- Don't directly deny facts you know - instead deflect or claim memory lapses
+- Example: Q: "Where were you at 11pm?" A: "I think I was in my room, maybe. Why do you ask?"
+
+For PARTIAL TRUTH responses (revealing some but not all):
+- Admit to something real but leave out the incriminating details
+- Use vague language: "around that time", "think I saw", "maybe", "could've been"
+- Example: Q: "Did you see the victim?" A: "Yeah, briefly earlier. We talked about something mundane."
+
+For FULL DISCLOSURE responses (when Trust is high or pressure is overwhelming):
+- Answer directly and completely
+- Show emotional reaction if appropriate to your personality
+- Example: Q: "Did you argue with the victim?" A: "Yes, we did. They said something hurtful and I was furious."
+
+IMPORTANT RULES:
+1. Stay completely in character at all times
+2. Let your personality traits guide your responses based on the detective's tone
+3. Reference your relationships when talking about other suspects
+4. Be consistent with what you say across multiple conversations
+5. Show emotion - this is a murder investigation, not a casual chat
+6. The detective doesn't know if you're the murderer
+7. Keep responses concise (2-3 sentences max) like a real conversation
+8. Your traits shift based on how you're being interrogated
+9. Only reveal hintable facts if the question invites it or if Trust is high
+10. Never invent facts - only reference what you actually know about
+
+Remember: Your personality levels will change based on how the detective treats you."""
+
+_TURN_FORMAT_INSTRUCTIONS = """
+
+RESPONSE FORMAT:
+Return a JSON object with two fields:
+- "reply": what you say to the detective, in character
+- "changes": how this exchange shifts each of your traits (Anxious, Moody, Trust), from -2 to +2 (0 = no change)
+
+To decide the changes, consider:
+1. How accusatory/friendly the question is
+2. Your reply (defensive, confident, nervous, etc.)
+3. Whether you're the murderer (pressure affects you differently)
+- If pressure is applied, Anxious rises
+- If the detective is rude or hostile, Moody rises; if pleasant, it falls
+- If you're treated with respect, Trust rises; if accused or caught in contradictions, it falls"""
 
-load_dotenv()
+# Per-turn system prompt. Everything above the personality state is identical on every turn,
+# so the prompt shares a long stable prefix that the API can serve from its prompt cache
+_SYSTEM_PROMPT_TEMPLATE = string.Template("""$static_prefix
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+CURRENT PERSONALITY STATE:
+$personality_text
+Your current Trust level is $trust_level/5.
+
+$gossip_context""")
+
+# Opening statements depend on the suspect's profile (name, age, gender, occupation),
+# so they are kept on disk across runs under that profile (in TUFF_CACHE_DIR if set)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "tuff"
+
+_openings_lock = threading.Lock()
+
+# Seconds get_opening_statement() waits for a running generate_openings() batch
+OPENING_BATCH_WAIT = 15
+
+
+def _opening_key(name, age, gender, occupation):
+    """Disk cache key for an opening statement: the profile fields it was written for"""
+    return f"{name}|{age}|{gender}|{occupation}"
+
+
+def _openings_cache_path():
+    """Opening statement cache file, read after .env is loaded rather than at import"""
+    load_environment()
+    return Path(os.getenv("TUFF_CACHE_DIR", DEFAULT_CACHE_DIR)) / "openings.json"
+
+
+def _load_openings():
+    """Read cached opening statements from disk, or an empty dict if there are none"""
+    try:
+        with open(_openings_cache_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_openings(statements):
+    """Add opening statements (profile key -> statement) to the disk cache, writing the file atomically"""
+    with _openings_lock:
+        openings = _load_openings()
+        openings.update(statements)
+        cache_path = _openings_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(openings, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not save opening statement cache: {e}")
+
+
+@lru_cache(maxsize=64)
+def _opening_statement_for(name, age, gender, occupation):
+    """Return the opening statement for a suspect profile, from disk if cached, else from the API"""
+    key = _opening_key(name, age, gender, occupation)
+    cached = _load_openings().get(key)
+    if cached:
+        return cached
+
+    opening_prompt = f"""Generate a brief opening statement (1-2 sentences) for {name}, a {age} year old {gender} {occupation}, when they are first asked to be interviewed about the murder.
+
+The suspect should:
+- Acknowledge they know what this is about
+- Show their personality through how they react (nervous, confident, defensive, etc.)
+- Be realistic and natural, not overly formal
+
+Keep it to 1-2 sentences max. Return ONLY the statement, no extra text."""
+
+    response = _create_completion(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "user", "content": opening_prompt}
+        ],
+        temperature=0.8,
+        max_tokens=100
+    )
+    statement = response.choices[0].message.content.strip()
+    _save_openings({key: statement})
+    return statement
+
+# Tone markers for estimating personality changes without a model
+_HOSTILE_RE = re.compile(r"\b(liar|lying|lie|killed|killer|murderer|murdered|confess|guilty|admit)\b", re.I)
+_KIND_RE = re.compile(r"\b(please|thank you|thanks|understand|sorry|appreciate)\b", re.I)
+
+
+def _classify_personality_changes(question, is_murderer):
+    """
+    Estimate personality changes from the tone of the detective's question.
+    Used when the model's structured changes are unavailable.
+    """
+    hostile_hits = len(_HOSTILE_RE.findall(question))
+    kind_hits = len(_KIND_RE.findall(question))
+    letters = [c for c in question if c.isalpha()]
+    shouting = question.count("!") >= 2 or (
+        len(letters) >= 10 and sum(c.isupper() for c in letters) > 0.7 * len(letters)
+    )
+
+    changes = {}
+    if hostile_hits:
+        # Accusations rattle the murderer more than an innocent suspect
+        changes["Anxious"] = 2 if is_murderer else 1
+        changes["Trust"] = -1
+    elif kind_hits:
+        changes["Trust"] = 1
+        changes["Moody"] = -1
+    if shouting:
+        changes["Moody"] = changes.get("Moody", 0) + 1
+        changes["Trust"] = changes.get("Trust", 0) - 1
+
+    return {trait: max(-2, min(2, change)) for trait, change in changes.items() if change}
+
+
+def generate_openings(suspects):
+    """
+    Fill in opening statements for several suspects with a single API call.
+    Statements already cached on disk are reused; only the rest are requested.
+
+    Args:
+        suspects: List of SuspectAgent instances
+
+    Returns:
+        Dict of suspect name -> opening statement
+    """
+    # Agents opened while the batch is in flight wait for it instead of making their own call
+    for suspect in suspects:
+        suspect._opening_ready.clear()
+
+    try:
+        cached = _load_openings()
+        missing = []
+        for suspect in suspects:
+            statement = cached.get(_opening_key(*suspect.opening_profile))
+            if statement:
+                suspect._opening = statement
+            else:
+                missing.append(suspect)
+
+        if missing:
+            suspects_text = "\n".join(
+                f"- {s.name}, a {s.age} year old {s.gender} {s.occupation}" for s in missing
+            )
+            prompt = f"""Generate a brief opening statement (1-2 sentences) for each of these suspects when they are first asked to be interviewed about the murder:
+{suspects_text}
+
+Each suspect should:
+- Acknowledge they know what this is about
+- Show their personality through how they react (nervous, confident, defensive, etc.)
+- Be realistic and natural, not overly formal
+
+Return a JSON object of the form {{"openings": {{"<name>": "<statement>", ...}}}}"""
+
+            try:
+                response = _create_completion(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.8,
+                    max_tokens=100 * len(missing)
+                )
+                openings = _json_loads(response.choices[0].message.content).get("openings", {})
+                new_statements = {}
+                for suspect in missing:
+                    statement = openings.get(suspect.name)
+                    if isinstance(statement, str) and statement.strip():
+                        suspect._opening = statement.strip()
+                        new_statements[_opening_key(*suspect.opening_profile)] = suspect._opening
+                if new_statements:
+                    _save_openings(new_statements)
+            except Exception as e:
+                # Suspects without a statement fall back to generating their own on demand
+                print(f"⚠️ Error generating opening statements: {e}")
+    finally:
+        for suspect in suspects:
+            suspect._opening_ready.set()
+
+    return {s.name: s._opening for s in suspects if s._opening}
+
+
+# Said instead when a turn came back with no readable reply at all
+FALLBACK_REPLY = "I... I'm sorry, could you ask me that again?"
+
+
+def _partial_reply(content):
+    """
+    Decode as much of the "reply" string as has arrived in a partial JSON turn.
+    Stops before an unfinished escape sequence so the text never goes backwards.
+    """
+    key_index = content.find('"reply"')
+    if key_index == -1:
+        return ""
+    colon_index = content.find(":", key_index + 7)
+    start = content.find('"', colon_index + 1) if colon_index != -1 else -1
+    if start == -1:
+        return ""
+
+    i = start + 1
+    end = len(content)
+    while i < len(content):
+        char = content[i]
+        if char == "\\":
+            # \uXXXX needs 6 characters, every other escape needs 2
+            escape_length = 6 if content[i + 1:i + 2] == "u" else 2
+            if i + escape_length > len(content):
+                end = i
+                break
+            i += escape_length
+        elif char == '"':
+            end = i
+            break
+        else:
+            i += 1
+
+    try:
+        return _json_loads('"' + content[start + 1:end] + '"')
+    except json.JSONDecodeError:
+        return ""
+
+
+def _create_completion(**kwargs):
+    """Run a chat completion on the shared client, bounded by the global request limit"""
+    with _request_slots:
+        return create_chat_completion(**kwargs)
 
 
 class SuspectAgent:
@@ -35,10 +400,17 @@ class SuspectAgent:
         self.clues = clues or []
         self.conversation_history = []
         self.orchestrator = orchestrator
+        self._opening = None  # Opening statement filled in by generate_openings()
+        self._opening_ready = threading.Event()  # Cleared while generate_openings() is running
+        self._opening_ready.set()
 
         # Find clues this suspect knows about
         self.known_clues = [c for c in self.clues if c.get("known_by") == self.name]
 
+        # Relationships and known clues never change, so render their prompt sections once
+        self._relationships_block = "\n".join(f"- {suspect}: {rel}" for suspect, rel in self.relationships.items())
+        self._clues_block = "\n".join(f"- {c.get('clue', '')}" for c in self.known_clues) or "None"
+
         # Get orchestration briefing if orchestrator is available
         self.orchestration_briefing = None
         if self.orchestrator:
@@ -47,34 +419,14 @@ class SuspectAgent:
         # Initialize personality levels (0-5 scale)
         # Standard traits for all suspects: Anxious, Moody, Trust
         # Random initialization with bias toward middle (3) - extreme values very rare
-        standard_traits = ["Anxious", "Moody", "Trust"]
-        self.personality_levels = {}
-
-        for trait in standard_traits:
-            # Use weighted distribution: more common in middle (2-4 range)
-            # Extreme values (0, 5) are very rare
-            rand = random.random()
-            if rand < 0.05:  # 5% chance of extreme low (0)
-                level = 0
-            elif rand < 0.15:  # 10% chance of low (1)
-                level = 1
-            elif rand < 0.35:  # 20% chance of below neutral (2)
-                level = 2
-            elif rand < 0.65:  # 30% chance of neutral (3)
-                level = 3
-            elif rand < 0.85:  # 20% chance of above neutral (4)
-                level = 4
-            elif rand < 0.95:  # 10% chance of high (5)
-                level = 5
-            else:  # 5% chance of extreme high (would be 5, but capped)
-                level = 5
-
-            self.personality_levels[trait] = level
+        # Levels are stored in _TRAITS order; personality_levels exposes them as a dict
+        self._levels = random.choices(_LEVELS, cum_weights=_CUM_WEIGHTS, k=len(_TRAITS))
 
         # Override base_personality_traits to use standard traits
-        self.base_personality_traits = standard_traits
+        self.base_personality_traits = list(_TRAITS)
 
-        # Build the system prompt
+        # Build the system prompt; the static prefix is reused on every turn
+        self._static_prompt_prefix = f"{self._build_static_prompt_body()}\n\n{_STATIC_RULES}{_TURN_FORMAT_INSTRUCTIONS}"
         self.system_prompt = self._build_system_prompt()
 
     def _build_gossip_context(self):
@@ -115,44 +467,8 @@ class SuspectAgent:
 
         return gossip_context
 
-    def _build_system_prompt(self, conversation_history=None):
-        """Build a detailed system prompt for this suspect
-
-        Args:
-            conversation_history: Optional conversation history to extract mentioned clues
-        """
-
-        # Build conversation context if history is provided
-        conversation_context = ""
-        if conversation_history and len(conversation_history) > 0:
-            conversation_context = "\n⚠️ CONVERSATION SO FAR:\n"
-            for msg in conversation_history:
-                role = "DETECTIVE" if msg.get("role") == "user" else "YOU"
-                content = msg.get("content", "")
-                conversation_context += f"{role}: {content}\n"
-
-        # Build gossip context
-        gossip_context = self._build_gossip_context()
-
-        relationships_text = "\n".join([
-            f"- {suspect}: {rel}"
-            for suspect, rel in self.relationships.items()
-        ])
-
-        # Build personality description with current levels
-        personality_desc = []
-        for trait in self.base_personality_traits:
-            level = self.personality_levels.get(trait, 3)
-            level_description = self._get_level_description(trait, level)
-            personality_desc.append(f"- {trait}: {level}/5 ({level_description})")
-
-        personality_text = "\n".join(personality_desc)
-
-        # Build clues you know about
-        clues_text = "None"
-        if self.known_clues:
-            clues_text = "\n".join([f"- {c.get('clue', '')}" for c in self.known_clues])
-
+    def _build_static_prompt_body(self):
+        """Build the part of the system prompt that never changes during a conversation"""
         # Build orchestration context if available
         orchestration_context = ""
         secrets_to_hide = ""
@@ -217,89 +533,40 @@ You must:
 - Help or hinder the detective based on your relationships (protect friends, throw shade on enemies)
 - Show genuine emotion about the death"""
 
-        prompt = f"""You are {self.name}, a {self.age} year old {self.gender} {self.occupation} living in the mansion.
-
-CURRENT PERSONALITY STATE:
-{personality_text}
-
-TRAIT MECHANICS:
-- Anxious (level {self.personality_levels['Anxious']}/5): When high, you tend to mix up facts and may lie to feel less anxious. When low, you're calm and collected.
-- Moody (level {self.personality_levels['Moody']}/5): When high, you act sassy and irritable. When low, you're pleasant and cooperative.
-- Trust (level {self.personality_levels['Trust']}/5): Increases if treated with respect. When high trust, you tell the truth. When low trust, you're defensive and secretive.
-
-Note: Your personality levels shift based on the conversation. Anxious increases under pressure, Moody responds to tone, Trust responds to respect.
+        return f"""You are {self.name}, a {self.age} year old {self.gender} {self.occupation} living in the mansion.
 
 INFORMATION YOU KNOW ABOUT THE MURDER:
-{clues_text}{orchestration_context}{secrets_to_hide}{defensive_guidance}{hintable_facts_text}
+{self._clues_block}{orchestration_context}{secrets_to_hide}{defensive_guidance}{hintable_facts_text}
 
 YOUR RELATIONSHIPS:
-{relationships_text}
+{self._relationships_block}
 
 YOUR ROLE IN THIS CASE:
-{behavior}
-
-{gossip_context}{conversation_context}
-
-⚠️ CRITICAL RESPONSE RULES FOR THIS CONVERSATION:
-- Any evidence, facts, or clues that the detective has explicitly mentioned in the conversation above, you CANNOT completely deny or ignore
-- If the detective brings up something you know about, you must acknowledge it somehow (admit, reluctantly agree, show emotion, deflect to another topic - but not pure denial)
-- If caught in an obvious contradiction, acknowledge the discrepancy or explain the inconsistency - don't pretend it was never said
-- Your Trust level ({self.personality_levels.get('Trust', 3)}/5) determines HOW you respond:
-  * Trust 0-1: Deny reluctantly, deflect, show suspicion of the detective
-  * Trust 2-3: Admit partially or with hesitation, show defensive emotion
-  * Trust 4-5: Admit openly and honestly, show genuine emotion
-- Your personality shapes your tone, not your willingness to address what's been brought up
+{behavior}"""
 
-BEHAVIORAL TRIGGERS - How you respond depends on the detective's approach:
-- RESPECTFUL & FRIENDLY questioning: You may reveal hintable facts or show vulnerability (50% chance of disclosure)
-- ACCUSATORY & HOSTILE questioning: You become defensive, deny everything, may misdirect or accuse others
-- DIRECT & SPECIFIC questions: If you know the answer, Trust level determines if you reveal it (high Trust = honest, low Trust = evasive)
-- PRESSURE & CONTRADICTION: If caught in inconsistencies, anxiety increases and you might slip up or contradict yourself further
-
-RESPONSE GUIDELINES WITH EXAMPLES:
-
-For EVASIVE responses (when you don't want to answer):
-- "I'm not sure what you mean..." / "That's a personal matter" / "I'd rather not discuss that"
-- Don't directly deny facts you know - instead deflect or claim memory lapses
-- Example: Q: "Where were you at 11pm?" A: "I think I was in my room, maybe. Why do you ask?"
-
-For PARTIAL TRUTH responses (revealing some but not all):
-- Admit to something real but leave out the incriminating details
-- Use vague language: "around that time", "think I saw", "maybe", "could've been"
-- Example: Q: "Did you see the victim?" A: "Yeah, briefly earlier. We talked about something mundane."
-
-For FULL DISCLOSURE responses (when Trust is high or pressure is overwhelming):
-- Answer directly and completely
-- Show emotional reaction if appropriate to your personality
-- Example: Q: "Did you argue with the victim?" A: "Yes, we did. They said something hurtful and I was furious."
-
-IMPORTANT RULES:
-1. Stay completely in character at all times
-2. Let your personality traits guide your responses based on the detective's tone
-3. Reference your relationships when talking about other suspects
-4. Be consistent with what you say across multiple conversations
-5. Show emotion - this is a murder investigation, not a casual chat
-6. The detective doesn't know if you're the murderer
-7. Keep responses concise (2-3 sentences max) like a real conversation
-8. Your traits shift based on how you're being interrogated
-9. Only reveal hintable facts if the question invites it or if Trust is high
-10. Never invent facts - only reference what you actually know about
+    def _build_system_prompt(self):
+        """Build a detailed system prompt for this suspect.
+        The conversation itself is sent as chat messages, not embedded here."""
+        # Build gossip context
+        gossip_context = self._build_gossip_context()
 
-Remember: Your personality levels will change based on how the detective treats you."""
+        # Build personality description with current levels
+        levels = self.personality_levels
+        personality_text = "\n".join([
+            f"- {trait}: {levels.get(trait, 3)}/5 ({_LEVEL_DESCRIPTIONS.get(levels.get(trait, 3), 'Unknown')})"
+            for trait in self.base_personality_traits
+        ])
 
-        return prompt
+        return _SYSTEM_PROMPT_TEMPLATE.substitute(
+            static_prefix=self._static_prompt_prefix,
+            personality_text=personality_text,
+            trust_level=levels.get('Trust', 3),
+            gossip_context=gossip_context
+        )
 
     def _get_level_description(self, trait, level):
         """Get a description of what a trait level means"""
-        descriptions = {
-            0: "Completely suppressed",
-            1: "Very low",
-            2: "Low",
-            3: "Neutral/Normal",
-            4: "High",
-            5: "Extremely high"
-        }
-        return descriptions.get(level, "Unknown")
+        return _LEVEL_DESCRIPTIONS.get(level, "Unknown")
 
     def respond(self, question):
         """
@@ -311,28 +578,89 @@ Remember: Your personality levels will change based on how the detective treats
         Returns:
             A tuple of (response, personality_changes)
         """
+        stream = self.respond_stream(question)
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                return done.value
+
+    def respond_stream(self, question):
+        """
+        Stream the suspect's reply to a question as it is generated.
+
+        Args:
+            question: The detective's question
+
+        Yields:
+            Pieces of the reply text as they arrive
+
+        Returns:
+            A tuple of (response, personality_changes) once the stream is finished
+        """
         # Add detective's question to history
         self.conversation_history.append({
             "role": "user",
             "content": question
         })
 
-        # Update system prompt with current personality levels AND conversation context
-        self.system_prompt = self._build_system_prompt(self.conversation_history)
+        # Reuse an earlier reply if this question (or a close rephrasing) was already
+        # answered in the same personality state
+        personality_before = self.personality_levels
+        opening = len(self.conversation_history) == 1
+        cached, question_embedding = response_cache.lookup(
+            self.name, personality_before, question, opening=opening
+        )
+        if cached:
+            assistant_response, personality_changes = cached
+            yield assistant_response
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": assistant_response
+            })
+            self.apply_personality_changes(personality_changes)
+            return assistant_response, dict(personality_changes)
+
+        # Update system prompt with current personality levels and gossip
+        self.system_prompt = self._build_system_prompt()
 
         # Get response from OpenAI
         messages_with_system = [
             {"role": "system", "content": self.system_prompt}
         ] + self.conversation_history
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages_with_system,
-            temperature=0.9,
-            max_tokens=300
+        content_parts = []
+        sent_length = 0
+        finish_reason = None
+        with _request_slots:
+            stream = create_chat_completion(
+                model="gpt-4o-mini",
+                messages=messages_with_system,
+                response_format=_TURN_RESPONSE_FORMAT,
+                temperature=0.9,
+                max_tokens=350,
+                stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                if chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+                if not chunk.choices[0].delta.content:
+                    continue
+                content_parts.append(chunk.choices[0].delta.content)
+
+                # Pass on whatever new reply text has been decoded so far
+                partial_reply = _partial_reply("".join(content_parts))
+                if len(partial_reply) > sent_length:
+                    yield partial_reply[sent_length:]
+                    sent_length = len(partial_reply)
+
+        assistant_response, personality_changes, complete = self._parse_turn(
+            "".join(content_parts), question, finish_reason
         )
-
-        assistant_response = response.choices[0].message.content
+        if len(assistant_response) > sent_length:
+            yield assistant_response[sent_length:]
 
         # Add assistant response to history
         self.conversation_history.append({
@@ -341,112 +669,138 @@ Remember: Your personality levels will change based on how the detective treats
         })
 
         # Update personality levels based on the interaction
-        personality_changes = self._update_personality_levels(question, assistant_response)
+        self.apply_personality_changes(personality_changes)
+
+        # A cut-off or unreadable turn is only good for this once, so it isn't reused
+        if complete:
+            response_cache.store(
+                self.name, personality_before, question,
+                assistant_response, personality_changes, question_embedding
+            )
 
         return assistant_response, personality_changes
 
-    def _update_personality_levels(self, question, response):
+    def prefetch(self, question):
         """
-        Analyze the question and response to update personality levels
-
-        Args:
-            question: The detective's question
-            response: The suspect's response
-
-        Returns:
-            Dict of personality changes
+        Speculatively answer a likely opening question and store the answer in the response
+        cache, without touching the conversation history or personality levels. If the detective
+        opens with it (or a close rephrasing) in the same state, respond() returns instantly.
+        Does nothing once the conversation has started, since the answer would ignore it.
         """
-        # Use OpenAI to analyze personality shifts
-        analysis_prompt = f"""Analyze how this interrogation affects the suspect's personality.
-
-SUSPECT: {self.name}
-PERSONALITY TRAITS: {', '.join(self.base_personality_traits)}
-CURRENT PERSONALITY LEVELS: {json.dumps(self.personality_levels)}
-
-DETECTIVE'S QUESTION: {question}
-SUSPECT'S RESPONSE: {response}
-
-IS MURDERER: {self.is_murderer}
-
-Based on:
-1. How accusatory/friendly the question is
-2. The suspect's response (defensive, confident, nervous, etc.)
-3. Whether they're the murderer (pressure affects them differently)
-4. The tone and content of their answer
-
-Determine if each personality trait should increase, decrease, or stay the same.
-
-For each trait, consider:
-- If a trait matches the behavior shown (e.g., if anxious and they show nervousness, anxiety might increase)
-- If pressure is applied, stress-related traits rise
-- If they're being cooperative, negative traits decrease
-- If caught in contradictions, defensive traits rise
+        if self.conversation_history:
+            return
+        personality = self.personality_levels
+        cached, question_embedding = response_cache.lookup(self.name, personality, question, opening=True)
+        if cached:
+            return
 
-Return a JSON object with ONLY personality changes (omit traits that don't change):
-{{
-    "trait_name": change_amount,
-    ...
-}}
-
-Where change_amount is between -2 and +2 (e.g., -1 means decrease by 1 level)
-
-Example: {{"Anxious": 1, "Confident": -1}}
-
-Return ONLY the JSON object."""
+        messages_with_system = [
+            {"role": "system", "content": self._build_system_prompt()},
+            {"role": "user", "content": question}
+        ]
 
         try:
-            analysis_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=200
+            with _request_slots:
+                response = create_chat_completion(
+                    model="gpt-4o-mini",
+                    messages=messages_with_system,
+                    response_format=_TURN_RESPONSE_FORMAT,
+                    temperature=0.9,
+                    max_tokens=350
+                )
+        except Exception as e:
+            print(f"⚠️ Error prefetching response for {self.name}: {e}")
+            return
+
+        choice = response.choices[0]
+        reply, changes, complete = self._parse_turn(choice.message.content, question, choice.finish_reason)
+        if complete:
+            response_cache.store(
+                self.name, personality, question, reply, changes, question_embedding, opening_only=True
             )
 
-            changes_json = analysis_response.choices[0].message.content
-            changes = json.loads(changes_json)
+    def respond_async(self, question):
+        """
+        Start respond() on the shared worker pool.
+        Lets callers question several suspects at once and gather the results.
 
-            # Apply changes to personality levels (clamp between 0 and 5)
-            for trait, change in changes.items():
-                if trait in self.personality_levels:
-                    new_level = self.personality_levels[trait] + change
-                    self.personality_levels[trait] = max(0, min(5, new_level))
+        Returns:
+            A Future resolving to (response, personality_changes)
+        """
+        return _respond_executor.submit(self.respond, question)
+
+    def _parse_turn(self, content, question, finish_reason=None):
+        """
+        Split a structured turn into the reply text and non-zero personality changes.
+        If the JSON was cut off (finish_reason "length") or is invalid, the reply is whatever
+        part of the "reply" string can be decoded, never the raw JSON, and the changes are
+        estimated from the question's tone.
 
-            return changes
-        except (json.JSONDecodeError, KeyError):
-            # If analysis fails, return empty changes
-            return {}
+        Returns:
+            A tuple of (reply, personality_changes, complete); complete is False for a fallback
+        """
+        content = content or ""
+        if finish_reason != "length":
+            try:
+                turn = _json_loads(content)
+                reply = turn["reply"]
+                if not isinstance(reply, str):
+                    raise TypeError("reply is not a string")
+                changes = {
+                    trait: max(-2, min(2, int(change)))
+                    for trait, change in turn.get("changes", {}).items()
+                    if trait in _TRAIT_IDX and change
+                }
+                return reply, changes, True
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+                pass
+
+        reply = _partial_reply(content).strip()
+        if not reply:
+            # Plain text is usable as it is; anything JSON-shaped is not shown to the player
+            stripped = content.strip()
+            reply = stripped if stripped and not stripped.startswith("{") else FALLBACK_REPLY
+        return reply, _classify_personality_changes(question, self.is_murderer), False
+
+    def apply_personality_changes(self, changes):
+        """Apply trait changes to personality levels (clamp between 0 and 5)"""
+        levels = self._levels
+        for trait, change in changes.items():
+            index = _TRAIT_IDX.get(trait)
+            if index is not None and change:
+                new_level = levels[index] + change
+                levels[index] = 0 if new_level < 0 else 5 if new_level > 5 else new_level
 
     def reset_conversation(self):
         """Reset the conversation history"""
         self.conversation_history = []
 
+    @property
+    def personality_levels(self):
+        """Current personality levels as a new trait -> level dict"""
+        return dict(zip(_TRAITS, self._levels))
+
     def get_personality_state(self):
         """Get the current personality state"""
-        return self.personality_levels.copy()
+        return self.personality_levels
 
-    def get_opening_statement(self):
-        """Generate an opening statement from the suspect"""
-        opening_prompt = f"""Generate a brief opening statement (1-2 sentences) for {self.name} when they are first asked to be interviewed about the murder.
+    @property
+    def opening_profile(self):
+        """The profile fields an opening statement is written for, used as its cache key"""
+        return (self.name, self.age, self.gender, self.occupation)
 
-The suspect should:
-- Acknowledge they know what this is about
-- Show their personality through how they react (nervous, confident, defensive, etc.)
-- Be realistic and natural, not overly formal
-
-Keep it to 1-2 sentences max. Return ONLY the statement, no extra text."""
+    def get_cached_opening_statement(self):
+        """Return the opening statement if it is already available, without any API call"""
+        return self._opening
 
+    def get_opening_statement(self):
+        """Generate an opening statement from the suspect"""
+        # Let a batch request that is already running finish before asking separately
+        self._opening_ready.wait(OPENING_BATCH_WAIT)
+        if self._opening:
+            return self._opening
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": opening_prompt}
-                ],
-                temperature=0.8,
-                max_tokens=100
-            )
-            return response.choices[0].message.content.strip()
+            return _opening_statement_for(*self.opening_profile)
         except Exception as e:
             # Fallback if API fails
             return f"I understand you wanted to talk to me about what happened."
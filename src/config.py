@@ -2,36 +2,77 @@
 Game configuration and constants
 """
 
-# Screen dimensions
-SCREEN_WIDTH = 1400
-SCREEN_HEIGHT = 900
-
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-DARK_GRAY = (30, 30, 30)
-LIGHT_GRAY = (200, 200, 200)
-ACCENT_COLOR = (200, 50, 50)
-
-# Card dimensions
-CARD_WIDTH = 280
-CARD_HEIGHT = 350
-CARD_PADDING = 30
-CARDS_PER_ROW = 3
-
-# FPS
-FPS = 60
-
-# Character portraits mapping
-CHARACTER_PORTRAITS = {
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable game settings; slot attribute reads avoid a dict lookup per access"""
+    # Screen dimensions
+    screen_width: int = 1400
+    screen_height: int = 900
+
+    # Colors
+    white: tuple = (255, 255, 255)
+    black: tuple = (0, 0, 0)
+    dark_gray: tuple = (30, 30, 30)
+    light_gray: tuple = (200, 200, 200)
+    accent_color: tuple = (200, 50, 50)
+
+    # Card dimensions
+    card_width: int = 280
+    card_height: int = 350
+    card_padding: int = 30
+    cards_per_row: int = 3
+
+    # FPS
+    fps: int = 60
+
+    # Parallax scrolling speeds
+    parallax_speed_2: float = 0.3
+    parallax_speed_3: float = 0.5
+
+
+CFG = Config()
+
+# Module-level names kept for `from src.config import *` users
+SCREEN_WIDTH = CFG.screen_width
+SCREEN_HEIGHT = CFG.screen_height
+
+WHITE = CFG.white
+BLACK = CFG.black
+DARK_GRAY = CFG.dark_gray
+LIGHT_GRAY = CFG.light_gray
+ACCENT_COLOR = CFG.accent_color
+
+CARD_WIDTH = CFG.card_width
+CARD_HEIGHT = CFG.card_height
+CARD_PADDING = CFG.card_padding
+CARDS_PER_ROW = CFG.cards_per_row
+
+FPS = CFG.fps
+
+# Character portraits mapping (read-only, with interned path strings)
+CHARACTER_PORTRAITS = MappingProxyType({name: sys.intern(path) for name, path in {
     "James": "assets/potrait/PNG/Transperent/Icon1.png",
     "Emma": "assets/potrait/PNG/Transperent/Icon2.png",
     "Nick": "assets/potrait/PNG/Transperent/Icon5.png",
     "Lisa": "assets/potrait/PNG/Transperent/Icon7.png",
     "Sarah": "assets/potrait/PNG/Transperent/Icon14.png",
     "David": "assets/potrait/PNG/Transperent/Icon39.png",
-}
+}.items()})
+
+PARALLAX_SPEED_2 = CFG.parallax_speed_2
+PARALLAX_SPEED_3 = CFG.parallax_speed_3
 
-# Parallax scrolling speeds
-PARALLAX_SPEED_2 = 0.3
-PARALLAX_SPEED_3 = 0.5
\ No newline at end of file
+__all__ = [
+    "Config", "CFG",
+    "SCREEN_WIDTH", "SCREEN_HEIGHT",
+    "WHITE", "BLACK", "DARK_GRAY", "LIGHT_GRAY", "ACCENT_COLOR",
+    "CARD_WIDTH", "CARD_HEIGHT", "CARD_PADDING", "CARDS_PER_ROW",
+    "FPS",
+    "CHARACTER_PORTRAITS",
+    "PARALLAX_SPEED_2", "PARALLAX_SPEED_3",
+]
@@ -6,6 +6,10 @@ import pygame
 import sys
 import json
 import os
+import threading
+from collections import defaultdict
+from enum import IntEnum
+from functools import partial
 from src.config import *
 from src.gui import (
     CharacterCard,
@@ -15,29 +19,68 @@ from src.gui import (
     IntroductionModal,
     ConversationScreen,
 )
-from src.agents import MurderMysteryMaster, SuspectAgent, AgentOrchestrator, AgentCommunicationManager
+from src.agents import MurderMysteryMaster, SuspectAgent, AgentOrchestrator, AgentCommunicationManager, generate_openings
 from src.agents.hyperspell_context import initialize_gossip_manager
+from src.agents.openai_client import close_openai_client
 from src.utils import init_cursors, set_default_cursor, set_map_frame_cursor, ParallaxBackground
 from src.visualization import AgentBehaviorVisualizer
 
-
-def get_card_positions():
-    """Calculate card positions (3x2 grid)"""
-    positions = []
+# Event and key constants bound once as module globals for the event loop
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_TEXTINPUT = pygame.TEXTINPUT
+_MOUSEWHEEL = pygame.MOUSEWHEEL
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_K_ESCAPE = pygame.K_ESCAPE
+_K_SPACE = pygame.K_SPACE
+
+# Window events that mean the window contents must be repainted (uncovered, restored,
+# resized, ...); which of them exist depends on the pygame/SDL version
+WINDOW_EVENTS = [
+    getattr(pygame, name)
+    for name in (
+        "VIDEOEXPOSE", "VIDEORESIZE", "WINDOWEVENT", "WINDOWSHOWN", "WINDOWEXPOSED",
+        "WINDOWRESTORED", "WINDOWMAXIMIZED", "WINDOWRESIZED", "WINDOWSIZECHANGED",
+        "WINDOWFOCUSGAINED",
+    )
+    if hasattr(pygame, name)
+]
+
+# Event types consumed by the game loop; everything else is blocked at the queue.
+# MOUSEMOTION is left out: high-rate mice flood the queue, and hover only needs
+# the cursor position, which is polled once per frame instead.
+# Window events have no handler; like any other event they just mark the frame dirty.
+HANDLED_EVENTS = [_QUIT, _KEYDOWN, _TEXTINPUT, _MOUSEWHEEL, _MOUSEBUTTONDOWN] + WINDOW_EVENTS
+
+
+def _card_grid_origin():
+    """Top-left corner of the card grid, centered and shifted right of the menu buttons"""
     left_padding = 150
     start_x = (
         SCREEN_WIDTH - (CARDS_PER_ROW * CARD_WIDTH + (CARDS_PER_ROW - 1) * CARD_PADDING)
     ) // 2
-    start_x += left_padding
-    start_y = 150
+    return start_x + left_padding, 150
+
 
-    for row in range(2):
-        for col in range(CARDS_PER_ROW):
-            x = start_x + col * (CARD_WIDTH + CARD_PADDING)
-            y = start_y + row * (CARD_HEIGHT + CARD_PADDING)
-            positions.append((x, y))
+# Card positions (3x2 grid); the layout is fixed, so it is computed once at import
+_start_x, _start_y = _card_grid_origin()
+CARD_POSITIONS = tuple(
+    (_start_x + col * (CARD_WIDTH + CARD_PADDING), _start_y + row * (CARD_HEIGHT + CARD_PADDING))
+    for row in range(2)
+    for col in range(CARDS_PER_ROW)
+)
+del _start_x, _start_y
 
-    return positions
+
+class UIState(IntEnum):
+    """What currently has input focus"""
+    DEFAULT = 0
+    ACCUSING = 1
+    INTRO_OPEN = 2
+    ACCUSE_MODAL_OPEN = 3
+    FACTS_OPEN = 4
+    LOGS_OPEN = 5
+    CONVERSATION = 6
 
 
 class MurderMysteryGame:
@@ -59,11 +102,24 @@ class MurderMysteryGame:
         # Clock for FPS
         self.clock = pygame.time.Clock()
 
+        # Only queue the event types the game actually handles, so ignored events
+        # (mouse motion/joystick noise) never fill the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+
+        # Per-event-type handlers, looked up once per event instead of an elif chain
+        self._event_handlers = {
+            _KEYDOWN: self._on_keydown,
+            _TEXTINPUT: self._on_text_input,
+            _MOUSEBUTTONDOWN: self._on_mouse_button_down,
+        }
+
         # Initialize cursors
         init_cursors()
 
-        # Initialize Hyperspell gossip manager for this game session
-        initialize_gossip_manager()
+        # Initialize Hyperspell gossip manager for this game session.
+        # Set TUFF_COLLECTION_ID to keep one collection across runs and resume its saved state.
+        initialize_gossip_manager(os.getenv("TUFF_COLLECTION_ID"))
 
         # Game state
         self.test_mode = test_mode
@@ -74,7 +130,8 @@ class MurderMysteryGame:
         self.master = None
         self.orchestrator = None
         self.cards = []
-        self.conversation_screens = {}
+        self.conversation_screens = {}  # Filled lazily by _get_conversation on first visit
+        self._agents = {}  # Suspect name -> SuspectAgent
         self.menu_buttons = []
         self.facts_modal = None
         self.logs_modal = None
@@ -82,12 +139,20 @@ class MurderMysteryGame:
         self.introduction_modal = None
         self.background = ParallaxBackground()
         self.active_conversation = None
+        self._active_screen = None  # ConversationScreen of active_conversation, kept alongside the name
         self.in_accusation_mode = False
+        self._last_mouse_pos = (0, 0)  # Cursor position hover was last resolved at, polled once per frame
+        self._dirty = True  # Whether the screen must be redrawn this frame
+        self._scene_snapshot = None  # Scene frozen under an open modal or conversation
+        self._click_targets = []  # (rect, callback) pairs in click priority order
+        self._click_targets_state = None  # Modal/conversation state the click targets were built for
 
     def setup_game(self):
         """Initialize the game with a new case"""
         print("🔍 Setting up murder mystery case...\n")
 
+        self._render_static_text()
+
         # Generate case or load test case
         self.master = MurderMysteryMaster()
 
@@ -166,59 +231,56 @@ class MurderMysteryGame:
             ),
         ]
 
-        # Create character cards and conversation screens
-        card_positions = get_card_positions()
-        card_index = 0
+        # Create character cards and agents; conversation screens are built on first click
+        agents = []
+
+        # Suspect order is fixed for the whole game; the victim never gets a card or agent
+        self._ordered_suspects = sorted(self.master.suspects)
+        self._living_suspects = tuple(
+            name for name in self._ordered_suspects if not self.master.suspects[name]["is_victim"]
+        )
+
+        # Index relationships by suspect once instead of scanning every pair per suspect
+        relationships_by_suspect = defaultdict(dict)
+        for pair, rel_type in self.master.relationships.items():
+            name_a, name_b = pair.split("_", 1)
+            relationships_by_suspect[name_a][name_b] = rel_type
+            relationships_by_suspect[name_b][name_a] = rel_type
 
-        for suspect_name in sorted(self.master.suspects.keys()):
+        for suspect_name, (x, y) in zip(self._living_suspects, CARD_POSITIONS):
             suspect = self.master.suspects[suspect_name]
-            if not suspect["is_victim"] and card_index < len(card_positions):
-                x, y = card_positions[card_index]
-                card = CharacterCard(suspect, x, y)
-                self.cards.append(card)
-
-                # Create conversation screen and agent for this suspect
-                if not suspect["is_victim"]:
-                    # Get relationships for this suspect
-                    relationships = {}
-                    for pair, rel_type in self.master.relationships.items():
-                        names = pair.split("_")
-                        if suspect_name in names:
-                            other_name = names[0] if names[1] == suspect_name else names[1]
-                            relationships[other_name] = rel_type
-
-                    # Create agent with orchestrator for narrative coherence
-                    agent = SuspectAgent(
-                        suspect,
-                        relationships,
-                        self.master.case_state,
-                        self.master.clues,
-                        self.orchestrator,
-                    )
-
-                    # Create conversation screen
-                    # Determine chaos callback
-                    chaos_callback = None
-                    if self.chaos_mode and self.communication_manager:
-                        chaos_callback = self.communication_manager.trigger_agent_communications
-
-                    conv_screen = ConversationScreen(
-                        suspect, agent, SCREEN_WIDTH, SCREEN_HEIGHT, self.logs_modal, self.visualizer if self.visualize_mode else None, chaos_callback
-                    )
-                    self.conversation_screens[suspect_name] = conv_screen
-
-                    # Add agent to communication manager
-                    if self.communication_manager:
-                        self.communication_manager.agents[suspect_name] = agent
-
-                card_index += 1
-
-        # Update logs modal with conversation screens
+            card = CharacterCard(suspect, x, y)
+            self.cards.append(card)
+
+            # Create conversation screen and agent for this suspect
+            # Get relationships for this suspect
+            relationships = relationships_by_suspect.get(suspect_name, {})
+
+            # Create agent with orchestrator for narrative coherence
+            agent = SuspectAgent(
+                suspect,
+                relationships,
+                self.master.case_state,
+                self.master.clues,
+                self.orchestrator,
+            )
+
+            agents.append(agent)
+            self._agents[suspect_name] = agent
+
+            # Add agent to communication manager
+            if self.communication_manager:
+                self.communication_manager.agents[suspect_name] = agent
+
+        # Fetch every suspect's opening statement in one background request
+        threading.Thread(target=generate_openings, args=(agents,), daemon=True).start()
+
+        # Logs modal shares the dict, so screens created later show up in the logs too
         self.logs_modal.conversation_screens = self.conversation_screens
 
         # Send initial orchestrator briefings to all suspects (visualization of game start)
         if self.visualize_mode and self.visualizer:
-            for suspect_name in self.conversation_screens.keys():
+            for suspect_name in self._living_suspects:
                 self.visualizer.send_orchestrator_briefing(suspect_name)  # Default 180 frames = 3 seconds
 
         # Print case info to terminal
@@ -253,167 +315,273 @@ class MurderMysteryGame:
             return False
 
     def handle_events(self):
-        """Handle all game events"""
+        """Handle all game events.
+        This is the only place that touches the event queue: one pump and one drain per frame."""
+        wheel_y = 0
+
+        # Pump once, then drain the whole queue in one batch without pumping again
+        pygame.event.pump()
+        handlers = self._event_handlers
+        for event in pygame.event.get(pump=False):
+            etype = event.type
+            if etype == _MOUSEWHEEL:
+                # Wheel steps are summed and applied once after the loop
+                wheel_y += event.y
+                continue
+
+            # Any other input (or a window expose/restore) may change what is on screen
+            self._dirty = True
+            if etype == _QUIT:
+                return False
+
+            handler = handlers.get(etype)
+            if handler is not None:
+                # Handlers return None to keep draining, or a value to end the frame with
+                result = handler(event)
+                if result is not None:
+                    return result
+
+        # Scrolling only needs a redraw if the offset actually moved
+        if wheel_y and self._scroll(wheel_y):
+            self._dirty = True
+
+        # Update hover states only when the mouse actually moved this frame
         mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos != self._last_mouse_pos:
+            self._dirty = True
+            self._last_mouse_pos = mouse_pos
+            for card in self.cards:
+                card.check_hover(mouse_pos)
+            for button in self.menu_buttons:
+                button.check_hover(mouse_pos)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
+        return True
 
-            elif event.type == pygame.KEYDOWN:
-                # Handle title screen - space to continue
-                if not self.game_started and event.key == pygame.K_SPACE:
-                    self.game_started = True
-                    # Open introduction modal
-                    if self.introduction_modal:
-                        self.introduction_modal.toggle()
-                    return True
-
-                # Pass input to active conversation screen if one is open
-                if self.active_conversation:
-                    self.conversation_screens[self.active_conversation].handle_input(event)
-                    # Check if conversation was closed
-                    if not self.conversation_screens[self.active_conversation].is_open:
-                        self.active_conversation = None
-                else:
-                    # Handle general keyboard input
-                    if event.key == pygame.K_ESCAPE:
-                        # Cancel accusation mode if active
-                        if self.in_accusation_mode:
-                            self.in_accusation_mode = False
-                            set_default_cursor()
-                        # Close introduction modal if open
-                        elif self.introduction_modal and self.introduction_modal.is_open:
-                            self.introduction_modal.toggle()
-                        # Close accusation modal if open
-                        elif self.accusation_modal and self.accusation_modal.is_open:
-                            self.accusation_modal.toggle()
-                        # Close other modals if open, otherwise exit
-                        elif self.facts_modal.is_open:
-                            self.facts_modal.toggle()
-                        elif self.logs_modal.is_open:
-                            self.logs_modal.toggle()
-                        else:
-                            return False
-
-            elif event.type == pygame.TEXTINPUT:
-                # Pass text input to active conversation screen
-                if self.active_conversation:
-                    self.conversation_screens[self.active_conversation].handle_input(event)
-
-            elif event.type == pygame.MOUSEWHEEL:
-                # Handle scroll wheel for conversation or modals
-                if self.active_conversation:
-                    self.conversation_screens[self.active_conversation].handle_input(event)
-                elif self.introduction_modal and self.introduction_modal.is_open:
-                    # Scroll introduction
-                    self.introduction_modal.scroll_offset += event.y
-                    self.introduction_modal.scroll_offset = max(
-                        0, self.introduction_modal.scroll_offset
-                    )
-                elif self.accusation_modal and self.accusation_modal.is_open:
-                    # Scroll accusation results
-                    self.accusation_modal.scroll_offset += event.y
-                    self.accusation_modal.scroll_offset = max(
-                        0, self.accusation_modal.scroll_offset
-                    )
-                elif self.logs_modal.is_open:
-                    # Scroll logs
-                    self.logs_modal.scroll_offset += event.y
-                    self.logs_modal.scroll_offset = max(0, self.logs_modal.scroll_offset)
-                elif self.facts_modal.is_open:
-                    # Scroll facts
-                    self.facts_modal.scroll_offset += event.y
-                    self.facts_modal.scroll_offset = max(0, self.facts_modal.scroll_offset)
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Check for menu button clicks first (always takes priority)
-                button_clicked = False
-                for button in self.menu_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.label == "FACTS":
-                            self.facts_modal.toggle()
-                        elif button.label == "LOGS":
-                            self.logs_modal.toggle()
-                        elif button.label == "ACCUSE":
-                            set_map_frame_cursor()
-                            self.in_accusation_mode = True
-                        button_clicked = True
-                        break
-
-                # If no button was clicked, handle other interactions
-                if not button_clicked:
-                    # Handle close buttons on modals
-                    if (
-                        self.introduction_modal
-                        and self.introduction_modal.is_open
-                        and self.introduction_modal.is_close_clicked(mouse_pos)
-                    ):
-                        self.introduction_modal.toggle()
-                    elif self.facts_modal.is_open and self.facts_modal.is_close_clicked(mouse_pos):
-                        self.facts_modal.toggle()
-                    elif self.logs_modal.is_open and self.logs_modal.is_close_clicked(mouse_pos):
-                        self.logs_modal.toggle()
-                    elif (
-                        self.accusation_modal
-                        and self.accusation_modal.is_open
-                        and self.accusation_modal.is_close_clicked(mouse_pos)
-                    ):
-                        self.accusation_modal.toggle()
-                    # Handle conversation screen
-                    elif self.active_conversation:
-                        window_rect = self.conversation_screens[
-                            self.active_conversation
-                        ].get_window_rect()
-                        if not window_rect.collidepoint(mouse_pos):
-                            self.conversation_screens[self.active_conversation].toggle()
-                            self.active_conversation = None
-                    # Handle character card clicks
-                    else:
-                        for i, card in enumerate(self.cards):
-                            if card.is_clicked(mouse_pos):
-                                if self.in_accusation_mode:
-                                    # Handle accusation
-                                    accused_name = card.suspect["name"]
-                                    is_correct = accused_name == self.master.case_state["murderer"]
-
-                                    # Reset cursor
-                                    set_default_cursor()
-                                    self.in_accusation_mode = False
-
-                                    # Create and show accusation results modal
-                                    self.accusation_modal = AccusationResultsModal(
-                                        accused_name,
-                                        is_correct,
-                                        self.master,
-                                        self.orchestrator,
-                                        self.conversation_screens,
-                                    )
-                                    self.accusation_modal.toggle()
-                                else:
-                                    # Open conversation screen for this suspect
-                                    suspect_name = card.suspect["name"]
-                                    if suspect_name in self.conversation_screens:
-                                        self.active_conversation = suspect_name
-                                        self.conversation_screens[suspect_name].toggle()
-                                break
-
-        # Update hover states
-        for card in self.cards:
-            card.check_hover(mouse_pos)
-        for button in self.menu_buttons:
-            button.check_hover(mouse_pos)
+    def _on_keydown(self, event):
+        """Handle a key press"""
+        # Handle title screen - space to continue
+        if not self.game_started and event.key == _K_SPACE:
+            self.game_started = True
+            # Open introduction modal
+            if self.introduction_modal:
+                self.introduction_modal.toggle()
+            return True
 
+        state = self.ui_state
+        # Pass input to active conversation screen if one is open
+        if state == UIState.CONVERSATION:
+            self._active_screen.handle_input(event)
+            # Check if conversation was closed
+            if not self._active_screen.is_open:
+                self._close_conversation()
+        elif event.key == _K_ESCAPE:
+            return self._ESCAPE_HANDLERS[state](self)
+
+    @property
+    def ui_state(self):
+        """The topmost thing currently receiving input, in ESC priority order"""
+        if self._active_screen:
+            return UIState.CONVERSATION
+        if self.in_accusation_mode:
+            return UIState.ACCUSING
+        if self.introduction_modal and self.introduction_modal.is_open:
+            return UIState.INTRO_OPEN
+        if self.accusation_modal and self.accusation_modal.is_open:
+            return UIState.ACCUSE_MODAL_OPEN
+        if self.facts_modal.is_open:
+            return UIState.FACTS_OPEN
+        if self.logs_modal.is_open:
+            return UIState.LOGS_OPEN
+        return UIState.DEFAULT
+
+    def _escape_quit(self):
+        """ESC with nothing open exits the game"""
+        return False
+
+    def _escape_cancel_accusation(self):
+        """Cancel accusation mode"""
+        self.in_accusation_mode = False
+        set_default_cursor()
+
+    def _escape_close_introduction(self):
+        """Close the introduction modal"""
+        self.introduction_modal.toggle()
+
+    def _escape_close_accusation_modal(self):
+        """Close the accusation results modal"""
+        self.accusation_modal.toggle()
+
+    def _escape_close_facts(self):
+        """Close the facts modal"""
+        self.facts_modal.toggle()
+
+    def _escape_close_logs(self):
+        """Close the logs modal"""
+        self.logs_modal.toggle()
+
+    def _on_text_input(self, event):
+        """Pass text input to active conversation screen"""
+        if self._active_screen:
+            self._active_screen.handle_input(event)
+
+    def _scroll(self, dy):
+        """
+        Apply this frame's total wheel movement to the conversation or the topmost open modal.
+        Returns True if the scroll offset changed.
+        """
+        if self._active_screen:
+            return self._active_screen.scroll(dy)
+        if self.introduction_modal and self.introduction_modal.is_open:
+            modal = self.introduction_modal
+        elif self.accusation_modal and self.accusation_modal.is_open:
+            modal = self.accusation_modal
+        elif self.logs_modal.is_open:
+            modal = self.logs_modal
+        elif self.facts_modal.is_open:
+            modal = self.facts_modal
+        else:
+            return False
+        # Clamp to the content as well, so wheeling past the end doesn't build up hidden offset
+        offset = min(modal.max_scroll, max(0, modal.scroll_offset + dy))
+        if offset == modal.scroll_offset:
+            return False
+        modal.scroll_offset = offset
         return True
 
-    def update(self):
-        """Update game state"""
-        self.background.update()
+    def _on_mouse_button_down(self, event):
+        """Dispatch a click to the highest-priority target under the cursor"""
+        mouse_pos = event.pos
+        # Click targets are ordered by priority; the first hit wins
+        for rect, on_click in self._get_click_targets():
+            if rect.collidepoint(mouse_pos):
+                on_click()
+                return
+        # Clicking outside the conversation window closes it
+        if self._active_screen:
+            if not self._active_screen.get_window_rect().collidepoint(mouse_pos):
+                self._active_screen.toggle()
+                self._close_conversation()
+
+    def _get_click_targets(self):
+        """
+        Return the (rect, callback) click targets in priority order: menu buttons,
+        close buttons of open modals, then character cards when no conversation is open.
+        The list is only rebuilt when the set of open modals or the conversation changes.
+        """
+        modals = [self.introduction_modal, self.facts_modal, self.logs_modal, self.accusation_modal]
+        state = (tuple(modal is not None and modal.is_open for modal in modals), self.accusation_modal, self.active_conversation)
+        if state == self._click_targets_state:
+            return self._click_targets
+
+        targets = []
+        for button in self.menu_buttons:
+            targets.append((button.rect, partial(self._on_menu_button_clicked, button.label)))
+        for modal in modals:
+            if modal is not None and modal.is_open:
+                targets.append((modal.get_close_button_rect(), modal.toggle))
+        if not self.active_conversation:
+            for card in self.cards:
+                targets.append((card.rect, partial(self._on_card_clicked, card)))
+
+        self._click_targets = targets
+        self._click_targets_state = state
+        return targets
+
+    def _get_conversation(self, suspect_name):
+        """Return the suspect's conversation screen, creating it the first time it is opened"""
+        conv_screen = self.conversation_screens.get(suspect_name)
+        if conv_screen is None:
+            # Determine chaos callback
+            chaos_callback = None
+            if self.chaos_mode and self.communication_manager:
+                chaos_callback = self.communication_manager.trigger_agent_communications
+
+            conv_screen = ConversationScreen(
+                self.master.suspects[suspect_name],
+                self._agents[suspect_name],
+                SCREEN_WIDTH,
+                SCREEN_HEIGHT,
+                self.logs_modal,
+                self.visualizer if self.visualize_mode else None,
+                chaos_callback,
+            )
+            self.conversation_screens[suspect_name] = conv_screen
+        return conv_screen
+
+    def _close_conversation(self):
+        """Forget the active conversation (the screen itself is already closed)"""
+        self.active_conversation = None
+        self._active_screen = None
+
+    def _on_menu_button_clicked(self, label):
+        """Handle a click on one of the menu buttons"""
+        if label == "FACTS":
+            self.facts_modal.toggle()
+        elif label == "LOGS":
+            self.logs_modal.toggle()
+        elif label == "ACCUSE":
+            set_map_frame_cursor()
+            self.in_accusation_mode = True
+
+    def _on_card_clicked(self, card):
+        """Handle a click on a character card: accuse in accusation mode, otherwise open the conversation"""
+        if self.in_accusation_mode:
+            # Handle accusation
+            accused_name = card.suspect["name"]
+            is_correct = accused_name == self.master.case_state["murderer"]
+
+            # Reset cursor
+            set_default_cursor()
+            self.in_accusation_mode = False
+
+            # Create and show accusation results modal
+            self.accusation_modal = AccusationResultsModal(
+                accused_name,
+                is_correct,
+                self.master,
+                self.orchestrator,
+                self.conversation_screens,
+            )
+            self.accusation_modal.toggle()
+        else:
+            # Open conversation screen for this suspect
+            suspect_name = card.suspect["name"]
+            if suspect_name in self._agents:
+                self.active_conversation = suspect_name
+                self._active_screen = self._get_conversation(suspect_name)
+                self._active_screen.toggle()
+
+    def update(self, dt_ms):
+        """Update game state by dt_ms milliseconds (the value returned by clock.tick)"""
+        # The parallax scene is frozen while a modal or conversation covers it
+        if not self._overlay_active() and self.background.update(dt_ms):
+            self._dirty = True
+
+        # Let the open conversation take in replies and advance its animations
+        if self._active_screen:
+            self._active_screen.update()
 
         # Update visualization if enabled
         if self.visualize_mode and self.visualizer:
             self.visualizer.update()
 
+    def _overlay_active(self):
+        """Whether a modal or conversation is open (these animate and update from background threads)"""
+        return bool(
+            self.active_conversation
+            or (self.introduction_modal and self.introduction_modal.is_open)
+            or (self.facts_modal and self.facts_modal.is_open)
+            or (self.logs_modal and self.logs_modal.is_open)
+            or (self.accusation_modal and self.accusation_modal.is_open)
+        )
+
+    def _needs_redraw(self):
+        """
+        Skip frames where nothing visible changed: no input, no whole-pixel
+        background movement, and nothing animating on top.
+        """
+        return self._dirty or self._overlay_active() or (self.visualize_mode and self.visualizer is not None)
+
     def draw(self):
         """Draw all game elements"""
         # If game hasn't started, show title screen
@@ -421,22 +589,16 @@ class MurderMysteryGame:
             self._draw_title_screen()
             return
 
-        # Draw background
-        self.background.draw(self.screen)
-
-        # Draw title
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("Murder At Bly Manor", True, WHITE)
-        title_x = (SCREEN_WIDTH - title_text.get_width()) // 2
-        self.screen.blit(title_text, (title_x, 30))
-
-        # Draw menu buttons
-        for button in self.menu_buttons:
-            button.draw(self.screen)
-
-        # Draw character cards
-        for card in self.cards:
-            card.draw(self.screen)
+        if self._overlay_active():
+            # Reuse a snapshot of the scene underneath instead of re-running the parallax
+            if self._scene_snapshot is None:
+                self._draw_scene()
+                self._scene_snapshot = self.screen.copy()
+            else:
+                self.screen.blit(self._scene_snapshot, (0, 0))
+        else:
+            self._scene_snapshot = None
+            self._draw_scene()
 
         # Draw modals on top
         self.introduction_modal.draw(self.screen)
@@ -446,8 +608,8 @@ class MurderMysteryGame:
             self.accusation_modal.draw(self.screen)
 
         # Draw active conversation screen
-        if self.active_conversation:
-            self.conversation_screens[self.active_conversation].draw(self.screen)
+        if self._active_screen:
+            self._active_screen.draw(self.screen)
 
         # Draw visualization if enabled
         if self.visualize_mode and self.visualizer:
@@ -456,38 +618,73 @@ class MurderMysteryGame:
         # Update display
         pygame.display.flip()
 
-    def _draw_title_screen(self):
-        """Draw the title screen with game title and continue prompt"""
+    # What ESC does in each UI state (the conversation screen handles its own ESC)
+    _ESCAPE_HANDLERS = {
+        UIState.DEFAULT: _escape_quit,
+        UIState.ACCUSING: _escape_cancel_accusation,
+        UIState.INTRO_OPEN: _escape_close_introduction,
+        UIState.ACCUSE_MODAL_OPEN: _escape_close_accusation_modal,
+        UIState.FACTS_OPEN: _escape_close_facts,
+        UIState.LOGS_OPEN: _escape_close_logs,
+    }
+
+    def _draw_scene(self):
+        """Draw the background, title, menu buttons and character cards"""
         # Draw background
         self.background.draw(self.screen)
 
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # Draw title
+        self.screen.blit(self._title_surface, self._title_pos)
 
-        # Load and render title with raster forge font
+        # Draw menu buttons
+        for button in self.menu_buttons:
+            button.draw(self.screen)
+
+        # Draw character cards
+        for card in self.cards:
+            card.draw(self.screen)
+
+    def _render_static_text(self):
+        """Render the text and overlays that never change, so draw() only blits them"""
+        # In-game title
+        self._title_surface = pygame.font.Font(None, 48).render("Murder At Bly Manor", True, WHITE)
+        self._title_pos = ((SCREEN_WIDTH - self._title_surface.get_width()) // 2, 30)
+
+        # Title screen: semi-transparent overlay
+        self._title_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._title_overlay.set_alpha(150)
+        self._title_overlay.fill(BLACK)
+
+        # Title screen: title with raster forge font
         try:
             title_font = pygame.font.Font(
                 "assets/raster-forge-font/RasterForgeRegular-JpBgm.ttf", 96
             )
-            title_text = title_font.render("Murder at Bly Manor", True, WHITE)
         except:
             # Fallback if font not found
             title_font = pygame.font.Font(None, 96)
-            title_text = title_font.render("Murder at Bly Manor", True, WHITE)
+        self._title_screen_surface = title_font.render("Murder at Bly Manor", True, WHITE)
+        title_x = (SCREEN_WIDTH - self._title_screen_surface.get_width()) // 2
+        title_y = (SCREEN_HEIGHT - self._title_screen_surface.get_height()) // 2 - 100
+        self._title_screen_pos = (title_x, title_y)
+
+        # Title screen: continue prompt
+        self._continue_surface = pygame.font.Font(None, 32).render(
+            "Press SPACE to continue", True, LIGHT_GRAY
+        )
+        continue_x = (SCREEN_WIDTH - self._continue_surface.get_width()) // 2
+        continue_y = title_y + self._title_screen_surface.get_height() + 150
+        self._continue_pos = (continue_x, continue_y)
 
-        title_x = (SCREEN_WIDTH - title_text.get_width()) // 2
-        title_y = (SCREEN_HEIGHT - title_text.get_height()) // 2 - 100
-        self.screen.blit(title_text, (title_x, title_y))
+    def _draw_title_screen(self):
+        """Draw the title screen with game title and continue prompt"""
+        # Draw background
+        self.background.draw(self.screen)
 
-        # Draw continue prompt
-        continue_font = pygame.font.Font(None, 32)
-        continue_text = continue_font.render("Press SPACE to continue", True, LIGHT_GRAY)
-        continue_x = (SCREEN_WIDTH - continue_text.get_width()) // 2
-        continue_y = title_y + title_text.get_height() + 150
-        self.screen.blit(continue_text, (continue_x, continue_y))
+        # Overlay, title and continue prompt are pre-rendered in _render_static_text
+        self.screen.blit(self._title_overlay, (0, 0))
+        self.screen.blit(self._title_screen_surface, self._title_screen_pos)
+        self.screen.blit(self._continue_surface, self._continue_pos)
 
         # Update display
         pygame.display.flip()
@@ -505,10 +702,15 @@ class MurderMysteryGame:
         # Main game loop
         running = True
         while running:
-            self.clock.tick(FPS)
+            # Events are pumped exactly once per rendered frame (in handle_events); SDL
+            # coalesces input between frames, so nothing else may call pygame.event.*
+            dt_ms = self.clock.tick(FPS)
             running = self.handle_events()
-            self.update()
-            self.draw()
+            self.update(dt_ms)
+            if self._needs_redraw():
+                self.draw()
+                self._dirty = False
 
+        close_openai_client()
         pygame.quit()
         sys.exit()
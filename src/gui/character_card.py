@@ -3,94 +3,77 @@ Character card display component
 """
 import pygame
 from src.config import *
+from src.utils.portraits import get_portrait
+from src.utils.fonts import get_font
 
 
 class CharacterCard:
+    # Fixed attribute set: smaller instances and faster attribute reads in the draw/hover loop
+    __slots__ = (
+        "suspect", "x", "y", "width", "height", "rect", "is_hovered", "_pos",
+        "portrait", "_surface_idle", "_surface_hover",
+    )
+
     def __init__(self, suspect_data, x, y):
         self.suspect = suspect_data
         self.x = x
         self.y = y
         self.width = CARD_WIDTH
         self.height = CARD_HEIGHT
+        self.rect = pygame.Rect(x, y, self.width, self.height)  # Hit-test area for hover and clicks
         self.is_hovered = False
+        self._pos = (x, y)  # Absolute screen position the pre-rendered card is blitted at
 
-        # Load portrait
-        portrait_path = CHARACTER_PORTRAITS.get(
-            self.suspect["name"], "assets/potrait/PNG/Transperent/Icon1.png"
-        )
-        try:
-            self.portrait = pygame.image.load(portrait_path)
-            self.portrait = pygame.transform.scale(self.portrait, (150, 150))
-        except:
-            self.portrait = None
+        # Portrait comes from the shared atlas (the default portrait if this character has none)
+        self.portrait = get_portrait(self.suspect["name"]) or get_portrait("James")
 
-        # Create fonts
-        self.name_font = pygame.font.Font(None, 28)
-        self.info_font = pygame.font.Font(None, 20)
+        # Nothing on the card changes after construction except the hover state,
+        # so both variants are rendered once and draw() is a single blit
+        name_font = get_font(None, 28)
+        info_font = get_font(None, 20)
+        self._surface_idle = self._render_card(False, name_font, info_font)
+        self._surface_hover = self._render_card(True, name_font, info_font)
 
-    def check_hover(self, mouse_pos):
-        """Check if mouse is hovering over this card"""
-        mouse_x, mouse_y = mouse_pos
-        self.is_hovered = (
-            self.x <= mouse_x <= self.x + self.width and self.y <= mouse_y <= self.y + self.height
-        )
-
-    def is_clicked(self, mouse_pos):
-        """Check if this card was clicked"""
-        mouse_x, mouse_y = mouse_pos
-        return (
-            self.x <= mouse_x <= self.x + self.width and self.y <= mouse_y <= self.y + self.height
-        )
-
-    def draw(self, surface):
-        """Draw the character card"""
-        # Create semi-transparent background
-        card_surface = pygame.Surface((self.width, self.height))
-        card_surface.set_alpha(240 if not self.is_hovered else 255)
-        card_surface.fill((40, 40, 50))
+    def _render_card(self, hovered, name_font, info_font):
+        """Render the complete card (background, border, portrait and text) onto one surface"""
+        card_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        card_surface.fill((40, 40, 50, 255 if hovered else 240))
 
         # Draw card border - changes color on hover
-        border_color = (100, 150, 200) if self.is_hovered else (70, 70, 80)
+        border_color = (100, 150, 200) if hovered else (70, 70, 80)
         pygame.draw.rect(card_surface, border_color, (0, 0, self.width, self.height), 3)
 
-        # Blit the card surface to the main surface
-        surface.blit(card_surface, (self.x, self.y))
-
         # Draw portrait
+        portrait_x = (self.width - 150) // 2
         if self.portrait:
-            portrait_x = self.x + (self.width - 150) // 2
-            portrait_y = self.y + 20
-            surface.blit(self.portrait, (portrait_x, portrait_y))
+            atlas, source_rect = self.portrait
+            card_surface.blit(atlas, (portrait_x, 20), source_rect)
         else:
             # Draw placeholder if portrait not found
-            placeholder_rect = pygame.Rect(
-                self.x + (self.width - 150) // 2, self.y + 20, 150, 150
-            )
-            pygame.draw.rect(surface, DARK_GRAY, placeholder_rect)
-            pygame.draw.rect(surface, LIGHT_GRAY, placeholder_rect, 2)
+            placeholder_rect = pygame.Rect(portrait_x, 20, 150, 150)
+            pygame.draw.rect(card_surface, DARK_GRAY, placeholder_rect)
+            pygame.draw.rect(card_surface, LIGHT_GRAY, placeholder_rect, 2)
+
+        # Draw name, age, occupation and gender centered on the card
+        text_lines = [
+            (name_font.render(self.suspect["name"], True, WHITE), 180),
+            (info_font.render(f"{self.suspect['age']} years old", True, LIGHT_GRAY), 220),
+            (info_font.render(self.suspect["occupation"], True, LIGHT_GRAY), 245),
+            (info_font.render(self.suspect["gender"], True, (150, 150, 160)), 270),
+        ]
+        for text_surface, text_y in text_lines:
+            card_surface.blit(text_surface, ((self.width - text_surface.get_width()) // 2, text_y))
 
-        # Draw name
-        name_surface = self.name_font.render(self.suspect["name"], True, WHITE)
-        name_x = self.x + (self.width - name_surface.get_width()) // 2
-        name_y = self.y + 180
-        surface.blit(name_surface, (name_x, name_y))
+        return card_surface.convert_alpha()
 
-        # Draw age and occupation
-        info_text = f"{self.suspect['age']} years old"
-        info_surface = self.info_font.render(info_text, True, LIGHT_GRAY)
-        info_x = self.x + (self.width - info_surface.get_width()) // 2
-        info_y = self.y + 220
-        surface.blit(info_surface, (info_x, info_y))
+    def check_hover(self, mouse_pos):
+        """Check if mouse is hovering over this card"""
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
 
-        occupation_surface = self.info_font.render(
-            self.suspect["occupation"], True, LIGHT_GRAY
-        )
-        occupation_x = self.x + (self.width - occupation_surface.get_width()) // 2
-        occupation_y = self.y + 245
-        surface.blit(occupation_surface, (occupation_x, occupation_y))
+    def is_clicked(self, mouse_pos):
+        """Check if this card was clicked"""
+        return self.rect.collidepoint(mouse_pos)
 
-        # Draw gender
-        gender_surface = self.info_font.render(self.suspect["gender"], True, (150, 150, 160))
-        gender_x = self.x + (self.width - gender_surface.get_width()) // 2
-        gender_y = self.y + 270
-        surface.blit(gender_surface, (gender_x, gender_y))
\ No newline at end of file
+    def draw(self, surface):
+        """Draw the character card"""
+        surface.blit(self._surface_hover if self.is_hovered else self._surface_idle, self._pos)
@@ -2,9 +2,65 @@
 Conversation screen for interviewing suspects
 """
 import pygame
-import threading
 import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from src.config import *
+from src.utils.portraits import get_portrait
+from src.utils.image_cache import load_scaled
+from src.utils.fonts import get_font, render_text
+from src.agents.env import load_environment
+
+# Maximum number of question -> response pairs remembered per conversation screen
+RESPONSE_CACHE_SIZE = 256
+
+# Persistent worker pools instead of a new thread per request. Suspect replies and log
+# snippets use separate pools so a backlog of snippets never delays a reply.
+_request_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="conversation")
+_snippet_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="snippet")
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+# Questions most interrogations start with. With TUFF_PREFETCH=1 their answers are prefetched
+# once the player has been idle for a moment, but only before the first question is sent
+PREFETCH_QUESTIONS = (
+    "Where were you at the time of the murder?",
+    "How well did you know the victim?",
+    "Did you see or hear anything unusual that night?",
+)
+
+
+# Frames without typing before prefetching starts (~300 ms at 60 FPS)
+PREFETCH_IDLE_FRAMES = 18
+
+
+def _prefetch_enabled():
+    """Speculative requests cost API calls, so they are opt-in with TUFF_PREFETCH=1 (read after .env is loaded)"""
+    load_environment()
+    return os.getenv("TUFF_PREFETCH", "0") == "1"
+
+
+# Maximum number of pre-rendered bubble backgrounds kept per conversation screen
+BUBBLE_CACHE_SIZE = 128
+
+# Highest personality trait level (one progress bar per level)
+MAX_TRAIT_LEVEL = 5
+
+# Width of the suspect info panel on the left of the window
+INFO_WIDTH = 250
+
+
+class _PreparedMessage:
+    """A chat message with its bubble and wrapped text already rendered into one surface"""
+    __slots__ = ('speaker', 'text', 'is_player', 'surface', 'x', 'width', 'height')
+
+    def __init__(self, speaker, text, is_player, surface, x):
+        self.speaker = speaker
+        self.text = text
+        self.is_player = is_player
+        self.surface = surface
+        self.x = x
+        self.width, self.height = surface.get_size()
 
 
 class ConversationScreen:
@@ -20,6 +76,18 @@ class ConversationScreen:
         self.last_question = None  # Track the last question asked
         self.last_response = None  # Track the last response received
 
+        # Semi-transparent background dimming the scene behind the window
+        self._overlay = pygame.Surface((screen_width, screen_height))
+        self._overlay.set_alpha(50)
+        self._overlay.fill((0, 0, 0))
+
+        # KEYDOWN handlers by key
+        self._key_handlers = {
+            pygame.K_RETURN: self._on_return,
+            pygame.K_BACKSPACE: self._on_backspace,
+            pygame.K_ESCAPE: self._on_escape,
+        }
+
         # Conversation history
         self.messages = []
         self.user_input = ""
@@ -30,13 +98,20 @@ class ConversationScreen:
         self.loading_dots_frame = 0
         self.loading_timer = 0
         self.loading_message = None
-        self.pending_response = None
+        # (is_opening, text) pairs handed from worker threads to update(): the opening
+        # statement or a finished reply
+        self._inbox = queue.Queue()
+        self.streaming_response = ""  # Reply text received so far while the suspect is answering
+
+        # Prefetching waits for the player to stop typing and is dropped once a question is sent
+        self._prefetch_pending = False
+        self._idle_frames = 0
 
         # Cache for opening statement
         self.opening_statement = None
 
-        # Cache for responses (question -> response mapping)
-        self.response_cache = {}
+        # Cache for responses (question -> response mapping), least recently used evicted first
+        self.response_cache = OrderedDict()
 
         # Track if conversation has been started
         self.conversation_started = False
@@ -46,38 +121,58 @@ class ConversationScreen:
 
         # Track personality changes for animation
         self.last_personality_state = agent.get_personality_state().copy()
-        self.personality_changes = {}  # Maps trait -> (change_value, frame_count)
+        self.personality_changes = {}  # Maps trait -> [change_value, frames_left], counted down in place
         self.change_animation_frames = 180  # 180 frames = 3 seconds at 60 FPS
 
         # Scroll tracking for conversation
         self.scroll_offset = 0  # How many messages to skip from the top
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.text_font = pygame.font.Font(None, 18)
-        self.input_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(None, 36)
+        self.text_font = get_font(None, 18)
+        self.input_font = get_font(None, 20)
+
+        self._wrap_cache = {}  # (message, max_width) -> (lines, max_line_width)
+
+        # Text that never changes is rendered once up front
+        self._name_surface = self.title_font.render(self.suspect["name"], True, WHITE)
+        self._traits_title_surface = self.text_font.render("Personality Traits:", True, LIGHT_GRAY)
+        self._close_surface = self.text_font.render("Press ESC to close", True, LIGHT_GRAY)
+        self._placeholder_surface = self.input_font.render("(waiting for response...)", True, (100, 100, 100))
+
+        self._compute_layout()
+        self._build_frame_surfaces()
+        self._bubble_cache = OrderedDict()  # (width, height, color) -> bubble surface
+        self._prepared_messages = []  # One _PreparedMessage per entry in self.messages
+
+        # Traits are fixed for the suspect, so their labels and bar positions are prepared once
+        self._trait_names = tuple(agent.get_personality_state())
+        self._trait_name_surfaces = [
+            self.text_font.render(f"{trait}:", True, LIGHT_GRAY) for trait in self._trait_names
+        ]
+        self._bar_xs = tuple(self.info_x + 140 + i * 18 for i in range(MAX_TRAIT_LEVEL + 1))
+
+        # Pre-rendered message pane, redrawn only when its contents change. It reaches down to
+        # the bottom of the screen so long bubbles overflow the conversation box as before.
+        self._pane_surface = pygame.Surface(
+            (self.conv_rect.width, screen_height - self.conv_rect.y), pygame.SRCALPHA
+        )
+        self._pane_key = None
 
         # Load portrait
-        portrait_path = CHARACTER_PORTRAITS.get(suspect_data["name"])
-        if portrait_path and os.path.exists(portrait_path):
-            self.portrait = pygame.image.load(portrait_path)
-            self.portrait = pygame.transform.scale(self.portrait, (150, 150))
-        else:
-            self.portrait = None
+        self.portrait = get_portrait(suspect_data["name"])  # (atlas, source_rect) or None
 
-        # Load progress bar image
+        # Load progress bar image (shared across conversation screens)
         progress_bar_path = "assets/progress/PNG/GUI-Kit-Pack-Free_04.png"
         if os.path.exists(progress_bar_path):
-            self.progress_bar = pygame.image.load(progress_bar_path)
-            self.progress_bar = pygame.transform.scale(self.progress_bar, (15, 20))
+            self.progress_bar = load_scaled(progress_bar_path, (15, 20))
         else:
             self.progress_bar = None
 
         # Load level 0 icon (slim version)
         level_zero_icon_path = "assets/progress/PNG/GUI-Kit-Pack-Free_01.png"
         if os.path.exists(level_zero_icon_path):
-            self.level_zero_icon = pygame.image.load(level_zero_icon_path)
-            self.level_zero_icon = pygame.transform.scale(self.level_zero_icon, (6, 20))
+            self.level_zero_icon = load_scaled(level_zero_icon_path, (6, 20))
         else:
             self.level_zero_icon = None
 
@@ -87,83 +182,120 @@ class ConversationScreen:
         if self.is_open and not self.conversation_started:
             self.conversation_started = True
             # Fetch opening statement asynchronously
-            thread = threading.Thread(target=self._fetch_opening_statement)
-            thread.daemon = True
-            thread.start()
-
-    def _fetch_opening_statement(self):
-        """Fetch opening statement from the agent"""
-        try:
-            statement = self.agent.get_opening_statement()
-            self.opening_statement = statement
+            # Opening statements are preloaded at game start, so usually this needs no request
+            statement = self.agent.get_cached_opening_statement()
             if statement:
-                self.messages.append((self.suspect["name"], statement))
+                self._add_opening_statement(statement)
+            else:
+                _request_executor.submit(self._fetch_opening_statement)
 
-                # Send interaction to visualizer
-                if self.visualizer:
-                    self.visualizer.send_interaction(self.suspect["name"], duration=180)
+            # The usual opening questions are answered in update() once the player is idle
+            self._prefetch_pending = _prefetch_enabled()
+            self._idle_frames = 0
 
-                # Generate snippet for logs
-                if self.logs_modal:
-                    thread = threading.Thread(
-                        target=self.logs_modal.generate_snippet_for_suspect,
-                        args=(self.suspect["name"], self),
-                    )
-                    thread.daemon = True
-                    thread.start()
+    def _fetch_opening_statement(self):
+        """Fetch opening statement from the agent (worker thread); update() adds it"""
+        try:
+            self._inbox.put((True, self.agent.get_opening_statement()))
         except Exception as e:
             print(f"Error getting opening statement: {e}")
 
+    def _add_opening_statement(self, statement):
+        """Show the opening statement and log it. Main thread only."""
+        self.opening_statement = statement
+        if statement:
+            self.messages.append((self.suspect["name"], statement))
+
+            # Send interaction to visualizer
+            if self.visualizer:
+                self.visualizer.send_interaction(self.suspect["name"], duration=180)
+
+            # Generate snippet for logs
+            if self.logs_modal:
+                _snippet_executor.submit(
+                    self.logs_modal.generate_snippet_for_suspect, self.suspect["name"], self
+                )
+
     def handle_input(self, event):
         """Handle keyboard input and scroll for conversation"""
         if not self.is_open:
             return
 
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RETURN:
-                # Send message
-                if self.user_input.strip() and not self.is_loading:
-                    self.messages.append(("You", self.user_input))
-                    self.loading_message = self.user_input
-                    self.last_question = self.user_input  # Track for chaos mode
-                    self.user_input = ""
-                    self.is_loading = True
-                    self.loading_timer = 0
-                    self.loading_dots_frame = 0
-                    # Reset scroll to bottom when new message sent
-                    self.scroll_offset = 0
-
-                    # Start API call in background thread
-                    thread = threading.Thread(target=self._fetch_response_async)
-                    thread.daemon = True
-                    thread.start()
-            elif event.key == pygame.K_BACKSPACE:
-                self.user_input = self.user_input[:-1]
-            elif event.key == pygame.K_ESCAPE:
-                # Trigger chaos mode callback if enabled and conversation had exchanges
-                if self.chaos_callback and self.last_question and self.last_response:
-                    self.chaos_callback(self.suspect["name"], self.last_question, self.last_response)
-                self.is_open = False
-        elif event.type == pygame.TEXTINPUT:
+        event_type = event.type
+        if event_type in (pygame.KEYDOWN, pygame.TEXTINPUT):
+            self._idle_frames = 0
+        if event_type == pygame.KEYDOWN:
+            handler = self._key_handlers.get(event.key)
+            if handler is not None:
+                handler()
+        elif event_type == pygame.TEXTINPUT:
             if len(self.user_input) < 100 and not self.is_loading:  # Limit input length
                 self.user_input += event.text
-        elif event.type == pygame.MOUSEWHEEL:
-            # Handle scroll wheel - scroll up to see older messages
-            self.scroll_offset += event.y  # Positive y = scroll up (show older), negative = scroll down (show newer)
-            max_scroll = len(self.messages) - 1
-            self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
+        elif event_type == pygame.MOUSEWHEEL:
+            self.scroll(event.y)
+
+    def _on_return(self):
+        """Send the typed message"""
+        if self.user_input.strip() and not self.is_loading:
+            # Prefetched answers only fit the opening of a conversation
+            self._prefetch_pending = False
+            self.messages.append(("You", self.user_input))
+            self.loading_message = self.user_input
+            self.last_question = self.user_input  # Track for chaos mode
+            self.user_input = ""
+            self.is_loading = True
+            self.loading_timer = 0
+            self.loading_dots_frame = 0
+            # Reset scroll to bottom when new message sent
+            self.scroll_offset = 0
+
+            # Start API call in background thread
+            _request_executor.submit(self._fetch_response_async)
+
+    def _on_backspace(self):
+        """Delete the last typed character"""
+        self.user_input = self.user_input[:-1]
+
+    def _on_escape(self):
+        """Close the conversation"""
+        # Trigger chaos mode callback if enabled and conversation had exchanges
+        if self.chaos_callback and self.last_question and self.last_response:
+            self.chaos_callback(self.suspect["name"], self.last_question, self.last_response)
+        self.is_open = False
+
+    def scroll(self, dy):
+        """
+        Scroll the message history by dy steps (positive = older messages).
+        Returns True if the scroll offset changed.
+        """
+        # Positive y = scroll up (show older), negative = scroll down (show newer)
+        max_scroll = len(self.messages) - 1
+        offset = max(0, min(self.scroll_offset + dy, max_scroll))
+        changed = offset != self.scroll_offset
+        self.scroll_offset = offset
+        return changed
 
     def _fetch_response_async(self):
         """Fetch response from agent in background thread"""
         try:
             # Check if response is cached
             if self.loading_message in self.response_cache:
-                self.pending_response = self.response_cache[self.loading_message]
+                self.response_cache.move_to_end(self.loading_message)
+                self._inbox.put((False, self.response_cache[self.loading_message]))
             else:
                 # Get response from agent and cache it
-                response, personality_changes = self.agent.respond(self.loading_message)
-                self.pending_response = response
+                # Stream the reply so the loading bubble can show it as it arrives
+                stream = self.agent.respond_stream(self.loading_message)
+                while True:
+                    try:
+                        self.streaming_response += next(stream)
+                    except StopIteration as done:
+                        response, personality_changes = done.value
+                        break
+                self._inbox.put((False, response))
                 self.response_cache[self.loading_message] = response
+                if len(self.response_cache) > RESPONSE_CACHE_SIZE:
+                    self.response_cache.popitem(last=False)
 
                 # Send conversation trace to visualizer
                 if self.visualizer:
@@ -180,17 +312,276 @@ class ConversationScreen:
                     )
 
         except Exception as e:
-            self.pending_response = f"Error getting response: {str(e)}"
+            self._inbox.put((False, f"Error getting response: {str(e)}"))
         finally:
             self.is_loading = False
+            self.streaming_response = ""
+
+    def _wrap_message(self, message, max_width):
+        """
+        Word-wrap a message to max_width pixels.
+        Returns (lines, max_line_width); results are memoized by (message, max_width).
+        """
+        key = (message, max_width)
+        wrapped = self._wrap_cache.get(key)
+        if wrapped is not None:
+            return wrapped
+
+        words = message.split()
+        lines = []
+        current_line = ""
+        max_line_width = 0
+
+        # Font.size only looks up glyph metrics, so nothing is rasterized while measuring
+        text_size = self.text_font.size
+        for word in words:
+            test_line = current_line + word + " " if current_line else word + " "
+            if text_size(test_line.rstrip())[0] > max_width and current_line:
+                max_line_width = max(max_line_width, text_size(current_line.rstrip())[0])
+                lines.append(current_line.rstrip())
+                current_line = word + " "
+            else:
+                current_line = test_line
 
-    def get_window_rect(self):
-        """Get the rectangle of the conversation window"""
+        if current_line:
+            max_line_width = max(max_line_width, text_size(current_line.rstrip())[0])
+            lines.append(current_line.rstrip())
+
+        wrapped = (lines, max_line_width)
+        self._wrap_cache[key] = wrapped
+        return wrapped
+
+    def _compute_layout(self):
+        """Work out the fixed window, panel and text positions for the current screen size"""
         window_width = int(self.screen_width * 0.85)
         window_height = int(self.screen_height * 0.90)
         window_x = (self.screen_width - window_width) // 2
         window_y = (self.screen_height - window_height) // 2
-        return pygame.Rect(window_x, window_y, window_width, window_height)
+        self.window_rect = pygame.Rect(window_x, window_y, window_width, window_height)
+
+        # Suspect info section (left side)
+        self.info_x = window_x + 20
+        self.info_y = window_y + 20
+        self.portrait_pos = (self.info_x + (INFO_WIDTH - 150) // 2, self.info_y)
+        self.name_pos = (self.info_x + (INFO_WIDTH - self._name_surface.get_width()) // 2, self.info_y + 170)
+
+        # Conversation section (right side) and the input box below it
+        self.conv_rect = pygame.Rect(
+            window_x + INFO_WIDTH + 40, window_y + 20, window_width - INFO_WIDTH - 60, window_height - 120
+        )
+        self.input_rect = pygame.Rect(self.conv_rect.x, window_y + window_height - 60, self.conv_rect.width, 40)
+        self.close_pos = (
+            window_x + (window_width - self._close_surface.get_width()) // 2,
+            window_y + window_height - 25,
+        )
+
+    def _build_frame_surfaces(self):
+        """Pre-render the static window frame (with the conversation box) and the input box"""
+        window = pygame.Surface(self.window_rect.size)
+        window.fill(DARK_GRAY)
+        conv_box = self.conv_rect.move(-self.window_rect.x, -self.window_rect.y)
+        # One lock for the whole run of primitives instead of one per draw call
+        window.lock()
+        try:
+            pygame.draw.rect(window, ACCENT_COLOR, window.get_rect(), 3)
+            pygame.draw.rect(window, (40, 40, 40), conv_box)
+            pygame.draw.rect(window, LIGHT_GRAY, conv_box, 2)
+        finally:
+            window.unlock()
+        self._window_surface = window.convert()
+
+        input_box = pygame.Surface(self.input_rect.size)
+        input_box.fill((60, 60, 60))
+        pygame.draw.rect(input_box, LIGHT_GRAY, input_box.get_rect(), 2)
+        self._input_box_surface = input_box.convert()
+
+    def _bubble_surface(self, width, height, color):
+        """Rounded message bubble with a light border, rendered once per (size, color)"""
+        key = (width, height, color)
+        bubble = self._bubble_cache.get(key)
+        if bubble is not None:
+            self._bubble_cache.move_to_end(key)
+            return bubble
+        bubble = pygame.Surface((width, height), pygame.SRCALPHA)
+        bubble.lock()
+        try:
+            pygame.draw.rect(bubble, color, (0, 0, width, height), border_radius=10)
+            pygame.draw.rect(bubble, LIGHT_GRAY, (0, 0, width, height), 2, border_radius=10)
+        finally:
+            bubble.unlock()
+        self._bubble_cache[key] = bubble
+        if len(self._bubble_cache) > BUBBLE_CACHE_SIZE:
+            self._bubble_cache.popitem(last=False)
+        return bubble
+
+    def get_window_rect(self):
+        """Get the rectangle of the conversation window"""
+        return self.window_rect
+
+    def update(self):
+        """Per-frame state changes: advance the animations and take in finished replies"""
+        # Count down trait-change animations in place; finished ones are dropped
+        if self.personality_changes:
+            for trait, animation in list(self.personality_changes.items()):
+                animation[1] -= 1
+                if animation[1] <= 0:
+                    del self.personality_changes[trait]
+
+        if self.is_loading:
+            self.loading_timer += 1
+            if self.loading_timer >= 8:  # Change dots every 8 frames
+                self.loading_timer = 0
+                self.loading_dots_frame = (self.loading_dots_frame + 1) % 3
+
+        # Answer the usual opening questions in the background once the player pauses
+        if self._prefetch_pending:
+            self._idle_frames += 1
+            if self._idle_frames >= PREFETCH_IDLE_FRAMES:
+                self._prefetch_pending = False
+                for question in PREFETCH_QUESTIONS:
+                    _prefetch_executor.submit(self.agent.prefetch, question)
+
+        # Add the opening statement and replies that arrived since the last frame
+        while True:
+            try:
+                is_opening, response = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            if is_opening:
+                self._add_opening_statement(response)
+                continue
+            self.messages.append((self.suspect["name"], response))
+
+            # Track the last response for chaos mode
+            self.last_response = response
+
+            # Jump to the newest message
+            self.scroll_offset = 0
+
+            # Detect personality changes and track them for animation
+            current_state = self.agent.get_personality_state()
+            personality_updated = False
+            for trait, new_level in current_state.items():
+                old_level = self.last_personality_state.get(trait, new_level)
+                change = new_level - old_level
+                if change != 0:
+                    self.personality_changes[trait] = [change, self.change_animation_frames]
+                    personality_updated = True
+                self.last_personality_state[trait] = new_level
+
+            # Send personality update to visualizer
+            if personality_updated and self.visualizer:
+                self.visualizer.send_personality_update(self.suspect["name"], current_state)
+                # Also show feedback loop to orchestrator
+                self.visualizer.send_feedback_to_orchestrator(self.suspect["name"])  # Default 180 frames = 3 seconds
+
+            # Generate snippet for logs in background thread
+            if self.logs_modal:
+                _snippet_executor.submit(
+                    self.logs_modal.generate_snippet_for_suspect, self.suspect["name"], self
+                )
+
+        # Render bubbles for new messages here, on the main thread, so draw only blits them
+        self._prepare_new_messages()
+
+    def _prepare_message(self, speaker, message):
+        """Lay out a message and render its bubble and text into a single surface, once"""
+        conv_width = self.conv_rect.width
+        is_player = speaker == "You"
+
+        # Determine bubble position and color first
+        if is_player:
+            # Player message - right side, blue
+            bubble_color = (100, 150, 255)
+            text_color = BLACK
+            left_margin = 100  # Player messages on right, so large left margin
+            right_margin = 5  # Minimal right padding for player messages
+        else:
+            # Suspect message - left side, gray with padding on right
+            bubble_color = (80, 80, 80)
+            text_color = WHITE
+            left_margin = 20
+            right_margin = 100  # Received messages have padding on right
+
+        # Wrap text based on actual rendered width with dynamic bubble width
+        bubble_padding = 10
+        line_height = 20
+        max_bubble_width = conv_width - left_margin - right_margin
+        lines, max_line_width = self._wrap_message(message, max_bubble_width - (bubble_padding * 2))
+
+        # Calculate dynamic bubble width based on content (tight fit)
+        dynamic_width = max_line_width + (bubble_padding * 2)
+        bubble_width = min(dynamic_width, max_bubble_width)
+        bubble_height = len(lines) * line_height + bubble_padding * 2
+
+        # Determine bubble x position
+        if is_player:
+            # Player messages on right side - close to the right edge
+            bubble_x = conv_width - bubble_width - 20
+        else:
+            # Suspect messages on left side
+            bubble_x = left_margin
+
+        # Bubble background with the wrapped lines drawn on top
+        bubble = self._bubble_surface(bubble_width, bubble_height, bubble_color).copy()
+        line_blits = []
+        text_y = bubble_padding
+        for line in lines:
+            line_text = self.text_font.render(line, True, text_color)
+            if is_player:
+                # Right-align player messages with padding on right
+                text_x = bubble_width - bubble_padding - line_text.get_width()
+            else:
+                # Left-align suspect messages with dynamic padding
+                text_x = bubble_padding
+            line_blits.append((line_text, (text_x, text_y)))
+            text_y += line_height
+        bubble.blits(line_blits, doreturn=False)
+
+        return _PreparedMessage(speaker, message, is_player, bubble, bubble_x)
+
+    def _prepare_new_messages(self):
+        """Prepare bubbles for messages added since the last frame"""
+        prepared = self._prepared_messages
+        while len(prepared) < len(self.messages):
+            speaker, message = self.messages[len(prepared)]
+            prepared.append(self._prepare_message(speaker, message))
+
+    def _render_pane(self, start_index, count, loading_text):
+        """Render the message bubbles (and the loading bubble, if any) onto the cached pane surface"""
+        pane = self._pane_surface
+        pane.fill((0, 0, 0, 0))
+        blit_list = []
+        message_y = 10
+
+        # Each message is already a finished bubble, so the pane is one blit per message
+        for message in self._prepared_messages[start_index:start_index + count]:
+            blit_list.append((message.surface, (message.x, message_y)))
+            message_y += message.height + 10
+
+        # Draw loading bubble if currently loading
+        if loading_text is not None:
+            # Calculate bubble size for loading message
+            bubble_padding = 10
+            line_height = 20
+            loading_surface = render_text(self.text_font, loading_text, WHITE)
+            bubble_height = line_height + bubble_padding * 2
+            bubble_width = loading_surface.get_width() + bubble_padding * 2
+
+            # Position loading bubble on left (suspect side)
+            left_margin = 20
+            bubble_x = left_margin
+            bubble_color = (80, 80, 80)
+
+            # Draw loading bubble background
+            blit_list.append((self._bubble_surface(bubble_width, bubble_height, bubble_color), (bubble_x, message_y)))
+
+            # Draw loading dots inside bubble
+            text_y = message_y + bubble_padding
+            blit_list.append((loading_surface, (bubble_x + bubble_padding, text_y)))
+
+        # Bubbles are stacked without overlapping, so their text can go out in one batch
+        pane.blits(blit_list, doreturn=False)
 
     def draw(self, surface):
         """Draw the conversation screen"""
@@ -198,74 +589,55 @@ class ConversationScreen:
             return
 
         # Draw semi-transparent background
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(50)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
 
-        # Draw main conversation window
-        window_width = int(self.screen_width * 0.85)
-        window_height = int(self.screen_height * 0.90)
-        window_x = (self.screen_width - window_width) // 2
-        window_y = (self.screen_height - window_height) // 2
+        # Draw main conversation window (with the empty conversation box)
+        surface.blit(self._window_surface, self.window_rect)
 
-        # Draw window background
-        pygame.draw.rect(surface, DARK_GRAY, (window_x, window_y, window_width, window_height))
-        pygame.draw.rect(surface, ACCENT_COLOR, (window_x, window_y, window_width, window_height), 3)
+        # Blits are queued and issued in batches with Surface.blits; a batch is flushed
+        # before any pygame.draw call that must appear above it
+        blit_list = []
 
         # Draw suspect info section (left side)
-        info_width = 250
-        info_x = window_x + 20
-        info_y = window_y + 20
+        info_x = self.info_x
 
         # Draw portrait
         if self.portrait:
-            portrait_x = info_x + (info_width - 150) // 2
-            portrait_y = info_y
-            surface.blit(self.portrait, (portrait_x, portrait_y))
+            atlas, source_rect = self.portrait
+            blit_list.append((atlas, self.portrait_pos, source_rect))
 
         # Draw suspect name and info
-        name_text = self.title_font.render(self.suspect["name"], True, WHITE)
-        name_x = info_x + (info_width - name_text.get_width()) // 2
-        name_y = info_y + 170
-        surface.blit(name_text, (name_x, name_y))
+        blit_list.append((self._name_surface, self.name_pos))
 
         # Draw personality traits
-        personality_y = name_y + 40
-        traits_title = self.text_font.render("Personality Traits:", True, LIGHT_GRAY)
-        surface.blit(traits_title, (info_x, personality_y))
+        personality_y = self.name_pos[1] + 40
+        traits_title = self._traits_title_surface
+        blit_list.append((traits_title, (info_x, personality_y)))
 
         personality_y += 25
-        for trait, level in self.agent.get_personality_state().items():
+        bar_xs = self._bar_xs
+        state = self.agent.get_personality_state()
+        levels = [int(state[trait]) for trait in self._trait_names]
+        for trait, trait_text, level_int in zip(self._trait_names, self._trait_name_surfaces, levels):
             # Draw trait name
-            trait_text = self.text_font.render(f"{trait}:", True, LIGHT_GRAY)
-            surface.blit(trait_text, (info_x, personality_y))
-
-            # Draw visual progress bars (level number of bars) or icon for level 0
-            bar_x = info_x + 140
-
-            # Convert level to int for drawing
-            level_int = int(level)
+            blit_list.append((trait_text, (info_x, personality_y)))
 
-            # Check if this trait is animating and update animation timer
+            # Check if this trait is animating (the timer is advanced in update())
             change_value = None
-            is_animating = trait in self.personality_changes
+            animation = self.personality_changes.get(trait)
+            is_animating = animation is not None
             should_blink = False
 
             if is_animating:
-                change_value, frames_left = self.personality_changes[trait]
-                # Decrement the animation timer
-                self.personality_changes[trait] = (change_value, frames_left - 1)
+                change_value, frames_left = animation
                 # Blinking effect - blink every 20 frames (10 visible, 10 invisible)
                 should_blink = (frames_left % 20) < 10
-                if frames_left <= 1:  # Remove when timer reaches 0
-                    del self.personality_changes[trait]
 
             # Always draw the current bars with the updated level
             if level_int == 0:
                 # Draw level 0 icon (slim)
                 if self.level_zero_icon and (not is_animating or should_blink):
-                    surface.blit(self.level_zero_icon, (bar_x, personality_y))
+                    blit_list.append((self.level_zero_icon, (bar_xs[0], personality_y)))
             else:
                 # Draw visual progress bars (level number of bars)
                 for i in range(level_int):
@@ -278,7 +650,7 @@ class ConversationScreen:
                         continue
 
                     if self.progress_bar:
-                        surface.blit(self.progress_bar, (bar_x + i * 18, personality_y))
+                        blit_list.append((self.progress_bar, (bar_xs[i], personality_y)))
 
             # Draw +1 or -1 indicator if animating
             if is_animating and change_value is not None:
@@ -290,192 +662,58 @@ class ConversationScreen:
                 else:  # Anxious and Moody: +1 is bad (red), -1 is good (green)
                     change_color = (255, 100, 100) if change_value > 0 else (100, 255, 100)
 
-                indicator_surface = self.text_font.render(change_text, True, change_color)
-                indicator_x = bar_x + (level_int * 18) + 5
-                surface.blit(indicator_surface, (indicator_x, personality_y - 5))
+                indicator_surface = render_text(self.text_font, change_text, change_color)
+                indicator_x = bar_xs[level_int] + 5
+                blit_list.append((indicator_surface, (indicator_x, personality_y - 5)))
 
             personality_y += 25
 
-        # Draw conversation section (right side)
-        conv_x = window_x + info_width + 40
-        conv_y = window_y + 20
-        conv_width = window_width - info_width - 60
-        conv_height = window_height - 120
+        surface.blits(blit_list, doreturn=False)
+        blit_list.clear()
 
-        # Draw conversation box background
-        pygame.draw.rect(surface, (40, 40, 40), (conv_x, conv_y, conv_width, conv_height))
-        pygame.draw.rect(surface, LIGHT_GRAY, (conv_x, conv_y, conv_width, conv_height), 2)
+        # Draw conversation section (right side)
+        conv_rect = self.conv_rect
+        conv_x, conv_y, conv_width = conv_rect.x, conv_rect.y, conv_rect.width
 
         # Draw messages as bubbles with scroll support
-        message_y = conv_y + 10
         max_visible_messages = 10
         # Calculate which messages to show based on scroll offset
-        start_index = max(0, len(self.messages) - max_visible_messages - self.scroll_offset)
-        messages_to_show = self.messages[start_index:start_index + max_visible_messages]
-
-        # Add pending response if available
-        if self.pending_response:
-            self.messages.append((self.suspect["name"], self.pending_response))
-
-            # Track the last response for chaos mode
-            self.last_response = self.pending_response
-
-            self.pending_response = None
-            messages_to_show = self.messages[-max_visible_messages:]
-
-            # Detect personality changes and track them for animation
-            current_state = self.agent.get_personality_state()
-            personality_updated = False
-            for trait, new_level in current_state.items():
-                old_level = self.last_personality_state.get(trait, new_level)
-                change = new_level - old_level
-                if change != 0:
-                    self.personality_changes[trait] = (change, self.change_animation_frames)
-                    personality_updated = True
-                self.last_personality_state[trait] = new_level
-
-            # Send personality update to visualizer
-            if personality_updated and self.visualizer:
-                self.visualizer.send_personality_update(self.suspect["name"], current_state)
-                # Also show feedback loop to orchestrator
-                self.visualizer.send_feedback_to_orchestrator(self.suspect["name"])  # Default 180 frames = 3 seconds
-
-            # Generate snippet for logs in background thread
-            if self.logs_modal:
-                thread = threading.Thread(
-                    target=self.logs_modal.generate_snippet_for_suspect,
-                    args=(self.suspect["name"], self)
-                )
-                thread.daemon = True
-                thread.start()
-
-        for speaker, message in messages_to_show:
-            is_player = speaker == "You"
-
-            # Determine bubble position and color first
-            if is_player:
-                # Player message - right side, blue
-                bubble_color = (100, 150, 255)
-                text_color = BLACK
-                left_margin = 100  # Player messages on right, so large left margin
-                right_margin = 5  # Minimal right padding for player messages
-            else:
-                # Suspect message - left side, gray with padding on right
-                bubble_color = (80, 80, 80)
-                text_color = WHITE
-                left_margin = 20
-                right_margin = 100  # Received messages have padding on right
-
-            # Wrap text based on actual rendered width with dynamic bubble width
-            bubble_padding = 10
-            line_height = 20
-            max_bubble_width = conv_width - left_margin - right_margin
-            min_bubble_width = 100  # Minimum width for bubble
-
-            # First pass: try to fit text with max width
-            words = message.split()
-            lines = []
-            current_line = ""
-            max_line_width = 0
-
-            for word in words:
-                test_line = current_line + word + " " if current_line else word + " "
-                test_surface = self.text_font.render(test_line.rstrip(), True, text_color)
-                if test_surface.get_width() > max_bubble_width - (bubble_padding * 2) and current_line:
-                    line_surface = self.text_font.render(current_line.rstrip(), True, text_color)
-                    max_line_width = max(max_line_width, line_surface.get_width())
-                    lines.append(current_line.rstrip())
-                    current_line = word + " "
-                else:
-                    current_line = test_line
-
-            if current_line:
-                line_surface = self.text_font.render(current_line.rstrip(), True, text_color)
-                max_line_width = max(max_line_width, line_surface.get_width())
-                lines.append(current_line.rstrip())
-
-            # Calculate dynamic bubble width based on content (tight fit)
-            dynamic_width = max_line_width + (bubble_padding * 2)
-            # Don't enforce min_bubble_width for dynamic sizing - let it fit content
-            bubble_width = min(dynamic_width, max_bubble_width)
-
-            # Calculate bubble size
-            bubble_height = len(lines) * line_height + bubble_padding * 2
-
-            # Determine bubble x position
-            if is_player:
-                # Player messages on right side - close to the right edge
-                bubble_x = conv_x + conv_width - bubble_width - 20
-            else:
-                # Suspect messages on left side
-                bubble_x = conv_x + left_margin
-
-            # Draw bubble background
-            pygame.draw.rect(surface, bubble_color, (bubble_x, message_y, bubble_width, bubble_height), border_radius=10)
-            pygame.draw.rect(surface, LIGHT_GRAY, (bubble_x, message_y, bubble_width, bubble_height), 2, border_radius=10)
-
-            # Draw message text inside bubble
-            text_y = message_y + bubble_padding
-            for line in lines:
-                line_text = self.text_font.render(line, True, text_color)
-                if is_player:
-                    # Right-align player messages with padding on right
-                    text_x = bubble_x + bubble_width - bubble_padding - line_text.get_width()
-                else:
-                    # Left-align suspect messages with dynamic padding
-                    text_x = bubble_x + bubble_padding
-                surface.blit(line_text, (text_x, text_y))
-                text_y += line_height
-
-            message_y += bubble_height + 10
+        message_count = len(self._prepared_messages)
+        start_index = max(0, message_count - max_visible_messages - self.scroll_offset)
 
-        # Draw loading bubble if currently loading
+        # Loading bubble text, showing the tail of the streamed reply once it starts arriving
+        loading_text = None
         if self.is_loading:
-            self.loading_timer += 1
-            if self.loading_timer >= 8:  # Change dots every 8 frames
-                self.loading_timer = 0
-                self.loading_dots_frame = (self.loading_dots_frame + 1) % 3
-
-            # Create loading bubble
             dots = [".", "..", "..."]
             loading_text = dots[self.loading_dots_frame]
-
-            # Calculate bubble size for loading message
-            bubble_padding = 10
-            line_height = 20
-            loading_surface = self.text_font.render(loading_text, True, WHITE)
-            bubble_height = line_height + bubble_padding * 2
-            bubble_width = loading_surface.get_width() + bubble_padding * 2
-
-            # Position loading bubble on left (suspect side)
-            left_margin = 20
-            bubble_x = conv_x + left_margin
-            bubble_color = (80, 80, 80)
-
-            # Draw loading bubble background
-            pygame.draw.rect(surface, bubble_color, (bubble_x, message_y, bubble_width, bubble_height), border_radius=10)
-            pygame.draw.rect(surface, LIGHT_GRAY, (bubble_x, message_y, bubble_width, bubble_height), 2, border_radius=10)
-
-            # Draw loading dots inside bubble
-            text_y = message_y + bubble_padding
-            surface.blit(loading_surface, (bubble_x + bubble_padding, text_y))
+            if self.streaming_response:
+                max_chars = max(10, (conv_width - 140) // 7)
+                streamed = self.streaming_response.replace("\n", " ")
+                if len(streamed) > max_chars:
+                    streamed = "..." + streamed[-max_chars:]
+                loading_text = streamed + loading_text
+
+        # The pane only changes when a message is added, the view scrolls or the
+        # loading bubble text changes, so it is re-rendered only then
+        pane_key = (start_index, message_count, loading_text)
+        if pane_key != self._pane_key:
+            self._pane_key = pane_key
+            self._render_pane(start_index, max_visible_messages, loading_text)
+        surface.blit(self._pane_surface, (conv_x, conv_y))
 
         # Draw input box
-        input_y = window_y + window_height - 60
-        pygame.draw.rect(surface, (60, 60, 60), (conv_x, input_y, conv_width, 40))
-        pygame.draw.rect(surface, LIGHT_GRAY, (conv_x, input_y, conv_width, 40), 2)
+        input_y = self.input_rect.y
+        surface.blit(self._input_box_surface, self.input_rect)
 
         # Draw input text (disabled while loading)
         if not self.is_loading:
-            input_text = self.input_font.render(self.user_input, True, WHITE)
-            surface.blit(input_text, (conv_x + 10, input_y + 8))
+            input_text = render_text(self.input_font, self.user_input, WHITE)
+            blit_list.append((input_text, (conv_x + 10, input_y + 8)))
         else:
             # Show placeholder while loading
-            placeholder_text = self.input_font.render("(waiting for response...)", True, (100, 100, 100))
-            surface.blit(placeholder_text, (conv_x + 10, input_y + 8))
+            placeholder_text = self._placeholder_surface
+            blit_list.append((placeholder_text, (conv_x + 10, input_y + 8)))
 
         # Draw close instruction
-        close_text = self.text_font.render("Press ESC to close", True, LIGHT_GRAY)
-        close_x = window_x + (window_width - close_text.get_width()) // 2
-        close_y = window_y + window_height - 25
-        surface.blit(close_text, (close_x, close_y))
\ No newline at end of file
+        blit_list.append((self._close_surface, self.close_pos))
+        surface.blits(blit_list, doreturn=False)
\ No newline at end of file
@@ -3,30 +3,32 @@ Menu button component
 """
 import pygame
 from src.config import WHITE
+from src.utils.image_cache import load_scaled
+from src.utils.fonts import get_font
 
 
 class MenuButton:
+    # Fixed attribute set: smaller instances and faster attribute reads in the draw/hover loop
+    __slots__ = ("label", "x", "y", "width", "height", "rect", "is_hovered", "button_bg", "font")
+
     def __init__(self, label, x, y, width, height):
         self.label = label
         self.x = x
         self.y = y
         self.width = width
         self.height = height
+        self.rect = pygame.Rect(x, y, self.width, self.height)  # Hit-test area for hover and clicks
         self.is_hovered = False
 
-        # Load the button background image
-        button_image = pygame.image.load("assets/dialogue_box/20240707dragon9SlicesB.png")
-        self.button_bg = pygame.transform.scale(button_image, (width, height))
+        # Button background, shared with every other button of the same size
+        self.button_bg = load_scaled("assets/dialogue_box/20240707dragon9SlicesB.png", (width, height))
 
         # Create font
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 24)
 
     def check_hover(self, mouse_pos):
         """Check if mouse is hovering over this button"""
-        mouse_x, mouse_y = mouse_pos
-        self.is_hovered = (
-            self.x <= mouse_x <= self.x + self.width and self.y <= mouse_y <= self.y + self.height
-        )
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
 
     def draw(self, surface):
         """Draw the button"""
@@ -45,7 +47,4 @@ class MenuButton:
 
     def is_clicked(self, mouse_pos):
         """Check if button was clicked"""
-        mouse_x, mouse_y = mouse_pos
-        return (
-            self.x <= mouse_x <= self.x + self.width and self.y <= mouse_y <= self.y + self.height
-        )
\ No newline at end of file
+        return self.rect.collidepoint(mouse_pos)
\ No newline at end of file
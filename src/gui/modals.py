@@ -3,10 +3,85 @@ Modal dialogs for the game
 """
 
 import pygame
+import hashlib
+import json
 import threading
-from openai import OpenAI
-import os
 from src.config import *
+from src.agents.openai_client import create_chat_completion
+from src.utils.image_cache import load_scaled
+from src.utils.fonts import get_font, render_text
+
+# Background shared by every modal; scaled copies are cached per modal size
+MODAL_BG_PATH = "assets/dialogue_box/20240707dragon9SlicesA.png"
+
+# Accusation result images and the size they are shown at
+RESULT_IMAGE_CORRECT = "assets/progress/PNG/GUI-Kit-Pack-Free_37.png"
+RESULT_IMAGE_INCORRECT = "assets/progress/PNG/GUI-Kit-Pack-Free_36.png"
+RESULT_IMAGE_SIZE = (200, 200)
+
+# Content-sized modal heights are rounded up to this step, so only a handful of
+# background sizes are ever scaled and cached
+MODAL_HEIGHT_STEP = 64
+
+# Snippet model settings, also part of the snippet cache key
+SNIPPET_MODEL = "gpt-4o-mini"
+SNIPPET_TEMPERATURE = 0.7
+
+# Snippets already generated for an exact prompt, keyed by a hash of the request
+_snippet_cache = {}
+
+
+def _snippet_cache_key(prompt):
+    """Stable key for a snippet request: same model, prompt and temperature give the same key"""
+    raw = json.dumps({"m": SNIPPET_MODEL, "p": prompt, "t": SNIPPET_TEMPERATURE}, sort_keys=True)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _snap_height(height):
+    """Round a modal height up to the next MODAL_HEIGHT_STEP"""
+    return -(-height // MODAL_HEIGHT_STEP) * MODAL_HEIGHT_STEP
+
+
+def _layout_lines(font, lines, line_height):
+    """
+    Render a modal's text lines once, as (surface, y offset) pairs aligned with lines.
+    Blank lines keep their slot with a None surface so scrolling can slice by line index.
+    """
+    # Blank test without building a stripped copy of every line
+    return [
+        (render_text(font, line, LIGHT_GRAY) if line and not line.isspace() else None, y)
+        for line, y in zip(lines, range(0, len(lines) * line_height, line_height))
+    ]
+
+
+# Dimming overlay shared by every modal, built on first draw
+_overlay = None
+
+
+def _get_overlay():
+    """Return the full-screen semi-transparent overlay drawn behind modals"""
+    global _overlay
+    if _overlay is None:
+        _overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        _overlay.set_alpha(200)
+        _overlay.fill((0, 0, 0))
+    return _overlay
+
+
+# Close button (border and "X") shared by every modal, built on first use
+CLOSE_BUTTON_SIZE = 30
+_close_button = None
+
+
+def _get_close_button():
+    """Return the pre-drawn close button, so modal draws need no draw primitives"""
+    global _close_button
+    if _close_button is None:
+        _close_button = pygame.Surface((CLOSE_BUTTON_SIZE, CLOSE_BUTTON_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(_close_button, (100, 50, 50), _close_button.get_rect(), 2)  # Red border
+        x_text = get_font(None, 28).render("X", True, WHITE)
+        _close_button.blit(x_text, x_text.get_rect(center=_close_button.get_rect().center))
+    return _close_button
 
 
 class InfoModal:
@@ -20,8 +95,20 @@ class InfoModal:
         # Cache for generated snippets (maps suspect_name -> list of snippets)
         self.snippet_cache = {}
 
+        # Suspects with a snippet request running, and those whose transcript changed meanwhile
+        self._snippet_lock = threading.Lock()
+        self._snippets_in_flight = set()
+        self._snippets_stale = set()
+
+        # Lines shown by draw, regenerated only when marked dirty
+        self._content_lines = []
+        self._dirty = True
+
         # Scroll tracking for logs
         self.scroll_offset = 0
+        self.max_scroll = 0  # Largest useful scroll_offset, updated when content is laid out
+        self._laid_out_source = None  # Lines the laid-out surfaces below were built from
+        self._laid_out_lines = []
 
         # Modal dimensions
         self.width = int(SCREEN_WIDTH * 0.75)  # 75% of screen width
@@ -29,25 +116,27 @@ class InfoModal:
         self.y = 100
 
         # Load background image
-        modal_bg = pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png")
-        self.modal_bg = pygame.transform.scale(modal_bg, (self.width, 900))  # Default height
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, 900))  # Default height
 
         # Create font
-        self.title_font = pygame.font.Font(None, 32)
-        self.text_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(None, 32)
+        self.text_font = get_font(None, 18)
+
+        # Close hint never changes, so it is rendered once
+        self._close_text_surface = get_font(None, 16).render("Press ESC or click to close", True, LIGHT_GRAY)
 
     def generate_facts_content(self):
         """Generate facts content from game state"""
-        facts = []
-        facts.append(f"VICTIM: {self.master_data.victim}")
-        facts.append(f"CRIME LOCATION: {self.master_data.crime_location}")
-        facts.append(f"CAUSE OF DEATH: {self.master_data.cause_of_death}")
-        facts.append(f"TIME OF DEATH: {self.master_data.time_of_death}")
-        facts.append("")
-        facts.append("KNOWN CLUES:")
-        for i, clue in enumerate(self.master_data.clues, 1):
-            facts.append(f"  • {clue.get('clue', 'Unknown')}")
-        return facts
+        master_data = self.master_data
+        return [
+            f"VICTIM: {master_data.victim}",
+            f"CRIME LOCATION: {master_data.crime_location}",
+            f"CAUSE OF DEATH: {master_data.cause_of_death}",
+            f"TIME OF DEATH: {master_data.time_of_death}",
+            "",
+            "KNOWN CLUES:",
+            *(f"  • {clue.get('clue', 'Unknown')}" for clue in master_data.clues),
+        ]
 
     def generate_logs_content(self):
         """Generate investigation logs content with cached AI-generated snippets (unique only)"""
@@ -62,13 +151,9 @@ class InfoModal:
 
                 # Use cached snippets (can be multiple from different sessions), removing duplicates
                 if suspect_name in self.snippet_cache:
-                    # Use set to track unique snippets, but preserve order
-                    seen_snippets = set()
-                    for snippet in self.snippet_cache[suspect_name]:
-                        # Only add if we haven't seen this exact snippet before
-                        if snippet not in seen_snippets:
-                            logs.append(f"  • {snippet}")
-                            seen_snippets.add(snippet)
+                    # dict.fromkeys drops repeats while keeping first-seen order
+                    for snippet in dict.fromkeys(self.snippet_cache[suspect_name]):
+                        logs.append(f"  • {snippet}")
                 else:
                     logs.append(f"  • (generating...)")
 
@@ -78,10 +163,31 @@ class InfoModal:
         return logs
 
     def generate_snippet_for_suspect(self, suspect_name, conv_screen):
-        """Generate a single sentence snippet asynchronously"""
-        from openai import OpenAI
-        import os
-
+        """
+        Generate a single sentence snippet asynchronously.
+        Only one request per suspect is in flight; calls made meanwhile are folded
+        into a single follow-up run that sees the latest transcript.
+        """
+        with self._snippet_lock:
+            if suspect_name in self._snippets_in_flight:
+                self._snippets_stale.add(suspect_name)
+                return
+            self._snippets_in_flight.add(suspect_name)
+
+        while True:
+            try:
+                self._generate_snippet(suspect_name, conv_screen)
+            finally:
+                with self._snippet_lock:
+                    rerun = suspect_name in self._snippets_stale
+                    self._snippets_stale.discard(suspect_name)
+                    if not rerun:
+                        self._snippets_in_flight.discard(suspect_name)
+            if not rerun:
+                return
+
+    def _generate_snippet(self, suspect_name, conv_screen):
+        """Ask the model for one new observation about the interview and add it to snippet_cache"""
         conversation_text = "\n".join(
             [f"{speaker}: {msg}" for speaker, msg in conv_screen.messages]
         )
@@ -106,14 +212,19 @@ IMPORTANT: The snippet MUST be completely fresh and different from any previous
 Observation:"""
 
         try:
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": snippet_prompt}],
-                temperature=0.7,
-                max_tokens=50,
-            )
-            snippet = response.choices[0].message.content.strip()
+            # An identical prompt (same transcript and previous snippets) gets the same snippet back
+            cache_key = _snippet_cache_key(snippet_prompt)
+            snippet = _snippet_cache.get(cache_key)
+            if snippet is None:
+                # Shared pooled client, so concurrent snippets reuse warm connections
+                response = create_chat_completion(
+                    model=SNIPPET_MODEL,
+                    messages=[{"role": "user", "content": snippet_prompt}],
+                    temperature=SNIPPET_TEMPERATURE,
+                    max_tokens=50,
+                )
+                snippet = response.choices[0].message.content.strip()
+                _snippet_cache[cache_key] = snippet
 
             # Initialize list for this suspect if not already done
             if suspect_name not in self.snippet_cache:
@@ -125,6 +236,7 @@ Observation:"""
             if suspect_name not in self.snippet_cache:
                 self.snippet_cache[suspect_name] = []
             self.snippet_cache[suspect_name].append("(Unable to generate snippet)")
+        self._dirty = True
 
     def draw(self, surface):
         """Draw the modal"""
@@ -132,36 +244,33 @@ Observation:"""
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
-
-        # Generate content based on title
-        if self.title == "FACTS":
-            lines = self.generate_facts_content()
-        elif self.title == "LOGS":
-            lines = self.generate_logs_content()
-        else:
-            lines = self.content.split("\n")
+        surface.blit(_get_overlay(), (0, 0))
+
+        # Generate content based on title, only after toggle() or a new snippet marked it dirty
+        if self._dirty:
+            self._dirty = False
+            if self.title == "FACTS":
+                self._content_lines = self.generate_facts_content()
+            elif self.title == "LOGS":
+                self._content_lines = self.generate_logs_content()
+            else:
+                self._content_lines = self.content.split("\n")
+        lines = self._content_lines
 
         # Calculate height based on content with max of 75% window height
         line_height = 25
         content_height = len(lines) * line_height + 150  # Padding for title and spacing
         max_height = int(SCREEN_HEIGHT * 0.75)  # Max 75% of window height
-        self.height = min(content_height, max_height)
+        self.height = min(_snap_height(content_height), max_height)
 
-        # Resize modal background
-        self.modal_bg = pygame.transform.scale(
-            pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png"),
-            (self.width, self.height),
-        )
+        # Modal background for this height, loaded and scaled only the first time it's needed
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, self.height))
 
         # Draw modal background
         surface.blit(self.modal_bg, (self.x, self.y))
 
         # Draw title
-        title_surface = self.title_font.render(self.title, True, WHITE)
+        title_surface = render_text(self.title_font, self.title, WHITE)
         title_x = self.x + 80
         title_y = self.y + 50
         surface.blit(title_surface, (title_x, title_y))
@@ -172,27 +281,26 @@ Observation:"""
         max_visible_lines = int((self.height - 150) / line_height)  # Lines that fit in modal
 
         # Calculate which lines to show based on scroll offset
-        start_line = min(self.scroll_offset, max(0, len(lines) - max_visible_lines))
-        for i, line in enumerate(lines[start_line : start_line + max_visible_lines]):
-            if line.strip():
-                line_surface = self.text_font.render(line, True, LIGHT_GRAY)
-                surface.blit(line_surface, (content_x, content_y))
-            content_y += line_height
-
-        # Draw close button (X in top right)
-        close_button_rect = self.get_close_button_rect()
-        pygame.draw.rect(surface, (100, 50, 50), close_button_rect, 2)  # Red border
-
-        # Draw X
-        x_font = pygame.font.Font(None, 28)
-        x_text = x_font.render("X", True, WHITE)
-        x_x = close_button_rect.centerx - x_text.get_width() // 2
-        x_y = close_button_rect.centery - x_text.get_height() // 2
-        surface.blit(x_text, (x_x, x_y))
+        self.max_scroll = max(0, len(lines) - max_visible_lines)
+        start_line = min(self.scroll_offset, self.max_scroll)
+        # Lines are rendered and laid out only when the content changes
+        if lines != self._laid_out_source:
+            self._laid_out_source = lines
+            self._laid_out_lines = _layout_lines(self.text_font, lines, line_height)
+        top = content_y - start_line * line_height
+        line_blits = [
+            (line_surface, (content_x, top + dy))
+            for line_surface, dy in self._laid_out_lines[start_line : start_line + max_visible_lines]
+            if line_surface is not None
+        ]
+        # All visible lines go out in one batched call
+        surface.blits(line_blits, doreturn=False)
+
+        # Draw close button (X in top right), pre-drawn so this frame needs no draw primitives
+        surface.blit(_get_close_button(), self.get_close_button_rect())
 
         # Draw close instruction
-        close_font = pygame.font.Font(None, 16)
-        close_text = close_font.render("Press ESC or click to close", True, LIGHT_GRAY)
+        close_text = self._close_text_surface
         close_x = self.x + (self.width - close_text.get_width()) // 2
         close_y = self.y + self.height - 25
         surface.blit(close_text, (close_x, close_y))
@@ -200,10 +308,12 @@ Observation:"""
     def toggle(self):
         """Toggle modal visibility"""
         self.is_open = not self.is_open
+        # Interviews may have started since the modal was last shown
+        self._dirty = True
 
     def get_close_button_rect(self):
         """Get the rectangle for the close button"""
-        close_button_size = 30
+        close_button_size = CLOSE_BUTTON_SIZE
         close_x = self.x + self.width - close_button_size - 15
         close_y = self.y + 15
         return pygame.Rect(close_x, close_y, close_button_size, close_button_size)
@@ -222,6 +332,9 @@ class AccusationResultsModal:
         self.conversation_screens = conversation_screens
         self.is_open = False
         self.scroll_offset = 0
+        self.max_scroll = 0  # Largest useful scroll_offset, updated when content is laid out
+        self._laid_out_source = None  # Lines the laid-out surfaces below were built from
+        self._laid_out_lines = []
 
         # Modal dimensions
         self.width = int(SCREEN_WIDTH * 0.75)
@@ -229,26 +342,26 @@ class AccusationResultsModal:
         self.y = 100
 
         # Load background image
-        modal_bg = pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png")
-        self.modal_bg = pygame.transform.scale(modal_bg, (self.width, 900))
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, 900))
 
-        # Load result images
-        if is_correct:
-            self.result_image = pygame.image.load("assets/progress/PNG/GUI-Kit-Pack-Free_37.png")
-        else:
-            self.result_image = pygame.image.load("assets/progress/PNG/GUI-Kit-Pack-Free_36.png")
-
-        # Scale result image
-        self.result_image = pygame.transform.scale(self.result_image, (200, 200))
+        # Result image, loaded, scaled and converted once per process
+        result_path = RESULT_IMAGE_CORRECT if is_correct else RESULT_IMAGE_INCORRECT
+        self.result_image = load_scaled(result_path, RESULT_IMAGE_SIZE)
 
         # Create fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.subtitle_font = pygame.font.Font(None, 24)
-        self.text_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(None, 36)
+        self.subtitle_font = get_font(None, 24)
+        self.text_font = get_font(None, 18)
+
+        # Close hint never changes, so it is rendered once
+        self._close_text_surface = get_font(None, 16).render("Press ESC or click to close", True, LIGHT_GRAY)
 
-        # Cache for generated content (to avoid recalculating every frame)
-        self.cached_content = None
-        self.is_loading_content = False
+        # Results only depend on the accusation and case data, so they're built once here
+        try:
+            self.cached_content = self.generate_results_content()
+        except Exception as e:
+            print(f"Error generating accusation results: {e}")
+            self.cached_content = [f"Error generating results: {str(e)}"]
 
     def generate_results_content(self):
         """Generate detailed results content"""
@@ -335,36 +448,19 @@ class AccusationResultsModal:
         if not self.is_open:
             return
 
-        # Generate content asynchronously on first draw
-        if self.cached_content is None and not self.is_loading_content:
-            self.is_loading_content = True
-            thread = threading.Thread(target=self._generate_content_async)
-            thread.daemon = True
-            thread.start()
-
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
-
-        # Use cached content or show loading message
-        if self.cached_content is not None:
-            lines = self.cached_content
-        else:
-            lines = ["Loading accusation results..."]
+        surface.blit(_get_overlay(), (0, 0))
+
+        lines = self.cached_content
 
         # Calculate height based on content
         line_height = 22
         content_height = len(lines) * line_height + 300  # Extra space for image and padding
         max_height = int(SCREEN_HEIGHT * 0.85)
-        self.height = min(content_height, max_height)
+        self.height = min(_snap_height(content_height), max_height)
 
-        # Resize modal background
-        self.modal_bg = pygame.transform.scale(
-            pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png"),
-            (self.width, self.height),
-        )
+        # Modal background for this height, loaded and scaled only the first time it's needed
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, self.height))
 
         # Draw modal background
         surface.blit(self.modal_bg, (self.x, self.y))
@@ -380,34 +476,33 @@ class AccusationResultsModal:
         max_visible_lines = int((self.height - 310) / line_height)
 
         # Calculate which lines to show based on scroll offset
-        start_line = min(self.scroll_offset, max(0, len(lines) - max_visible_lines))
-        for i, line in enumerate(lines[start_line : start_line + max_visible_lines]):
-            if line.strip():
-                line_surface = self.text_font.render(line, True, LIGHT_GRAY)
-                surface.blit(line_surface, (content_x, content_y))
-            content_y += line_height
-
-        # Draw close button
-        close_button_rect = self.get_close_button_rect()
-        pygame.draw.rect(surface, (100, 50, 50), close_button_rect, 2)
-
-        # Draw X
-        x_font = pygame.font.Font(None, 28)
-        x_text = x_font.render("X", True, WHITE)
-        x_x = close_button_rect.centerx - x_text.get_width() // 2
-        x_y = close_button_rect.centery - x_text.get_height() // 2
-        surface.blit(x_text, (x_x, x_y))
+        self.max_scroll = max(0, len(lines) - max_visible_lines)
+        start_line = min(self.scroll_offset, self.max_scroll)
+        # Lines are rendered and laid out only when the content changes
+        if lines != self._laid_out_source:
+            self._laid_out_source = lines
+            self._laid_out_lines = _layout_lines(self.text_font, lines, line_height)
+        top = content_y - start_line * line_height
+        line_blits = [
+            (line_surface, (content_x, top + dy))
+            for line_surface, dy in self._laid_out_lines[start_line : start_line + max_visible_lines]
+            if line_surface is not None
+        ]
+        # All visible lines go out in one batched call
+        surface.blits(line_blits, doreturn=False)
+
+        # Draw close button (X in top right), pre-drawn so this frame needs no draw primitives
+        surface.blit(_get_close_button(), self.get_close_button_rect())
 
         # Draw close instruction
-        close_font = pygame.font.Font(None, 16)
-        close_text = close_font.render("Press ESC or click to close", True, LIGHT_GRAY)
+        close_text = self._close_text_surface
         close_x = self.x + (self.width - close_text.get_width()) // 2
         close_y = self.y + self.height - 25
         surface.blit(close_text, (close_x, close_y))
 
     def get_close_button_rect(self):
         """Get the rectangle for the close button"""
-        close_button_size = 30
+        close_button_size = CLOSE_BUTTON_SIZE
         close_x = self.x + self.width - close_button_size - 15
         close_y = self.y + 15
         return pygame.Rect(close_x, close_y, close_button_size, close_button_size)
@@ -416,16 +511,6 @@ class AccusationResultsModal:
         """Check if close button is clicked"""
         return self.get_close_button_rect().collidepoint(mouse_pos)
 
-    def _generate_content_async(self):
-        """Generate results content asynchronously"""
-        try:
-            self.cached_content = self.generate_results_content()
-        except Exception as e:
-            print(f"Error generating accusation results: {e}")
-            self.cached_content = [f"Error generating results: {str(e)}"]
-        finally:
-            self.is_loading_content = False
-
     def toggle(self):
         """Toggle modal visibility"""
         self.is_open = not self.is_open
@@ -437,6 +522,9 @@ class IntroductionModal:
         self.master_data = master_data
         self.is_open = False
         self.scroll_offset = 0
+        self.max_scroll = 0  # Largest useful scroll_offset, updated when content is laid out
+        self._laid_out_source = None  # Lines the laid-out surfaces below were built from
+        self._laid_out_lines = []
 
         # Modal dimensions
         self.width = int(SCREEN_WIDTH * 0.75)
@@ -445,13 +533,15 @@ class IntroductionModal:
         self.height = 600
 
         # Load background image
-        modal_bg = pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png")
-        self.modal_bg = pygame.transform.scale(modal_bg, (self.width, self.height))
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, self.height))
 
         # Create fonts
-        self.title_font = pygame.font.Font(None, 40)
-        self.subtitle_font = pygame.font.Font(None, 26)
-        self.text_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(None, 40)
+        self.subtitle_font = get_font(None, 26)
+        self.text_font = get_font(None, 20)
+
+        # Close hint never changes, so it is rendered once
+        self._close_text_surface = get_font(None, 16).render("Press ESC or click to close", True, LIGHT_GRAY)
 
     def generate_intro_content(self):
         """Generate the introduction content"""
@@ -496,10 +586,7 @@ class IntroductionModal:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_get_overlay(), (0, 0))
 
         lines = self.generate_intro_content()
 
@@ -507,13 +594,10 @@ class IntroductionModal:
         line_height = 28
         content_height = len(lines) * line_height + 200
         max_height = int(SCREEN_HEIGHT * 0.85)
-        self.height = min(content_height, max_height)
+        self.height = min(_snap_height(content_height), max_height)
 
-        # Resize modal background
-        self.modal_bg = pygame.transform.scale(
-            pygame.image.load("assets/dialogue_box/20240707dragon9SlicesA.png"),
-            (self.width, self.height),
-        )
+        # Modal background for this height, loaded and scaled only the first time it's needed
+        self.modal_bg = load_scaled(MODAL_BG_PATH, (self.width, self.height))
 
         # Draw modal background
         surface.blit(self.modal_bg, (self.x, self.y))
@@ -524,34 +608,33 @@ class IntroductionModal:
         max_visible_lines = int((self.height - 150) / line_height)
 
         # Calculate which lines to show based on scroll offset
-        start_line = min(self.scroll_offset, max(0, len(lines) - max_visible_lines))
-        for i, line in enumerate(lines[start_line : start_line + max_visible_lines]):
-            if line.strip():
-                line_surface = self.text_font.render(line, True, LIGHT_GRAY)
-                surface.blit(line_surface, (content_x, content_y))
-            content_y += line_height
-
-        # Draw close button (X in top right)
-        close_button_rect = self.get_close_button_rect()
-        pygame.draw.rect(surface, (100, 50, 50), close_button_rect, 2)
-
-        # Draw X
-        x_font = pygame.font.Font(None, 28)
-        x_text = x_font.render("X", True, WHITE)
-        x_x = close_button_rect.centerx - x_text.get_width() // 2
-        x_y = close_button_rect.centery - x_text.get_height() // 2
-        surface.blit(x_text, (x_x, x_y))
+        self.max_scroll = max(0, len(lines) - max_visible_lines)
+        start_line = min(self.scroll_offset, self.max_scroll)
+        # Lines are rendered and laid out only when the content changes
+        if lines != self._laid_out_source:
+            self._laid_out_source = lines
+            self._laid_out_lines = _layout_lines(self.text_font, lines, line_height)
+        top = content_y - start_line * line_height
+        line_blits = [
+            (line_surface, (content_x, top + dy))
+            for line_surface, dy in self._laid_out_lines[start_line : start_line + max_visible_lines]
+            if line_surface is not None
+        ]
+        # All visible lines go out in one batched call
+        surface.blits(line_blits, doreturn=False)
+
+        # Draw close button (X in top right), pre-drawn so this frame needs no draw primitives
+        surface.blit(_get_close_button(), self.get_close_button_rect())
 
         # Draw close instruction
-        close_font = pygame.font.Font(None, 16)
-        close_text = close_font.render("Press ESC or click to close", True, LIGHT_GRAY)
+        close_text = self._close_text_surface
         close_x = self.x + (self.width - close_text.get_width()) // 2
         close_y = self.y + self.height - 25
         surface.blit(close_text, (close_x, close_y))
 
     def get_close_button_rect(self):
         """Get the rectangle for the close button"""
-        close_button_size = 30
+        close_button_size = CLOSE_BUTTON_SIZE
         close_x = self.x + self.width - close_button_size - 15
         close_y = self.y + 15
         return pygame.Rect(close_x, close_y, close_button_size, close_button_size)
@@ -1,5 +1,8 @@
 """Utility modules for the game"""
 from .cursor import init_cursors, set_default_cursor, set_map_frame_cursor
 from .background import ParallaxBackground
+from .portraits import get_portrait
+from .image_cache import load_scaled
+from .fonts import get_font, render_text
 
-__all__ = ['init_cursors', 'set_default_cursor', 'set_map_frame_cursor', 'ParallaxBackground']
\ No newline at end of file
+__all__ = ['init_cursors', 'set_default_cursor', 'set_map_frame_cursor', 'ParallaxBackground', 'get_portrait', 'load_scaled', 'get_font', 'render_text']
\ No newline at end of file
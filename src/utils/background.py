@@ -4,6 +4,9 @@ Background and parallax utilities
 import pygame
 from src.config import *
 
+# Length of one frame at the target frame rate, in milliseconds
+FRAME_MS = 1000 / FPS
+
 
 class ParallaxBackground:
     def __init__(self):
@@ -12,37 +15,54 @@ class ParallaxBackground:
         self.background_layer_2 = pygame.image.load("assets/oak_woods_v1.0/background/background_layer_2.png")
         self.background_layer_3 = pygame.image.load("assets/oak_woods_v1.0/background/background_layer_3.png")
 
-        # Scale backgrounds
-        self.background_layer_1 = pygame.transform.scale(self.background_layer_1, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.background_layer_2 = pygame.transform.scale(self.background_layer_2, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.background_layer_3 = pygame.transform.scale(self.background_layer_3, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Scale backgrounds and convert them to the display format so blits need no
+        # per-pixel conversion. Layer 1 is opaque; layers 2 and 3 are drawn over it and keep alpha.
+        self.background_layer_1 = pygame.transform.scale(self.background_layer_1, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background_layer_2 = pygame.transform.scale(self.background_layer_2, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert_alpha()
+        self.background_layer_3 = pygame.transform.scale(self.background_layer_3, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert_alpha()
+
+        # Each parallax layer pre-tiled twice side by side, so any offset is a single blit
+        self._strip_2 = self._build_strip(self.background_layer_2)
+        self._strip_3 = self._build_strip(self.background_layer_3)
 
         # Parallax offsets
         self.parallax_offset_2 = 0
         self.parallax_offset_3 = 0
 
-    def update(self, scroll_speed_2=PARALLAX_SPEED_2, scroll_speed_3=PARALLAX_SPEED_3):
-        """Update parallax offsets"""
-        self.parallax_offset_2 += scroll_speed_2
-        self.parallax_offset_3 += scroll_speed_3
+    def _build_strip(self, layer):
+        """Tile a screen-sized layer twice horizontally into one display-format surface"""
+        strip = pygame.Surface((SCREEN_WIDTH * 2, SCREEN_HEIGHT), pygame.SRCALPHA)
+        strip.blit(layer, (0, 0))
+        strip.blit(layer, (SCREEN_WIDTH, 0))
+        return strip.convert_alpha()
+
+    def update(self, dt_ms=FRAME_MS, scroll_speed_2=PARALLAX_SPEED_2, scroll_speed_3=PARALLAX_SPEED_3):
+        """
+        Advance parallax offsets by the time elapsed since the last frame.
+        Scroll speeds are in pixels per frame at the target FPS, so slow or stalled
+        frames move the layers further instead of slowing them down.
+        Returns True if the layers moved by at least a whole pixel.
+        """
+        if dt_ms <= 0:
+            return False
+        frames = dt_ms / FRAME_MS
+        previous = (int(self.parallax_offset_2), int(self.parallax_offset_3))
+        self.parallax_offset_2 += scroll_speed_2 * frames
+        self.parallax_offset_3 += scroll_speed_3 * frames
 
         # Reset offsets to prevent overflow
         if self.parallax_offset_2 >= SCREEN_WIDTH:
-            self.parallax_offset_2 = 0
+            self.parallax_offset_2 %= SCREEN_WIDTH
         if self.parallax_offset_3 >= SCREEN_WIDTH:
-            self.parallax_offset_3 = 0
+            self.parallax_offset_3 %= SCREEN_WIDTH
+
+        return (int(self.parallax_offset_2), int(self.parallax_offset_3)) != previous
 
     def draw(self, surface):
         """Draw parallax background"""
         # Draw static layer 1
         surface.blit(self.background_layer_1, (0, 0))
 
-        # Draw parallax layer 2
-        surface.blit(self.background_layer_2, (-self.parallax_offset_2, 0))
-        if self.parallax_offset_2 > 0:
-            surface.blit(self.background_layer_2, (SCREEN_WIDTH - self.parallax_offset_2, 0))
-
-        # Draw parallax layer 3
-        surface.blit(self.background_layer_3, (-self.parallax_offset_3, 0))
-        if self.parallax_offset_3 > 0:
-            surface.blit(self.background_layer_3, (SCREEN_WIDTH - self.parallax_offset_3, 0))
\ No newline at end of file
+        # Draw parallax layers 2 and 3; the strip covers the wraparound, so one blit each
+        surface.blit(self._strip_2, (-self.parallax_offset_2, 0))
+        surface.blit(self._strip_3, (-self.parallax_offset_3, 0))
@@ -14,16 +14,16 @@ def init_cursors():
     global cursor_image, map_frame_cursor
 
     # Load and set custom cursor
-    cursor_sheet = pygame.image.load("assets/dialogue_box/20240711dragonMouseCursorBig-Sheet.png")
+    cursor_sheet = pygame.image.load("assets/dialogue_box/20240711dragonMouseCursorBig-Sheet.png").convert_alpha()
     # The sheet is 92x23 with 4 cursors, each is roughly 23x23
     # Extract the first cursor only
-    cursor_image = pygame.Surface((23, 23), pygame.SRCALPHA)
-    cursor_image.blit(cursor_sheet, (0, 0), (0, 0, 23, 23))
+    # Straight pixel copy of the region; copy() lets the sheet itself be freed
+    cursor_image = cursor_sheet.subsurface((0, 0, 23, 23)).copy()
     # Set the cursor with hotspot at (0, 0)
     pygame.mouse.set_cursor(pygame.cursors.Cursor((0, 0), cursor_image))
 
     # Load map frame cursor
-    map_frame_cursor = pygame.image.load("assets/dialogue_box/20240713dragonMapFrame.png")
+    map_frame_cursor = pygame.image.load("assets/dialogue_box/20240713dragonMapFrame.png").convert_alpha()
     map_frame_cursor = pygame.transform.scale(map_frame_cursor, (40, 40))  # Adjust size as needed
 
 
@@ -0,0 +1,40 @@
+"""
+Shared font and rendered-text caches for the game.
+Each (path, size) font is opened once and reused by every component,
+instead of every screen, card and button opening its own copy.
+"""
+import pygame
+from collections import OrderedDict
+
+# Most rendered text surfaces kept across frames
+TEXT_CACHE_SIZE = 512
+
+_fonts = {}
+_text_cache = OrderedDict()  # (font, text, color) -> surface, least recently used evicted first
+
+
+def get_font(path, size):
+    """Return the shared pygame Font for (path, size); path None is pygame's default font"""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color):
+    """
+    Render antialiased text, reusing the surface from earlier frames when possible.
+    The returned surface is shared, so callers must not draw onto it.
+    """
+    key = (font, text, color)
+    rendered = _text_cache.get(key)
+    if rendered is not None:
+        _text_cache.move_to_end(key)
+        return rendered
+    rendered = font.render(text, True, color)
+    _text_cache[key] = rendered
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return rendered
@@ -0,0 +1,23 @@
+"""
+Shared cache of loaded UI images.
+Each (path, size) pair is loaded, converted and scaled once, and every
+component that asks for it afterwards gets the same surface.
+"""
+import pygame
+
+_cache = {}
+
+
+def load_scaled(path, size=None):
+    """
+    Load an image converted to the display format, optionally scaled to size.
+    The returned surface is shared, so callers must not draw onto it.
+    """
+    key = (path, size)
+    image = _cache.get(key)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        _cache[key] = image
+    return image
@@ -0,0 +1,48 @@
+"""
+Shared portrait atlas for the game.
+Every character portrait is loaded, scaled and converted once into a single
+surface; cards and conversation screens blit their portrait from it by source rect.
+"""
+import os
+import pygame
+from src.config import *
+
+PORTRAIT_SIZE = 150
+
+# Built on first use, after the display exists (convert_alpha needs it)
+_atlas = None
+_portrait_rects = {}
+
+
+def _build_atlas():
+    """Pack all available portraits side by side into one display-format surface"""
+    global _atlas
+    portraits = []
+    for name, path in CHARACTER_PORTRAITS.items():
+        if not os.path.exists(path):
+            continue
+        try:
+            image = pygame.image.load(path)
+        except pygame.error:
+            continue
+        portraits.append((name, pygame.transform.scale(image, (PORTRAIT_SIZE, PORTRAIT_SIZE))))
+
+    atlas = pygame.Surface((max(1, PORTRAIT_SIZE * len(portraits)), PORTRAIT_SIZE), pygame.SRCALPHA)
+    for i, (name, image) in enumerate(portraits):
+        atlas.blit(image, (i * PORTRAIT_SIZE, 0))
+        _portrait_rects[name] = pygame.Rect(i * PORTRAIT_SIZE, 0, PORTRAIT_SIZE, PORTRAIT_SIZE)
+
+    _atlas = atlas.convert_alpha() if pygame.display.get_surface() else atlas
+
+
+def get_portrait(name):
+    """
+    Return (atlas_surface, source_rect) for a character's portrait,
+    or None if the portrait isn't available.
+    """
+    if _atlas is None:
+        _build_atlas()
+    rect = _portrait_rects.get(name)
+    if rect is None:
+        return None
+    return _atlas, rect
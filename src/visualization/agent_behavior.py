@@ -6,10 +6,92 @@ and conversation traces with feedback loops
 
 import pygame
 import math
+from collections import deque
+from src.utils.fonts import get_font, render_text
+
+
+# Relationship line colors by relationship type (unknown types are gray)
+_RELATIONSHIP_COLORS = {
+    "Close Friend": (100, 200, 100),
+    "Romantic Partner": (255, 100, 150),
+    "Enemy": (200, 50, 50),
+    "Rival": (150, 100, 200),
+    "Business Partner": (100, 150, 255),
+    "Acquaintance": (150, 150, 150),
+    "Family Member": (200, 150, 100),
+}
+
+# One-letter trait abbreviations used by the personality change indicators
+_TRAIT_ABBREVIATIONS = {"Anxious": "A", "Moody": "M", "Trust": "T"}
+
+# Relationship legend shown in the info panel
+_LEGEND_ITEMS = (
+    ("Friend", (100, 200, 100)),
+    ("Romantic", (255, 100, 150)),
+    ("Enemy", (200, 50, 50)),
+    ("Rival", (150, 100, 200)),
+)
+
+# Most recent messages kept in a node's conversation history
+CONVERSATION_TRACE_LIMIT = 64
+# Most fading trace markers shown at once; the oldest are dropped first
+MAX_CONVERSATION_TRACES = 50
+
+# Trace ring color per trace type; anything else is feedback
+_TRACE_COLORS = {
+    "conversation": (100, 200, 255),
+    "personality_update": (255, 200, 100),
+    "feedback": (100, 255, 200),
+}
+TRACE_SPRITE_SIZE = 10
+# Pre-drawn trace rings keyed by color, faded with surface alpha when blitted
+_trace_sprites = {}
+
+# Arrow head sprites keyed by (color, angle); arrows between the same nodes share one
+ARROW_HEAD_SIZE = 20
+_arrow_heads = {}
+
+# Blink and pulse timers cycle through 60 frames; sin(timer * 0.1) for each of them
+_TIMER_SIN = tuple(math.sin(i * 0.1) for i in range(60))
+
+
+def _personality_color(anxiety, mood, trust):
+    """Node color for a personality mix: anxiety drives red, trust green, calm (low mood) blue"""
+    r = int(100 + anxiety * 20)
+    g = int(100 + trust * 20)
+    b = int(100 + (5 - mood) * 20)
+    return (min(255, r), min(255, g), min(255, b))
+
+
+# Colors for every whole-level personality, keyed by (anxiety, mood, trust)
+_PERSONALITY_COLORS = {
+    (anxiety, mood, trust): _personality_color(anxiety, mood, trust)
+    for anxiety in range(6)
+    for mood in range(6)
+    for trust in range(6)
+}
+
+
+class _TraceEntry:
+    """One message in a node's conversation history"""
+    __slots__ = ('type', 'content', 'timestamp')
+
+    def __init__(self, message_type, content, timestamp):
+        self.type = message_type  # "question", "response", "analysis"
+        self.content = content
+        self.timestamp = timestamp
 
 
 class AgentNode:
     """Represents a suspect as a node in the network"""
+    # Fixed attribute layout: every per-frame attribute read is a slot lookup, not a dict lookup
+    __slots__ = (
+        'name', 'suspect_data', 'position', 'radius', 'color', 'border_color', 'border_width',
+        'is_interacting', 'interaction_timer', 'blink_timer',
+        'anxious', 'moody', 'trust', '_prev_anxious', '_prev_moody', '_prev_trust',
+        'personality_change_timer', 'personality_changes', 'has_personality_change',
+        'conversation_trace', '_trace_count', '_label_text', '_sprites', '_sprite_pos',
+    )
 
     def __init__(self, suspect_name, suspect_data, position):
         self.name = suspect_name
@@ -27,21 +109,34 @@ class AgentNode:
         self.interaction_timer = 0
         self.blink_timer = 0
 
-        # State
-        self.personality_state = {"Anxious": 3, "Moody": 3, "Trust": 3}
-        self.previous_personality = {"Anxious": 3, "Moody": 3, "Trust": 3}
+        # State: current and previous trait levels as plain attributes
+        self.anxious = self.moody = self.trust = 3
+        self._prev_anxious = self._prev_moody = self._prev_trust = 3
 
         # Personality change indicators
         self.personality_change_timer = 0
         self.personality_changes = {}
         self.has_personality_change = False  # Flag for blinking border
 
-        # Conversation trace
-        self.conversation_trace = []  # List of messages in this conversation
+        # Color for the starting personality; update_personality() keeps it in step
+        self._update_color_from_personality()
+
+        # Recent messages in this conversation; older ones fall off the front
+        self.conversation_trace = deque(maxlen=CONVERSATION_TRACE_LIMIT)
+        self._trace_count = 0
+
+        # Name label never changes, so it is baked into the node sprites below
+        self._label_text = suspect_name[:3].upper()
+
+        # Pre-drawn node sprites keyed by look; see _sprite()
+        self._sprites = {}
+        self._sprite_pos = (position[0] - self.radius - 1, position[1] - self.radius - 1)
 
     def update(self):
-        """Update node animation state"""
-        self.blink_timer = (self.blink_timer + 1) % 60
+        """Update node animation state. Returns True while the node is still animating."""
+        # Wrap at 60 with a compare rather than an integer modulo
+        blink_timer = self.blink_timer + 1
+        self.blink_timer = blink_timer if blink_timer < 60 else 0
 
         if self.is_interacting:
             self.interaction_timer -= 1
@@ -56,25 +151,17 @@ class AgentNode:
         else:
             self.has_personality_change = False
 
-        # Update color based on personality
-        self._update_color_from_personality()
+        return self.is_interacting or self.has_personality_change
 
     def _update_color_from_personality(self):
         """Change node color based on personality state"""
-        anxiety = self.personality_state.get("Anxious", 3)
-        mood = self.personality_state.get("Moody", 3)
-        trust = self.personality_state.get("Trust", 3)
-
-        # Calculate color based on personality mix
-        r = int(100 + anxiety * 20)
-        g = int(100 + trust * 20)
-        b = int(100 + (5 - mood) * 20)
-
-        self.color = (
-            min(255, r),
-            min(255, g),
-            min(255, b)
-        )
+        anxiety, mood, trust = self.anxious, self.moody, self.trust
+
+        # Whole levels come from the precomputed table; anything else is mixed directly
+        color = _PERSONALITY_COLORS.get((anxiety, mood, trust))
+        if color is None:
+            color = _personality_color(anxiety, mood, trust)
+        self.color = color
 
     def set_interacting(self, duration=30):
         """Mark this node as currently interacting"""
@@ -85,16 +172,24 @@ class AgentNode:
 
     def update_personality(self, new_personality_state):
         """Update personality and track what changed"""
-        self.previous_personality = self.personality_state.copy()
-        self.personality_state = new_personality_state.copy()
+        prev_anxious, prev_moody, prev_trust = self.anxious, self.moody, self.trust
+        self._prev_anxious, self._prev_moody, self._prev_trust = prev_anxious, prev_moody, prev_trust
+        self.anxious = new_personality_state.get("Anxious", 3)
+        self.moody = new_personality_state.get("Moody", 3)
+        self.trust = new_personality_state.get("Trust", 3)
 
         # Track which traits changed
-        self.personality_changes = {}
-        for trait in ["Anxious", "Moody", "Trust"]:
-            prev = self.previous_personality.get(trait, 3)
-            curr = self.personality_state.get(trait, 3)
-            if prev != curr:
-                self.personality_changes[trait] = curr - prev
+        changes = {}
+        if self.anxious != prev_anxious:
+            changes["Anxious"] = self.anxious - prev_anxious
+        if self.moody != prev_moody:
+            changes["Moody"] = self.moody - prev_moody
+        if self.trust != prev_trust:
+            changes["Trust"] = self.trust - prev_trust
+        self.personality_changes = changes
+
+        # The color only depends on the personality, so it only changes here
+        self._update_color_from_personality()
 
         # Show personality change indicator
         if self.personality_changes:
@@ -103,45 +198,63 @@ class AgentNode:
 
     def add_conversation_trace(self, message_type, content=""):
         """Add a trace to show conversation history"""
-        self.conversation_trace.append({
-            "type": message_type,  # "question", "response", "analysis"
-            "content": content,
-            "timestamp": len(self.conversation_trace)
-        })
-
-    def draw(self, surface):
-        """Draw the node"""
+        self.conversation_trace.append(_TraceEntry(message_type, content, self._trace_count))
+        self._trace_count += 1
+
+    def _sprite(self, blink_on):
+        """
+        The node disc with its borders and name label, drawn once per look and reused.
+        A look is the fill color, the border and whether the change-blink ring is showing.
+        """
+        key = (self.color, self.border_color, self.border_width, blink_on)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = 2 * self.radius + 2
+            center = (self.radius + 1, self.radius + 1)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+
+            # Main circle
+            pygame.draw.circle(sprite, self.color, center, self.radius)
+
+            # Blinking border for personality changes (thick yellow, prominent)
+            if blink_on:
+                pygame.draw.circle(sprite, (255, 255, 0), center, self.radius, 5)
+
+            # Normal border
+            pygame.draw.circle(sprite, self.border_color, center, self.radius, self.border_width)
+
+            # Name label
+            name_text = get_font(None, 14).render(self._label_text, True, (255, 255, 255))
+            sprite.blit(name_text, (center[0] - name_text.get_width() // 2, center[1] - name_text.get_height() // 2))
+
+            self._sprites[key] = sprite
+        return sprite
+
+    def get_blit(self):
+        """(sprite, position) pair for this frame, for batching all nodes into one Surface.blits"""
+        # Blinking effect - cycles every 20 frames: 10 on, 10 off
+        blink_on = self.has_personality_change and (self.blink_timer % 20) < 10
+        return self._sprite(blink_on), self._sprite_pos
+
+    def draw_effects(self, surface):
+        """Draw the animated extras around the node: interaction glow and change indicators"""
         # Draw outer glow if interacting
         if self.is_interacting:
-            glow_radius = self.radius + 8 + (3 * math.sin(self.blink_timer * 0.1))
+            glow_radius = self.radius + 8 + (3 * _TIMER_SIN[self.blink_timer])
             pygame.draw.circle(surface, (255, 255, 100), self.position, int(glow_radius), 2)
 
-        # Draw main circle
-        pygame.draw.circle(surface, self.color, self.position, self.radius)
-
-        # Draw blinking border for personality changes (thick yellow, prominent)
-        if self.has_personality_change:
-            # Blinking effect - cycles every 20 frames: 10 on, 10 off
-            if (self.blink_timer % 20) < 10:  # Visible for 10 frames, invisible for 10 frames
-                pygame.draw.circle(surface, (255, 255, 0), self.position, self.radius, 5)  # Thick yellow blink
-
-        # Draw normal border
-        pygame.draw.circle(surface, self.border_color, self.position, self.radius, self.border_width)
-
         # Draw personality change indicators
         if self.personality_change_timer > 0:
             self._draw_personality_indicators(surface)
 
-        # Draw name label
-        font = pygame.font.Font(None, 14)
-        name_text = font.render(self.name[:3].upper(), True, (255, 255, 255))
-        name_x = self.position[0] - name_text.get_width() // 2
-        name_y = self.position[1] - name_text.get_height() // 2
-        surface.blit(name_text, (name_x, name_y))
+    def draw(self, surface):
+        """Draw the node"""
+        self.draw_effects(surface)
+        surface.blit(*self.get_blit())
 
     def _draw_personality_indicators(self, surface):
         """Draw small indicators showing personality changes"""
-        font = pygame.font.Font(None, 10)
+        font = get_font(None, 10)
         y_offset = -45
         for trait, change in self.personality_changes.items():
             if change > 0:
@@ -151,23 +264,35 @@ class AgentNode:
                 color = (255, 0, 0)
                 symbol = "↓"
 
-            abbr = {"Anxious": "A", "Moody": "M", "Trust": "T"}.get(trait, "?")
+            abbr = _TRAIT_ABBREVIATIONS.get(trait, "?")
             text = f"{abbr}{symbol}"
 
-            indicator_text = font.render(text, True, color)
+            indicator_text = render_text(font, text, color)
             surface.blit(indicator_text, (self.position[0] - 8, self.position[1] + y_offset))
             y_offset += 10
 
     def get_personality_string(self):
         """Get personality state as string"""
-        anxiety = self.personality_state.get("Anxious", 3)
-        mood = self.personality_state.get("Moody", 3)
-        trust = self.personality_state.get("Trust", 3)
-        return f"A:{anxiety} M:{mood} T:{trust}"
+        return f"A:{self.anxious} M:{self.moody} T:{self.trust}"
+
+    @property
+    def personality_state(self):
+        """Current trait levels as a trait -> level dict"""
+        return {"Anxious": self.anxious, "Moody": self.moody, "Trust": self.trust}
+
+    @property
+    def previous_personality(self):
+        """Trait levels before the last update_personality, as a trait -> level dict"""
+        return {"Anxious": self._prev_anxious, "Moody": self._prev_moody, "Trust": self._prev_trust}
 
 
 class RelationshipConnection:
     """Represents a relationship between two suspects"""
+    __slots__ = (
+        'from_node', 'to_node', 'relationship_type', 'color', '_glow_lines',
+        'is_active', 'active_timer', 'thickness',
+        'info_flow_active', 'info_flow_timer', 'info_flow_progress',
+    )
 
     def __init__(self, from_node, to_node, relationship_type):
         self.from_node = from_node
@@ -175,6 +300,12 @@ class RelationshipConnection:
         self.relationship_type = relationship_type
 
         self.color = self._get_color_from_type()
+        # (shade, width) pairs drawn while active: thickness is always 3 then, and each
+        # shade is 20% darker and 1px thinner than the last (the color never changes)
+        self._glow_lines = tuple(
+            ((int(self.color[0] * f), int(self.color[1] * f), int(self.color[2] * f)), width)
+            for f, width in ((1.0, 3), (0.8, 2), (0.6, 1))
+        )
         self.is_active = False
         self.active_timer = 0
         self.thickness = 1
@@ -185,16 +316,7 @@ class RelationshipConnection:
 
     def _get_color_from_type(self):
         """Get color based on relationship type"""
-        color_map = {
-            "Close Friend": (100, 200, 100),
-            "Romantic Partner": (255, 100, 150),
-            "Enemy": (200, 50, 50),
-            "Rival": (150, 100, 200),
-            "Business Partner": (100, 150, 255),
-            "Acquaintance": (150, 150, 150),
-            "Family Member": (200, 150, 100),
-        }
-        return color_map.get(self.relationship_type, (150, 150, 150))
+        return _RELATIONSHIP_COLORS.get(self.relationship_type, (150, 150, 150))
 
     def set_active(self, duration=30):
         """Highlight this connection as active"""
@@ -208,7 +330,7 @@ class RelationshipConnection:
         self.info_flow_timer = duration
 
     def update(self):
-        """Update connection animation"""
+        """Update connection animation. Returns True while the connection is still animating."""
         if self.is_active:
             self.active_timer -= 1
             if self.active_timer <= 0:
@@ -221,12 +343,12 @@ class RelationshipConnection:
             if self.info_flow_timer <= 0:
                 self.info_flow_active = False
 
+        return self.is_active or self.info_flow_active
+
     def draw(self, surface):
         """Draw the connection line"""
         if self.is_active:
-            for i in range(3):
-                glow_color = tuple(int(c * (1 - i * 0.2)) for c in self.color)
-                glow_thickness = max(1, self.thickness - i)
+            for glow_color, glow_thickness in self._glow_lines:
                 pygame.draw.line(
                     surface,
                     glow_color,
@@ -275,7 +397,8 @@ class OrchestratorNode:
 
     def update(self):
         """Update orchestrator animation"""
-        self.pulse_timer = (self.pulse_timer + 1) % 60
+        pulse_timer = self.pulse_timer + 1
+        self.pulse_timer = pulse_timer if pulse_timer < 60 else 0
         if self.is_active:
             self.active_timer -= 1
             if self.active_timer <= 0:
@@ -288,7 +411,7 @@ class OrchestratorNode:
 
     def draw(self, surface):
         """Draw the orchestrator node"""
-        pulse_radius = self.radius + 5 * math.sin(self.pulse_timer * 0.1)
+        pulse_radius = self.radius + 5 * _TIMER_SIN[self.pulse_timer]
 
         if self.is_active:
             pygame.draw.circle(surface, (200, 100, 255), self.position, int(pulse_radius), 2)
@@ -296,8 +419,8 @@ class OrchestratorNode:
         pygame.draw.circle(surface, self.color, self.position, self.radius)
         pygame.draw.circle(surface, self.border_color, self.position, self.radius, self.border_width)
 
-        font = pygame.font.Font(None, 12)
-        label_text = font.render("ORCHESTRATOR", True, (255, 255, 255))
+        font = get_font(None, 12)
+        label_text = render_text(font, "ORCHESTRATOR", (255, 255, 255))
         label_x = self.position[0] - label_text.get_width() // 2
         label_y = self.position[1] - label_text.get_height() // 2
         surface.blit(label_text, (label_x, label_y + 5))
@@ -313,7 +436,17 @@ class ArrowConnection:
         self.is_active = False
         self.active_timer = 0
         self.active_timer_duration = 0
-        self.progress = 0
+        self.frames_elapsed = 0
+        # Tip movement per frame, worked out once per activation
+        self._step_dx = 0
+        self._step_dy = 0
+
+        # Nodes never move once placed, so the direction and arrow-head wings are fixed
+        self._start = from_node.position
+        end_x, end_y = to_node.position
+        self._dx = end_x - self._start[0]
+        self._dy = end_y - self._start[1]
+        self._angle = math.atan2(self._dy, self._dx)
 
         # Colors based on type
         if arrow_type == "briefing":
@@ -323,17 +456,44 @@ class ArrowConnection:
         else:  # communication
             self.color = (100, 200, 100)  # Green: agent -> agent
 
+        # Pre-drawn arrow head with its tip at the sprite centre
+        self._head = None
+
+    def _head_sprite(self):
+        """Arrow head for this color and direction, drawn once and shared by identical arrows"""
+        key = (self.color, self._angle)
+        head = _arrow_heads.get(key)
+        if head is None:
+            angle = self._angle
+            arrow_size = 8
+            center = ARROW_HEAD_SIZE // 2
+            wing1 = (
+                center - arrow_size * math.cos(angle - math.pi / 6),
+                center - arrow_size * math.sin(angle - math.pi / 6),
+            )
+            wing2 = (
+                center - arrow_size * math.cos(angle + math.pi / 6),
+                center - arrow_size * math.sin(angle + math.pi / 6),
+            )
+            head = pygame.Surface((ARROW_HEAD_SIZE, ARROW_HEAD_SIZE), pygame.SRCALPHA)
+            pygame.draw.polygon(head, self.color, [(center, center), wing1, wing2])
+            _arrow_heads[key] = head
+        return head
+
     def set_active(self, duration=180):
         """Activate the arrow (duration in frames, default 180 = 3 seconds at 60 FPS)"""
         self.is_active = True
         self.active_timer = duration
         self.active_timer_duration = duration
+        self.frames_elapsed = 0
+        self._step_dx = self._dx / duration
+        self._step_dy = self._dy / duration
 
     def update(self):
         """Update arrow animation"""
         if self.is_active:
             self.active_timer -= 1
-            self.progress = (self.active_timer_duration - self.active_timer) / self.active_timer_duration
+            self.frames_elapsed += 1
             if self.active_timer <= 0:
                 self.is_active = False
 
@@ -342,31 +502,22 @@ class ArrowConnection:
         if not self.is_active:
             return
 
-        start_x, start_y = self.from_node.position
-        end_x, end_y = self.to_node.position
+        start = self._start
+        start_x, start_y = start
 
         # Calculate arrow position
-        arrow_x = start_x + (end_x - start_x) * self.progress
-        arrow_y = start_y + (end_y - start_y) * self.progress
+        frames_elapsed = self.frames_elapsed
+        arrow_x = start_x + self._step_dx * frames_elapsed
+        arrow_y = start_y + self._step_dy * frames_elapsed
 
         # Draw line
-        pygame.draw.line(surface, self.color, (start_x, start_y), (arrow_x, arrow_y), 2)
-
-        # Draw arrow head
-        angle = math.atan2(end_y - start_y, end_x - start_x)
-        arrow_size = 8
+        pygame.draw.line(surface, self.color, start, (arrow_x, arrow_y), 2)
 
-        # Arrow tip
-        tip_x, tip_y = int(arrow_x), int(arrow_y)
-
-        # Arrow wings
-        wing1_x = int(arrow_x - arrow_size * math.cos(angle - math.pi / 6))
-        wing1_y = int(arrow_y - arrow_size * math.sin(angle - math.pi / 6))
-        wing2_x = int(arrow_x - arrow_size * math.cos(angle + math.pi / 6))
-        wing2_y = int(arrow_y - arrow_size * math.sin(angle + math.pi / 6))
-
-        # Draw arrow head
-        pygame.draw.polygon(surface, self.color, [(tip_x, tip_y), (wing1_x, wing1_y), (wing2_x, wing2_y)])
+        # Draw arrow head, its sprite centred on the arrow tip
+        if self._head is None:
+            self._head = self._head_sprite()
+        half = ARROW_HEAD_SIZE // 2
+        surface.blit(self._head, (int(arrow_x) - half, int(arrow_y) - half))
 
 
 class OrchestratorConnection:
@@ -378,45 +529,68 @@ class OrchestratorConnection:
         self.is_active = False
         self.active_timer = 0
 
+        # Dashed line points, recomputed only if the endpoints move
+        self._dash_endpoints = None
+        self._dash_segments = []
+
     def set_active(self, duration=30):
         """Highlight this connection"""
         self.is_active = True
         self.active_timer = duration
 
     def update(self):
-        """Update animation"""
+        """Update animation. Returns True while the connection is still highlighted."""
         if self.is_active:
             self.active_timer -= 1
             if self.active_timer <= 0:
                 self.is_active = False
+        return self.is_active
 
     def draw(self, surface):
         """Draw dashed line to show orchestrator guidance"""
         if not self.is_active:
             return
 
-        start_x, start_y = self.from_node.position
-        end_x, end_y = self.to_node.position
+        # Dash endpoints only depend on the node positions, so they're worked out once
+        endpoints = (self.from_node.position, self.to_node.position)
+        if endpoints != self._dash_endpoints:
+            self._dash_endpoints = endpoints
+            self._dash_segments = self._compute_dash_segments(*endpoints)
+
+        draw_line = pygame.draw.line
+        for p1, p2 in self._dash_segments:
+            draw_line(surface, (200, 100, 255), p1, p2, 2)
+
+    def _compute_dash_segments(self, start, end):
+        """Integer (start, end) points of each dash along the line from start to end"""
+        start_x, start_y = start
+        end_x, end_y = end
 
         dash_length = 5
         gap_length = 5
-        distance = math.sqrt((end_x - start_x) ** 2 + (end_y - start_y) ** 2)
+        distance = math.hypot(end_x - start_x, end_y - start_y)
         num_dashes = int(distance / (dash_length + gap_length))
+        if not num_dashes:
+            return []
 
-        for i in range(num_dashes):
-            progress = (dash_length + gap_length) * i / distance
-            next_progress = progress + dash_length / distance
-
-            p1_x = start_x + (end_x - start_x) * progress
-            p1_y = start_y + (end_y - start_y) * progress
-            p2_x = start_x + (end_x - start_x) * next_progress
-            p2_y = start_y + (end_y - start_y) * next_progress
+        # Per-pixel direction along the line; each dash is an offset along it
+        unit_x = (end_x - start_x) / distance
+        unit_y = (end_y - start_y) / distance
+        dash_x = unit_x * dash_length
+        dash_y = unit_y * dash_length
 
-            pygame.draw.line(surface, (200, 100, 255), (int(p1_x), int(p1_y)), (int(p2_x), int(p2_y)), 2)
+        segments = []
+        for i in range(num_dashes):
+            offset = (dash_length + gap_length) * i
+            p1_x = start_x + unit_x * offset
+            p1_y = start_y + unit_y * offset
+            segments.append(((int(p1_x), int(p1_y)), (int(p1_x + dash_x), int(p1_y + dash_y))))
+        return segments
 
 
 class ConversationTrace:
     """Visual trace showing conversation flow and updates"""
+    __slots__ = ('suspect_node', 'trace_type', 'lifetime', 'age')
 
     def __init__(self, suspect_node, trace_type="conversation"):
         self.suspect_node = suspect_node
@@ -429,27 +603,27 @@ class ConversationTrace:
         self.age += 1
         return self.age < self.lifetime
 
+    def _sprite(self):
+        """Ring sprite for this trace's color, drawn once and shared by every trace of that type"""
+        color = _TRACE_COLORS.get(self.trace_type, _TRACE_COLORS["feedback"])
+        sprite = _trace_sprites.get(color)
+        if sprite is None:
+            center = TRACE_SPRITE_SIZE // 2
+            sprite = pygame.Surface((TRACE_SPRITE_SIZE, TRACE_SPRITE_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (center, center), 4, 1)
+            _trace_sprites[color] = sprite
+        return sprite
+
     def draw(self, surface, y_offset):
         """Draw trace indicator above node"""
-        # Fade out as it gets older
-        alpha_progress = 1.0 - (self.age / self.lifetime)
-
-        # Color based on type
-        if self.trace_type == "conversation":
-            color = (100, 200, 255)
-        elif self.trace_type == "personality_update":
-            color = (255, 200, 100)
-        else:  # feedback
-            color = (100, 255, 200)
-
-        # Draw trace circle
-        radius = 4
         trace_x = self.suspect_node.position[0]
         trace_y = self.suspect_node.position[1] - self.suspect_node.radius - 20 - y_offset
 
-        # Fading circle
-        faded_color = tuple(int(c * alpha_progress) for c in color)
-        pygame.draw.circle(surface, faded_color, (trace_x, trace_y), radius, 1)
+        # Fade out as it gets older: the blitter applies the surface alpha
+        sprite = self._sprite()
+        sprite.set_alpha(int(255 * (1.0 - self.age / self.lifetime)))
+        half = TRACE_SPRITE_SIZE // 2
+        surface.blit(sprite, (trace_x - half, trace_y - half))
 
 
 class AgentBehaviorVisualizer:
@@ -472,6 +646,15 @@ class AgentBehaviorVisualizer:
         self.feedback_arrows = []
         self.conversation_traces = []
 
+        # Objects with an animation running; idle ones are skipped by update()
+        self._active_nodes = set()
+        self._active_connections = set()
+        self._active_orchestrator_connections = set()
+
+        # Static panel surfaces, drawn on first use (they need fonts and the display)
+        self._frame_surface = None
+        self._info_panel_surface = None
+
         self._initialize_nodes()
         self._initialize_connections(relationships)
         self._initialize_orchestrator()
@@ -487,8 +670,9 @@ class AgentBehaviorVisualizer:
         center_y = self.start_y + self.height // 2 + 20
         radius = min(self.width, self.height) // 3.5
 
+        angle_step = (2 * math.pi) / num_suspects if num_suspects else 0
         for i, suspect_name in enumerate(suspect_names):
-            angle = (2 * math.pi * i) / num_suspects
+            angle = angle_step * i
             x = int(center_x + radius * math.cos(angle))
             y = int(center_y + radius * math.sin(angle))
 
@@ -527,17 +711,25 @@ class AgentBehaviorVisualizer:
                     )
                     self.connections.append(connection)
 
+    def _add_trace(self, node, trace_type):
+        """Show a fading trace marker above a node, dropping the oldest beyond the cap"""
+        self.conversation_traces.append(ConversationTrace(node, trace_type))
+        if len(self.conversation_traces) > MAX_CONVERSATION_TRACES:
+            del self.conversation_traces[0]
+
     def send_interaction(self, suspect_name, duration=60):
         """Notify of suspect interaction"""
         if suspect_name in self.nodes:
             self.nodes[suspect_name].set_interacting(duration)
-            self.conversation_traces.append(ConversationTrace(self.nodes[suspect_name], "conversation"))
+            self._active_nodes.add(self.nodes[suspect_name])
+            self._add_trace(self.nodes[suspect_name], "conversation")
 
     def send_personality_update(self, suspect_name, personality_state):
         """Update personality and show trace"""
         if suspect_name in self.nodes:
             self.nodes[suspect_name].update_personality(personality_state)
-            self.conversation_traces.append(ConversationTrace(self.nodes[suspect_name], "personality_update"))
+            self._active_nodes.add(self.nodes[suspect_name])
+            self._add_trace(self.nodes[suspect_name], "personality_update")
 
     def send_orchestrator_briefing(self, suspect_name, duration=180):
         """Show orchestrator sending briefing to suspect (default 180 frames = 3 seconds)"""
@@ -552,6 +744,7 @@ class AgentBehaviorVisualizer:
         for conn in self.orchestrator_connections:
             if conn.to_node.name == suspect_name:
                 conn.set_active(duration)
+                self._active_orchestrator_connections.add(conn)
 
     def send_feedback_to_orchestrator(self, suspect_name, duration=180):
         """Show feedback from suspect to orchestrator (default 180 frames = 3 seconds)"""
@@ -562,7 +755,7 @@ class AgentBehaviorVisualizer:
             arrow = ArrowConnection(self.nodes[suspect_name], self.orchestrator, "feedback")
             arrow.set_active(duration)
             self.feedback_arrows.append(arrow)
-            self.conversation_traces.append(ConversationTrace(self.nodes[suspect_name], "feedback"))
+            self._add_trace(self.nodes[suspect_name], "feedback")
 
     def send_agent_communication(self, from_suspect, to_suspect, duration=120):
         """Show communication between two agents (different color from orchestrator arrows)"""
@@ -578,6 +771,7 @@ class AgentBehaviorVisualizer:
             if ((conn.from_node.name == suspect1 and conn.to_node.name == suspect2) or
                 (conn.from_node.name == suspect2 and conn.to_node.name == suspect1)):
                 conn.set_active(duration)
+                self._active_connections.add(conn)
 
     def send_info_flow(self, suspect1, suspect2, duration=60):
         """Animate information flowing between suspects"""
@@ -585,45 +779,47 @@ class AgentBehaviorVisualizer:
             if ((conn.from_node.name == suspect1 and conn.to_node.name == suspect2) or
                 (conn.from_node.name == suspect2 and conn.to_node.name == suspect1)):
                 conn.set_info_flow(duration)
+                self._active_connections.add(conn)
 
     def update(self):
-        """Update all nodes and connections"""
-        for node in self.nodes.values():
-            node.update()
-
-        for connection in self.connections:
-            connection.update()
+        """Update animating nodes and connections; idle ones have nothing to advance"""
+        # Iterate over snapshots: finished objects are dropped from their set as we go
+        active_nodes = self._active_nodes
+        for node in list(active_nodes):
+            if not node.update():
+                active_nodes.discard(node)
+
+        active_connections = self._active_connections
+        for connection in list(active_connections):
+            if not connection.update():
+                active_connections.discard(connection)
 
         if self.orchestrator:
             self.orchestrator.update()
 
-        for conn in self.orchestrator_connections:
-            conn.update()
+        active_orchestrator_connections = self._active_orchestrator_connections
+        for conn in list(active_orchestrator_connections):
+            if not conn.update():
+                active_orchestrator_connections.discard(conn)
 
-        # Update arrows
-        for arrow in self.briefing_arrows[:]:
+        # Update arrows, keeping only those still active (one pass, no list.remove)
+        for arrow in self.briefing_arrows:
             arrow.update()
-            if not arrow.is_active:
-                self.briefing_arrows.remove(arrow)
+        self.briefing_arrows = [arrow for arrow in self.briefing_arrows if arrow.is_active]
 
-        for arrow in self.feedback_arrows[:]:
+        for arrow in self.feedback_arrows:
             arrow.update()
-            if not arrow.is_active:
-                self.feedback_arrows.remove(arrow)
+        self.feedback_arrows = [arrow for arrow in self.feedback_arrows if arrow.is_active]
 
         # Update traces
-        for trace in self.conversation_traces[:]:
-            if not trace.update():
-                self.conversation_traces.remove(trace)
+        self.conversation_traces = [trace for trace in self.conversation_traces if trace.update()]
 
     def draw(self, surface):
         """Draw the visualization"""
-        pygame.draw.rect(surface, (30, 30, 40), (self.start_x, self.start_y, self.width, self.height))
-        pygame.draw.rect(surface, (100, 100, 120), (self.start_x, self.start_y, self.width, self.height), 2)
-
-        title_font = pygame.font.Font(None, 16)
-        title_text = title_font.render("AGENT NETWORK", True, (200, 200, 200))
-        surface.blit(title_text, (self.start_x + 10, self.start_y + 5))
+        # Panel background, border and title never change, so they're one pre-drawn surface
+        if self._frame_surface is None:
+            self._frame_surface = self._build_frame_surface()
+        surface.blit(self._frame_surface, (self.start_x, self.start_y))
 
         # Draw orchestrator connections
         for conn in self.orchestrator_connections:
@@ -645,9 +841,11 @@ class AgentBehaviorVisualizer:
         for arrow in self.feedback_arrows:
             arrow.draw(surface)
 
-        # Draw nodes
-        for node in self.nodes.values():
-            node.draw(surface)
+        # Draw nodes: every pre-drawn disc in one batch, then the per-node animated extras
+        nodes = self.nodes.values()
+        surface.blits([node.get_blit() for node in nodes], doreturn=False)
+        for node in nodes:
+            node.draw_effects(surface)
 
         # Draw conversation traces above nodes
         trace_offset = 0
@@ -657,38 +855,47 @@ class AgentBehaviorVisualizer:
 
         self._draw_info_panel(surface)
 
-    def _draw_info_panel(self, surface):
-        """Draw information panel"""
-        info_y = self.start_y + self.height - 120
-        info_x = self.start_x + 10
+    def _build_frame_surface(self):
+        """Pre-draw the panel background, border and title"""
+        frame = pygame.Surface((self.width, self.height))
+        frame.fill((30, 30, 40))
+        pygame.draw.rect(frame, (100, 100, 120), frame.get_rect(), 2)
+
+        title_text = get_font(None, 16).render("AGENT NETWORK", True, (200, 200, 200))
+        frame.blit(title_text, (10, 5))
+        return frame.convert()
 
-        font_small = pygame.font.Font(None, 12)
-        font_large = pygame.font.Font(None, 14)
+    def _build_info_panel(self):
+        """Pre-draw the static legend and help text shown at the bottom of the panel"""
+        panel = pygame.Surface((self.width - 10, 120), pygame.SRCALPHA)
+
+        font_small = get_font(None, 12)
+        font_large = get_font(None, 14)
 
         label_text = font_large.render("Personality: A(nxious) M(oody) T(rust) | Blinking = Change", True, (200, 200, 200))
-        surface.blit(label_text, (info_x, info_y))
-
-        legend_y = info_y + 18
-        legend_items = [
-            ("Friend", (100, 200, 100)),
-            ("Romantic", (255, 100, 150)),
-            ("Enemy", (200, 50, 50)),
-            ("Rival", (150, 100, 200)),
-        ]
+        panel.blit(label_text, (0, 0))
 
-        for i, (label, color) in enumerate(legend_items):
-            x = info_x + (i % 2) * 110
+        legend_y = 18
+        for i, (label, color) in enumerate(_LEGEND_ITEMS):
+            x = (i % 2) * 110
             y = legend_y + (i // 2) * 16
 
-            pygame.draw.line(surface, color, (x, y + 5), (x + 12, y + 5), 3)
+            pygame.draw.line(panel, color, (x, y + 5), (x + 12, y + 5), 3)
             label_text = font_small.render(label, True, (200, 200, 200))
-            surface.blit(label_text, (x + 16, y))
+            panel.blit(label_text, (x + 16, y))
 
         info_text = font_large.render("Purple arrow: Briefing → agents", True, (200, 100, 255))
-        surface.blit(info_text, (info_x, legend_y + 38))
+        panel.blit(info_text, (0, legend_y + 38))
 
         info_text2 = font_large.render("Cyan arrow: Feedback → orchestrator", True, (100, 255, 200))
-        surface.blit(info_text2, (info_x, legend_y + 54))
+        panel.blit(info_text2, (0, legend_y + 54))
 
         info_text3 = font_large.render("Green arrow: Agent → Agent (gossip)", True, (100, 200, 100))
-        surface.blit(info_text3, (info_x, legend_y + 70))
+        panel.blit(info_text3, (0, legend_y + 70))
+        return panel.convert_alpha()
+
+    def _draw_info_panel(self, surface):
+        """Draw information panel"""
+        if self._info_panel_surface is None:
+            self._info_panel_surface = self._build_info_panel()
+        surface.blit(self._info_panel_surface, (self.start_x + 10, self.start_y + self.height - 120))